@@ -0,0 +1,221 @@
+"""
+Benchmarks of czech_workdays_holidays public functions, no network access needed.
+
+Every case is timed warm (years already cached) and cold (cache cleared before each call) for a single year and
+for a 2001 - 2100 sweep. Results are reported as operations per second together with memory allocations
+and compared against a stored baseline, the run fails when a case is slower than the baseline by more than
+the threshold.
+
+Cases cover the core functions, year construction from the precomputed table (and computed years outside it),
+views, CompanyCalendar, monthly workday positions, working time fund and leave windows. A new hot path should get
+its case here and its baseline entry (--update-baseline --filter <case>) together with the change.
+
+Usage:
+    python benchmarks/benchmark.py                   # compare with benchmarks/baseline.json
+    python benchmarks/benchmark.py --update-baseline # store current results as the baseline (of filtered cases)
+    python benchmarks/benchmark.py --filter workdays # run only cases containing "workdays"
+"""
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+import warnings
+from datetime import date
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import czech_workdays_holidays as cwh  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+YEAR = 2023
+SWEEP = range(2001, 2101)
+DAY = date(2023, 5, 2)
+
+
+def _company_calendar():
+    # Calendar is built by each call, so its overlays and per-year indexes are timed as well
+    calendar = cwh.CompanyCalendar()
+    calendar.add_closure(date(YEAR, 12, 27), date(YEAR, 12, 29))
+    calendar.add_working_day(date(YEAR, 12, 23))
+    return calendar
+
+
+def _sweep(function, **kwargs):
+    def run():
+        for year in SWEEP:
+            function(year, **kwargs)
+    return run
+
+
+CASES = {
+    "get_holidays": lambda: cwh.get_holidays(YEAR),
+    "get_holidays[dates_only]": lambda: cwh.get_holidays(YEAR, dates_only=True),
+    "get_holidays[dates_and_cz_names]": lambda: cwh.get_holidays(YEAR, dates_and_cz_names=True),
+    "get_holidays[dates_and_en_names]": lambda: cwh.get_holidays(YEAR, dates_and_en_names=True),
+    "get_holidays[shopping_restricted]": lambda: cwh.get_holidays(YEAR, shopping_restricted=True),
+    "get_holidays[2001-2100]": _sweep(cwh.get_holidays),
+    "get_holiday_records": lambda: cwh.get_holiday_records(YEAR),
+    "get_workdays": lambda: cwh.get_workdays(YEAR),
+    "get_workdays[include_saturday]": lambda: cwh.get_workdays(YEAR, include_saturday=True),
+    "get_workdays[include_sunday]": lambda: cwh.get_workdays(YEAR, include_sunday=True),
+    "get_workdays[include_holidays]": lambda: cwh.get_workdays(YEAR, include_holidays=True),
+    "get_workdays[2001-2100]": _sweep(cwh.get_workdays),
+    "get_shopping_days": lambda: cwh.get_shopping_days(YEAR),
+    "get_shopping_days[include_sunday=False]": lambda: cwh.get_shopping_days(YEAR, include_sunday=False),
+    "get_shopping_days[exclude_shopping_restricted_days=False]":
+        lambda: cwh.get_shopping_days(YEAR, exclude_shopping_restricted_days=False),
+    "get_shopping_days[2017-2100]": lambda: [cwh.get_shopping_days(year) for year in range(2017, 2101)],
+    "get_holidays_during_weekend": lambda: cwh.get_holidays_during_weekend(YEAR),
+    "get_holidays_during_weekend[2001-2100]": _sweep(cwh.get_holidays_during_weekend),
+    "get_workdays_during_weekend": lambda: cwh.get_workdays_during_weekend(YEAR),
+    "get_workdays_during_weekend[include_holidays]":
+        lambda: cwh.get_workdays_during_weekend(YEAR, include_holidays=True),
+    "get_workdays_during_weekend[2001-2100]": _sweep(cwh.get_workdays_during_weekend),
+    "is_workday": lambda: cwh.is_workday(DAY),
+    "is_holiday": lambda: cwh.is_holiday(DAY),
+    "is_shopping_day": lambda: cwh.is_shopping_day(DAY),
+    "count_workdays": lambda: cwh.count_workdays(date(YEAR, 1, 1), date(YEAR, 12, 31)),
+    "count_workdays[2001-2100]": lambda: cwh.count_workdays(date(2001, 1, 1), date(2100, 12, 31)),
+    "add_workdays": lambda: cwh.add_workdays(DAY, 10),
+    "add_workdays[-10]": lambda: cwh.add_workdays(DAY, -10),
+    "add_workdays[20000]": lambda: cwh.add_workdays(date(2001, 1, 1), 20000),
+    "next_workday": lambda: cwh.next_workday(DAY),
+    "previous_workday": lambda: cwh.previous_workday(DAY),
+    "iter_workdays": lambda: list(cwh.iter_workdays(date(YEAR, 1, 1), date(YEAR, 12, 31))),
+    "iter_workdays[2001-2100]": lambda: list(cwh.iter_workdays(date(2001, 1, 1), date(2100, 12, 31))),
+    "iter_shopping_days[2001-2100]": lambda: list(cwh.iter_shopping_days(date(2001, 1, 1), date(2100, 12, 31))),
+    "iter_holidays[2001-2100]": lambda: list(cwh.iter_holidays(date(2001, 1, 1), date(2100, 12, 31))),
+    "_YearCalendar[table]": lambda: cwh._YearCalendar(YEAR),
+    "_YearCalendar[computed]": lambda: cwh._YearCalendar(2300),
+    "get_workday_view": lambda: len(cwh.get_workday_view(YEAR)),
+    "get_workday_view[2001-2100]": lambda: cwh.get_workday_view(2001, 2100).on_or_after(DAY, 1000),
+    "get_holiday_view[slice]": lambda: list(cwh.get_holiday_view(2001, 2100)[date(2050, 1, 1):date(2060, 12, 31)]),
+    "CompanyCalendar.count_workdays": lambda: _company_calendar().count_workdays(date(YEAR, 1, 1),
+                                                                                 date(YEAR, 12, 31)),
+    "CompanyCalendar.add_workdays": lambda: _company_calendar().add_workdays(DAY, 200),
+    "nth_workday": lambda: cwh.nth_workday(YEAR, 5, 3),
+    "workday_of_month": lambda: cwh.workday_of_month(DAY),
+    "get_nth_workdays[2001-2100]": lambda: cwh.get_nth_workdays(2001, 2100, -1),
+    "get_working_time_fund[2001-2100]": lambda: cwh.get_working_time_fund(2001, 2100),
+    "find_leave_windows[2001-2100]": lambda: cwh.find_leave_windows(2001, 2100, 3),
+}
+
+
+def _calibrate() -> float:
+    """Operations per second of a fixed pure Python workload, used to normalize results between machines."""
+    def workload():
+        total = 0
+        for number in range(1000):
+            total += number * number % 7
+        return total
+    return _ops_per_second(workload, cold=False)
+
+
+def _ops_per_second(function, cold: bool, rounds: int = 5, round_time: float = 0.05) -> float:
+    """Best operations per second out of several rounds, the best round is the least disturbed by other load."""
+    best = 0.0
+    for _ in range(rounds):
+        calls = 0
+        elapsed = 0.0
+        while elapsed < round_time:
+            if cold:
+                cwh.cache_clear()
+            start = perf_counter()
+            function()
+            elapsed += perf_counter() - start
+            calls += 1
+        best = max(best, calls / elapsed)
+    return best
+
+
+def _allocations(function) -> dict:
+    # Memory used by tracemalloc itself is not counted
+    ignored = [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot().filter_traces(ignored)
+    result = function()
+    current, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot().filter_traces(ignored)
+    tracemalloc.stop()
+    del result
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return {"blocks": blocks, "peak_kib": round(peak / 1024, 1)}
+
+
+def run(names: list) -> dict:
+    calibration = _calibrate()
+    results = {}
+    for name in names:
+        function = CASES[name]
+        for mode in ("warm", "cold"):
+            cwh.cache_clear()
+            if mode == "warm":
+                function()
+            ops = _ops_per_second(function, cold=mode == "cold")
+            if mode == "cold":
+                cwh.cache_clear()
+            allocations = _allocations(function)
+            results[f"{name}:{mode}"] = {"ops_per_second": round(ops, 1),
+                                         "score": float(f"{ops / calibration:.6g}"),
+                                         **allocations}
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+    for case, result in results.items():
+        if case not in baseline:
+            continue
+        ratio = baseline[case]["score"] / result["score"]
+        result["slowdown"] = round(ratio, 2)
+        if ratio > threshold:
+            regressions.append(case)
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="path of the baseline JSON file")
+    parser.add_argument("--update-baseline", action="store_true", help="store results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=2.5,
+                        help="fail when a case is this many times slower than the baseline (default 2.5)")
+    parser.add_argument("--filter", default="", help="run only cases whose name contains this text")
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if args.filter in name]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        results = run(names)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+
+    if args.update_baseline:
+        # Cases left out by --filter keep their stored results
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(baseline, baseline_file, indent=2, sort_keys=True)
+            baseline_file.write("\n")
+    regressions = compare(results, baseline, args.threshold)
+
+    print(f"{'case':<66} {'ops/sec':>12} {'blocks':>8} {'peak KiB':>9} {'slowdown':>9}")
+    for case, result in results.items():
+        print(f"{case:<66} {result['ops_per_second']:>12.1f} {result['blocks']:>8} {result['peak_kib']:>9} "
+              f"{result.get('slowdown', ''):>9}")
+
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than baseline by more than {args.threshold}x:")
+        for case in regressions:
+            print(f"  {case}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
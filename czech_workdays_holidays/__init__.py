@@ -0,0 +1,1151 @@
+import os
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict, namedtuple
+from datetime import timedelta, date
+from itertools import accumulate, compress
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+# Annotations using typing are strings, its names are needed only by type checkers
+if TYPE_CHECKING:
+    from typing import Iterator, Optional
+
+
+class UnsupportedYearError(Exception):
+    """Raised for dates before 2001, holidays are not defined for them."""
+
+
+class Holiday(namedtuple("Holiday", ("holiday_name_cz", "holiday_name_en", "date", "fixed", "public_other",
+                                     "valid_from", "shopping_restricted", "description_en", "description_cz"))):
+    """
+    Holiday of a given year. Fields are the same as keys of dictionaries returned by get_holidays().
+    """
+
+    __slots__ = ()
+
+
+# Fixed holidays have month and day, movable holidays have easter_offset in days from Easter Sunday,
+# valid_to is None for holidays that are still valid
+_HolidayRule = namedtuple("_HolidayRule", ("holiday_name_cz", "holiday_name_en", "month", "day", "easter_offset",
+                                           "public_other", "valid_from", "valid_to", "shopping_restricted"))
+
+
+# Shopping restriction came into effect 01/10/2016 (Zákon č. 223/2016 Sb.)
+_SHOPPING_RESTRICTION_START = date(2016, 10, 1)
+
+# Days when shops are closed only from a minute of the day (Zákon č. 223/2016 Sb.), as (month, day, minute)
+_PARTIAL_SHOPPING_RESTRICTIONS = (
+    (12, 24, 12 * 60),
+)
+
+# Holidays according to Zákon č. 245/2000 Sb., in order of get_holidays() output
+_HOLIDAY_RULES = (
+    _HolidayRule("Den obnovy samostatného českého státu", "Restoration Day of the Independent Czech State",
+                 1, 1, None, "Public", 2001, None, True),
+    _HolidayRule("Nový Rok", "New Year's Day",
+                 1, 1, None, "Other", 2001, None, True),
+    # Good Friday was not applicable till 2016 (Zákon č. 359/2015 Sb.)
+    _HolidayRule("Velký pátek", "Good Friday",
+                 None, None, -2, "Other", 2016, None, False),
+    _HolidayRule("Velikonoční pondělí", "Easter Monday",
+                 None, None, 1, "Other", 2001, None, True),
+    _HolidayRule("Svátek práce", "Labour Day",
+                 5, 1, None, "Other", 2001, None, False),
+    _HolidayRule("Den vítězství", "Victory Day",
+                 5, 8, None, "Public", 2001, None, True),
+    _HolidayRule("Den slovanských věrozvěstů Cyrila a Metoděje", "Saints Cyril and Methodius Day",
+                 7, 5, None, "Public", 2001, None, False),
+    _HolidayRule("Den upálení mistra Jana Husa", "Jan Hus Day",
+                 7, 6, None, "Public", 2001, None, False),
+    _HolidayRule("Den české státnosti", "Czech Statehood Day",
+                 9, 28, None, "Public", 2001, None, True),
+    _HolidayRule("Den vzniku samostatného československého státu", "Czechoslovak Independence State Day",
+                 10, 28, None, "Public", 2001, None, True),
+    _HolidayRule("Den boje za svobodu a demokracii a Mezinárodní den studentstva",
+                 "Struggle for freedom and democracy and International Student Day",
+                 11, 17, None, "Public", 2001, None, False),
+    _HolidayRule("Štědrý den", "Christmas Eve",
+                 12, 24, None, "Other", 2001, None, False),
+    _HolidayRule("1. svátek vánoční", "Christmas Day",
+                 12, 25, None, "Other", 2001, None, True),
+    _HolidayRule("2. svátek vánoční", "St. Stephen's Day",
+                 12, 26, None, "Other", 2001, None, True),
+)
+
+
+# Days between March 22nd and Easter Sunday of years 2001-2200, one byte per year
+_EASTER_TABLE_START = 2001
+_EASTER_TABLE = bytes.fromhex(
+    "18091d1405191101150d2111091d0e05190a1e150d1a12091d0e06190a1e16061a1203160e22130a1e0f071a1203170e1b13"
+    "0b1e0f071b0b1f17081b1304180f07140c1f17081c130418101c140c2010081c0d0418091d140c191108150d2118091d1506"
+    "1a1203160e1b130a1e0f071a0b1f17071b1304170f07140b1f17081b1304180f1c140c1f10081c0c0418091c140c19100815"
+    "0d2018091d1405191101150d2111091d0e05190a1e150d1a12091d0e06190a1e16061a1203160e22130a1e0f071a1203170f"
+)
+
+
+def _compute_easter(year: int) -> date:
+    """Computes Easter Sunday of the Gregorian calendar by the anonymous Gregorian algorithm (Meeus/Jones/Butcher)."""
+    golden = year % 19
+    century, year_of_century = divmod(year, 100)
+    leap_centuries, century_rest = divmod(century, 4)
+    correction = (century + 8) // 25
+    moon_correction = (century - correction + 1) // 3
+    epact = (19 * golden + century - leap_centuries - moon_correction + 15) % 30
+    leap_years, year_rest = divmod(year_of_century, 4)
+    weekday = (32 + 2 * century_rest + 2 * leap_years - epact - year_rest) % 7
+    month_correction = (golden + 11 * epact + 22 * weekday) // 451
+    month, day = divmod(epact + weekday - 7 * month_correction + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _easter(year: int) -> date:
+    """Gets Easter Sunday, from the precomputed table for years 2001-2200, otherwise computed."""
+    index = year - _EASTER_TABLE_START
+    if 0 <= index < len(_EASTER_TABLE):
+        return date(year, 3, 22) + timedelta(days=_EASTER_TABLE[index])
+    return _compute_easter(year)
+
+
+def _compile_holidays(year: int) -> tuple:
+    """Compiles holiday rules valid in a given year into Holiday records."""
+    easter_sunday = _easter(year)
+    holidays = []
+    for rule in _HOLIDAY_RULES:
+        if year < rule.valid_from or rule.valid_to is not None and year > rule.valid_to:
+            continue
+        if rule.easter_offset is None:
+            holiday_date = date(year, rule.month, rule.day)
+        else:
+            holiday_date = easter_sunday + timedelta(days=rule.easter_offset)
+        holidays.append(Holiday(rule.holiday_name_cz, rule.holiday_name_en, holiday_date, rule.easter_offset is None,
+                                rule.public_other, rule.valid_from, rule.shopping_restricted, "", ""))
+    return tuple(holidays)
+
+
+def get_holidays(year: int,
+                 dates_only: bool = False,
+                 dates_and_cz_names: bool = False,
+                 dates_and_en_names: bool = False,
+                 shopping_restricted: bool = False) -> list:
+    """
+    This function generates holidays (public and other) when working is usually restricted according to labor Law.
+    Also offers possibilities to filter dates only, czech or english names or shopping restricted days.
+
+    :param year: Desired year to generate holidays (int)
+    :param dates_only: Returns only dates, sorted and without duplicates -> [datetime.date(2023, 1, 1), ...]
+    :param dates_and_cz_names: Returns only dates and cz names
+            -> [[datetime.date(2023, 1, 1), 'Den obnovy samostatného českého státu'], ...]
+    :param dates_and_en_names: Returns only dates and cz names
+            -> [[datetime.date(2023, 1, 1), 'Restoration Day of the Independent Czech State'], ...]
+    :param shopping_restricted: If true, filters out only holidays when shopping is restricted
+            and can be combined with other parameters
+    :return: If dates or names not selected individually, returns list with dictionaries including information
+                about individual holidays
+    """
+
+    # Verification for year data type
+    if not isinstance(year, int):
+        raise TypeError("Year must be an integer.")
+
+    # Verification for dates_only data type
+    if not isinstance(dates_only, bool):
+        raise TypeError("dates_only must be a boolean.")
+
+    # Verification for dates_and_cz_names data type
+    if not isinstance(dates_and_cz_names, bool):
+        raise TypeError("dates_and_cz_names must be a boolean.")
+
+    # Verification for dates_and_en_names data type
+    if not isinstance(dates_and_en_names, bool):
+        raise TypeError("dates_and_en_names must be a boolean.")
+
+    # Verification for shopping_restricted data type
+    if not isinstance(shopping_restricted, bool):
+        raise TypeError("shopping_restricted must be a boolean.")
+
+    if year < 2001:
+        raise UnsupportedYearError("Data are valid since year 2001")
+
+    holidays = _year_calendar(year).holiday_records
+
+    if shopping_restricted:
+        _check_shopping_restriction(year)
+        # shopping restricted holidays before legslation change are filtered out in 2016
+        holidays = [holiday for holiday in holidays
+                    if holiday.shopping_restricted and holiday.date >= _SHOPPING_RESTRICTION_START]
+
+    if dates_only:
+        holiday_dates = sorted(set(holiday.date for holiday in holidays))
+        return holiday_dates
+
+    if dates_and_cz_names:
+        holiday_dates_cz_names = [[holiday.date, holiday.holiday_name_cz] for holiday in holidays]
+        return holiday_dates_cz_names
+
+    if dates_and_en_names:
+        holiday_dates_en_names = [[holiday.date, holiday.holiday_name_en] for holiday in holidays]
+        return holiday_dates_en_names
+
+    return [holiday._asdict() for holiday in holidays]
+
+
+def get_holiday_records(year: int) -> tuple:
+    """
+    Gets holidays of a given year as immutable Holiday records, sorted by date. Records are cached per year,
+    thus repeated calls return the same tuple.
+
+    :param year: Desired year to generate holidays (int)
+    :return: Tuple of holidays -> (Holiday(holiday_name_cz='Den obnovy samostatného českého státu', ...), ...)
+    """
+
+    # Verification for year data type
+    if not isinstance(year, int):
+        raise TypeError("Year must be an integer.")
+
+    if year < 2001:
+        raise UnsupportedYearError("Data are valid since year 2001")
+
+    return _year_calendar(year).holiday_records
+
+
+def get_workdays(year: int,
+                 include_saturday: bool = False,
+                 include_sunday: bool = False,
+                 include_holidays: bool = False) -> list:
+    """
+
+    :param year: Desired year to generate holidays (int)
+    :param include_saturday: Includes also Saturdays in output
+    :param include_sunday: Includes also Sundays in output
+    :param include_holidays: Counts holidays as working days
+    :return: List of all working days -> [datetime.date(2023, 1, 2), ...]
+    """
+
+    # Verification for year data type
+    if not isinstance(year, int):
+        raise TypeError("Year must be an integer.")
+
+    # Verification for include_saturday data type
+    if not isinstance(include_saturday, bool):
+        raise TypeError("include_saturday must be a boolean.")
+
+    # Verification for include_sunday data type
+    if not isinstance(include_sunday, bool):
+        raise TypeError("include_sunday must be a boolean.")
+
+    # Verification for include_holidays data type
+    if not isinstance(include_holidays, bool):
+        raise TypeError("include_holidays must be a boolean.")
+
+    calendar = _year_calendar(year)
+    return calendar.select(calendar.workday_mask(include_saturday, include_sunday, include_holidays))
+
+
+def get_shopping_days(year: int,
+                      include_saturday: bool = True,
+                      include_sunday: bool = True,
+                      exclude_shopping_restricted_days: bool = True) -> list:
+    """
+    Gets all shopping days in a given year. Full year returned if all parameters are True. Possibility to combine
+    parameters
+
+    :param year: Desired year to generate holidays (int)
+    :param include_saturday: Includes also Saturdays in output
+    :param include_sunday: Includes also Sundays in output
+    :param exclude_shopping_restricted_days: Excludes shopping restricted days in output
+    :return: List of all shopping days -> [datetime.date(2023, 1, 2), ...]
+    """
+
+    # Verification for year data type
+    if not isinstance(year, int):
+        raise TypeError("Year must be an integer.")
+
+    # Verification for include_saturday data type
+    if not isinstance(include_saturday, bool):
+        raise TypeError("include_saturday must be a boolean.")
+
+    # Verification for include_sunday data type
+    if not isinstance(include_sunday, bool):
+        raise TypeError("include_sunday must be a boolean.")
+
+    # Verification for exclude_shopping_restricted_days data type
+    if not isinstance(exclude_shopping_restricted_days, bool):
+        raise TypeError("exclude_shopping_restricted_days must be a boolean.")
+
+    if exclude_shopping_restricted_days:
+        if year < 2001:
+            raise UnsupportedYearError("Data are valid since year 2001")
+        _check_shopping_restriction(year)
+
+    calendar = _year_calendar(year)
+    return calendar.select(calendar.shopping_mask(include_saturday, include_sunday, exclude_shopping_restricted_days))
+
+
+def get_holidays_during_weekend(year: int) -> list:
+    # Verification for year data type
+    if not isinstance(year, int):
+        raise TypeError("Year must be an integer.")
+
+    if year < 2001:
+        raise UnsupportedYearError("Data are valid since year 2001")
+
+    # Monday is 0, thus Saturday is 5 and Sunday is 6
+    holiday_dates = list(holiday.date for holiday in _year_calendar(year).holiday_records
+                         if holiday.date.weekday() >= 5)
+
+    return holiday_dates
+
+
+def get_workdays_during_weekend(year: int, include_holidays: bool = False) -> list:
+
+    """
+    Gets all workdays that are during weekend (Saturday or Sunday) with possibility to include holidays
+    :param year: Desired year to generate holidays (int)
+    :param include_holidays: Considers holidays as working days if True
+    :return: List of all workdays during weekend in a given year
+    """
+
+    # Verification for year data type
+    if not isinstance(year, int):
+        raise TypeError("Year must be an integer.")
+
+    # Verification for include_holidays data type
+    if not isinstance(include_holidays, bool):
+        raise TypeError("include_holidays must be a boolean.")
+
+    calendar = _year_calendar(year)
+    workdays = calendar.workday_mask(True, True, include_holidays)
+    return calendar.select(workdays & (calendar.saturdays | calendar.sundays))
+
+
+def _check_shopping_restriction(year: int) -> None:
+    if year < 2016:
+        raise Exception("Shopping resctriction came into effect 01/10/2016 (DD/MM/YY)")
+    elif year == 2016:
+        from warnings import warn
+
+        warn("Shopping resctriction came into effect 01/10/2016 (DD/MM/YY) thus holidays that are usually "
+             "shopping restricted are not filtered before this day. This applies only for year 2016")
+
+
+# Flags of a day in the precomputed table
+_HOLIDAY_FLAG = 1
+_SHOPPING_RESTRICTED_FLAG = 2
+
+# Table header: magic, first year and number of years as little endian unsigned 16-bit integers, padding
+_TABLE_MAGIC = b"CZWDHT01"
+_TABLE_HEADER_SIZE = 16
+_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "calendar_table.bin")
+
+
+def _table_flags(year: int) -> bytes:
+    """Computes flags of every day of a year from holiday rules, one byte per day as stored in the table."""
+    first_ordinal = date(year, 1, 1).toordinal()
+    flags = bytearray(date(year + 1, 1, 1).toordinal() - first_ordinal)
+    for holiday in _compile_holidays(year):
+        offset = holiday.date.toordinal() - first_ordinal
+        flags[offset] |= _HOLIDAY_FLAG
+        if holiday.shopping_restricted and holiday.date >= _SHOPPING_RESTRICTION_START:
+            flags[offset] |= _SHOPPING_RESTRICTED_FLAG
+    return bytes(flags)
+
+
+def _build_table(start_year: int, end_year: int) -> bytes:
+    """Builds content of the precomputed table file for a range of years, see scripts/generate_calendar_table.py."""
+    header = _TABLE_MAGIC + start_year.to_bytes(2, "little") + (end_year - start_year + 1).to_bytes(2, "little")
+    return header.ljust(_TABLE_HEADER_SIZE, b"\0") + b"".join(map(_table_flags, range(start_year, end_year + 1)))
+
+
+class _CalendarTable:
+    """
+    Precomputed day flags memory-mapped read-only on first use, so processes share the same pages of the file
+    instead of building their own copies. Years outside the table or a missing file fall back to computing.
+    """
+
+    def __init__(self, path: "Optional[str]"):
+        self.path = path
+        self.first_year = 0
+        self.years = 0
+        self._first_ordinal = 0
+        self._map = None
+        self._loaded = False
+
+    def _load(self) -> None:
+        self._loaded = True
+        try:
+            import mmap
+
+            with open(self.path, "rb") as file:
+                table = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, TypeError, ValueError):
+            return
+        if table[:len(_TABLE_MAGIC)] != _TABLE_MAGIC:
+            table.close()
+            return
+        self.first_year = int.from_bytes(table[8:10], "little")
+        self.years = int.from_bytes(table[10:12], "little")
+        self._first_ordinal = date(self.first_year, 1, 1).toordinal()
+        self._map = table
+
+    def year_flags(self, year: int) -> "Optional[bytes]":
+        """Gets flags of every day of a year, None if the year is not in the table."""
+        if not self._loaded:
+            self._load()
+        if self._map is None or not 0 <= year - self.first_year < self.years:
+            return None
+        start = _TABLE_HEADER_SIZE + date(year, 1, 1).toordinal() - self._first_ordinal
+        return self._map[start:start + date(year + 1, 1, 1).toordinal() - date(year, 1, 1).toordinal()]
+
+
+_TABLE = _CalendarTable(_TABLE_PATH)
+
+
+def _flag_mask(flags: bytes, flag: int) -> int:
+    """Converts flags of days into a bitmap of the days having a flag."""
+    return int(flags.translate(_FLAG_DIGITS[flag])[::-1], 2)
+
+
+# Translation of flags into binary digits "1" (flag is set) or "0"
+_FLAG_DIGITS = {flag: bytes(b"01"[value & flag == flag] for value in range(256))
+                for flag in (_HOLIDAY_FLAG, _SHOPPING_RESTRICTED_FLAG)}
+
+# Bitmap with every seventh bit set, shifted to get days of week of a year
+_EVERY_SEVENTH_DAY = sum(1 << offset for offset in range(0, 371, 7))
+
+# Offsets of first days of months (and of the next year) in a year of 365 or 366 days
+_MONTH_STARTS = {days: tuple(accumulate((31, days - 337, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31), initial=0))
+                 for days in (365, 366)}
+
+
+class _YearCalendar:
+    """
+    Memoized classification of every day of one year. Each category is stored as an integer bitmap where bit ``i``
+    stands for the ``i``-th day of the year (bit 0 is January 1st), so a single day is answered by a bit test.
+    """
+
+    __slots__ = ("year", "first_ordinal", "days", "saturdays", "sundays", "holidays", "shopping_restricted",
+                 "supported", "_holiday_records", "_workday_masks", "_workday_prefixes", "_dates", "_shop_closing",
+                 "_prefixes", "_month_workdays")
+
+    def __init__(self, year: int):
+        self.year = year
+        self.first_ordinal = date(year, 1, 1).toordinal()
+        self.days = date(year + 1, 1, 1).toordinal() - self.first_ordinal if year < 9999 else 365
+
+        # Monday is 0, thus Saturday is 5 and Sunday is 6
+        first_weekday = date(year, 1, 1).weekday()
+        every_day = (1 << self.days) - 1
+        self.saturdays = _EVERY_SEVENTH_DAY << (5 - first_weekday) % 7 & every_day
+        self.sundays = _EVERY_SEVENTH_DAY << (6 - first_weekday) % 7 & every_day
+
+        # Holidays are not defined before 2001, see get_holidays()
+        self.supported = year >= 2001
+        self._holiday_records = None
+        self.holidays = 0
+        self.shopping_restricted = 0
+        flags = _TABLE.year_flags(year) if self.supported else None
+        if flags is not None:
+            self.holidays = _flag_mask(flags, _HOLIDAY_FLAG)
+            self.shopping_restricted = _flag_mask(flags, _SHOPPING_RESTRICTED_FLAG)
+        else:
+            for holiday in self.holiday_records:
+                bit = 1 << (holiday.date.toordinal() - self.first_ordinal)
+                self.holidays |= bit
+                if holiday.shopping_restricted and holiday.date >= _SHOPPING_RESTRICTION_START:
+                    self.shopping_restricted |= bit
+
+        self._workday_masks = [None] * 8
+        self._workday_prefixes = [None] * 8
+        self._dates = None
+        self._shop_closing = None
+        self._prefixes = {}
+        self._month_workdays = [None] * 8
+
+    @property
+    def holiday_records(self) -> tuple:
+        """Holiday records of the year, compiled on first use as bitmaps may come from the precomputed table."""
+        if self._holiday_records is None:
+            self._holiday_records = _compile_holidays(self.year) if self.supported else ()
+        return self._holiday_records
+
+    def offset(self, day: date) -> int:
+        return day.toordinal() - self.first_ordinal
+
+    def range_mask(self, first_ordinal: int, last_ordinal: int) -> int:
+        """Gets a bitmap of the days between two ordinals (both included) that fall into this year."""
+        low = max(first_ordinal - self.first_ordinal, 0)
+        high = min(last_ordinal - self.first_ordinal, self.days - 1)
+        if high < low:
+            return 0
+        return ((1 << (high - low + 1)) - 1) << low
+
+    def bits(self, mask: int) -> bytes:
+        """Converts a bitmap into one byte per day of the year, 1 if the bit is set, otherwise 0."""
+        return bin(mask)[2:].zfill(self.days)[::-1].encode().translate(_BIT_BYTES)
+
+    def select(self, mask: int) -> list:
+        """Gets the dates whose bit is set in a bitmap, sorted."""
+        if self._dates is None:
+            self._dates = tuple(map(date.fromordinal, range(self.first_ordinal, self.first_ordinal + self.days)))
+        return list(compress(self._dates, self.bits(mask)))
+
+    def workday_mask(self, include_saturday: bool, include_sunday: bool, include_holidays: bool) -> int:
+        key = include_saturday | include_sunday << 1 | include_holidays << 2
+        mask = self._workday_masks[key]
+        if mask is None:
+            if not include_holidays and not self.supported:
+                raise UnsupportedYearError("Data are valid since year 2001")
+
+            mask = (1 << self.days) - 1
+            if not include_saturday:
+                mask &= ~self.saturdays
+            if not include_sunday:
+                mask &= ~self.sundays
+            if not include_holidays:
+                mask &= ~self.holidays
+            self._workday_masks[key] = mask
+        return mask
+
+    def workday_prefix(self, include_saturday: bool, include_sunday: bool, include_holidays: bool) -> array:
+        """
+        Cumulative index of working days, item ``i`` is the number of working days before the ``i``-th day of
+        the year, the last item is the number of working days in the whole year.
+        """
+        key = include_saturday | include_sunday << 1 | include_holidays << 2
+        prefix = self._workday_prefixes[key]
+        if prefix is None:
+            mask = self.workday_mask(include_saturday, include_sunday, include_holidays)
+            prefix = self._workday_prefixes[key] = array("H", accumulate(self.bits(mask), initial=0))
+        return prefix
+
+    def month_workdays(self, include_saturday: bool, include_sunday: bool, include_holidays: bool) -> tuple:
+        """Working days of every month, item ``m - 1`` is a sorted tuple of working days of month ``m``."""
+        key = include_saturday | include_sunday << 1 | include_holidays << 2
+        months = self._month_workdays[key]
+        if months is None:
+            days = self.select(self.workday_mask(include_saturday, include_sunday, include_holidays))
+            prefix = self.workday_prefix(include_saturday, include_sunday, include_holidays)
+            bounds = [prefix[offset] for offset in self.month_starts]
+            months = self._month_workdays[key] = tuple(tuple(days[bounds[month]:bounds[month + 1]])
+                                                       for month in range(12))
+        return months
+
+    @property
+    def month_starts(self) -> tuple:
+        """Offsets of first days of months, the last item is the number of days of the year."""
+        return _MONTH_STARTS[self.days]
+
+    def prefix(self, mask: int) -> array:
+        """Cumulative index of any bitmap of the year, built once per distinct bitmap, see workday_prefix()."""
+        prefix = self._prefixes.get(mask)
+        if prefix is None:
+            prefix = self._prefixes[mask] = array("H", accumulate(self.bits(mask), initial=0))
+        return prefix
+
+    def shopping_mask(self, include_saturday: bool, include_sunday: bool,
+                      exclude_shopping_restricted_days: bool) -> int:
+        mask = (1 << self.days) - 1
+        if not include_saturday:
+            mask &= ~self.saturdays
+        if not include_sunday:
+            mask &= ~self.sundays
+        if exclude_shopping_restricted_days:
+            mask &= ~self.shopping_restricted
+        return mask
+
+    def shop_closing(self) -> array:
+        """
+        Minute of the day from which shops are closed by the shopping restriction, item ``i`` stands for the
+        ``i``-th day of the year, 0 if closed for the whole day and 1440 if not restricted.
+        """
+        if self._shop_closing is None:
+            closing = array("H", [_MINUTES_PER_DAY]) * self.days
+            for offset, restricted in enumerate(self.bits(self.shopping_restricted)):
+                if restricted:
+                    closing[offset] = 0
+            for month, day, minute in _PARTIAL_SHOPPING_RESTRICTIONS:
+                if date(self.year, month, day) >= _SHOPPING_RESTRICTION_START:
+                    offset = self.offset(date(self.year, month, day))
+                    closing[offset] = min(closing[offset], minute)
+            self._shop_closing = closing
+        return self._shop_closing
+
+
+# Translation of binary digits "0" and "1" into bytes 0 and 1
+_BIT_BYTES = bytes.maketrans(b"01", b"\x00\x01")
+
+_MINUTES_PER_DAY = 24 * 60
+
+
+class CacheInfo(namedtuple("CacheInfo", ("hits", "misses", "evictions", "maxsize", "currsize", "build_times"))):
+    """
+    Statistics of the calendar cache returned by cache_info(). Field build_times maps years to seconds spent
+    building them, the last build is kept for every year built since cache_clear().
+    """
+
+    __slots__ = ()
+
+
+class _CalendarCache:
+    """
+    Thread-safe cache of _YearCalendar objects with least recently used eviction.
+    """
+
+    def __init__(self, maxsize: "Optional[int]" = 512):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._calendars = OrderedDict()
+        self._reset_statistics()
+
+    def _reset_statistics(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.build_times = {}
+
+    def _reset_lock(self) -> None:
+        # Lock could be held by another thread while forking, thus it is replaced in the child process
+        self._lock = threading.Lock()
+
+    def get(self, year: int) -> _YearCalendar:
+        with self._lock:
+            calendar = self._calendars.get(year)
+            if calendar is not None:
+                self._calendars.move_to_end(year)
+                self.hits += 1
+                return calendar
+            self.misses += 1
+
+        # Built without holding the lock, if two threads build the same year, the first stored one is kept
+        start = perf_counter()
+        calendar = _YearCalendar(year)
+        build_time = perf_counter() - start
+
+        with self._lock:
+            self.build_times[year] = build_time
+            return self._store(year, calendar)
+
+    def _store(self, year: int, calendar: _YearCalendar) -> _YearCalendar:
+        stored = self._calendars.setdefault(year, calendar)
+        self._evict()
+        return stored
+
+    def _evict(self) -> None:
+        if self.maxsize is None:
+            return
+        while len(self._calendars) > self.maxsize:
+            self._calendars.popitem(last=False)
+            self.evictions += 1
+
+    def resize(self, maxsize: "Optional[int]") -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._calendars),
+                             dict(self.build_times))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._calendars.clear()
+            self._reset_statistics()
+
+
+_CACHE = _CalendarCache()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_CACHE._reset_lock)
+
+
+def _year_calendar(year: int) -> _YearCalendar:
+    return _CACHE.get(year)
+
+
+def cache_info() -> CacheInfo:
+    """
+    Gets statistics of the calendar cache shared by all functions of this module. Every year used is classified
+    once and kept in the cache until it is evicted as the least recently used one.
+
+    :return: CacheInfo(hits, misses, evictions, maxsize, currsize, build_times) where build_times is a dictionary
+                of seconds spent building each year -> {2023: 0.00012, ...}
+    """
+    return _CACHE.info()
+
+
+def cache_clear() -> None:
+    """
+    Removes all years from the calendar cache and resets its statistics.
+    """
+    _CACHE.clear()
+
+
+def set_cache_size(maxsize: "Optional[int]") -> None:
+    """
+    Sets maximum number of years kept in the calendar cache, least recently used years over the limit
+    are evicted. Default size is 512 years.
+
+    :param maxsize: Maximum number of years (int) or None for unbounded cache
+    """
+
+    # Verification for maxsize data type
+    if maxsize is not None and (not isinstance(maxsize, int) or isinstance(maxsize, bool)):
+        raise TypeError("maxsize must be an integer or None.")
+
+    if maxsize is not None and maxsize < 1:
+        raise ValueError("maxsize must be at least 1.")
+
+    _CACHE.resize(maxsize)
+
+
+def prewarm_cache(start_year: int, end_year: int) -> None:
+    """
+    Builds all years of a range into the calendar cache, e.g. at startup of a server or before forking workers
+    so that the processes share already built years.
+
+    :param start_year: First year of the range (int)
+    :param end_year: Last year of the range (int)
+    """
+
+    # Verification for start_year and end_year data type
+    if not isinstance(start_year, int) or not isinstance(end_year, int):
+        raise TypeError("Year must be an integer.")
+
+    for year in range(start_year, end_year + 1):
+        _CACHE.get(year)
+
+
+def is_workday(day: date,
+               include_saturday: bool = False,
+               include_sunday: bool = False,
+               include_holidays: bool = False) -> bool:
+    """
+    Checks whether a single date is a working day. Parameters have the same meaning as in get_workdays(), thus
+    is_workday(day) is True exactly when day is in get_workdays(day.year).
+
+    :param day: Date to check (datetime.date)
+    :param include_saturday: Considers Saturdays as working days
+    :param include_sunday: Considers Sundays as working days
+    :param include_holidays: Considers holidays as working days
+    :return: True if the day is a working day
+    """
+
+    # Verification for day data type
+    if not isinstance(day, date):
+        raise TypeError("day must be a datetime.date.")
+
+    # Verification for include_saturday data type
+    if not isinstance(include_saturday, bool):
+        raise TypeError("include_saturday must be a boolean.")
+
+    # Verification for include_sunday data type
+    if not isinstance(include_sunday, bool):
+        raise TypeError("include_sunday must be a boolean.")
+
+    # Verification for include_holidays data type
+    if not isinstance(include_holidays, bool):
+        raise TypeError("include_holidays must be a boolean.")
+
+    calendar = _year_calendar(day.year)
+    mask = calendar.workday_mask(include_saturday, include_sunday, include_holidays)
+    return mask >> (day.toordinal() - calendar.first_ordinal) & 1 == 1
+
+
+def is_holiday(day: date) -> bool:
+    """
+    Checks whether a single date is a holiday (public or other) as returned by get_holidays().
+
+    :param day: Date to check (datetime.date)
+    :return: True if the day is a holiday
+    """
+
+    # Verification for day data type
+    if not isinstance(day, date):
+        raise TypeError("day must be a datetime.date.")
+
+    if day.year < 2001:
+        raise UnsupportedYearError("Data are valid since year 2001")
+
+    calendar = _year_calendar(day.year)
+    return calendar.holidays >> (day.toordinal() - calendar.first_ordinal) & 1 == 1
+
+
+def is_shopping_day(day: date,
+                    include_saturday: bool = True,
+                    include_sunday: bool = True,
+                    exclude_shopping_restricted_days: bool = True) -> bool:
+    """
+    Checks whether a single date is a shopping day. Parameters have the same meaning as in get_shopping_days().
+    Shopping restriction is applied only to days from 01/10/2016 (DD/MM/YY) when it came into effect.
+
+    :param day: Date to check (datetime.date)
+    :param include_saturday: Considers Saturdays as shopping days
+    :param include_sunday: Considers Sundays as shopping days
+    :param exclude_shopping_restricted_days: Shopping restricted days are not shopping days
+    :return: True if the day is a shopping day
+    """
+
+    # Verification for day data type
+    if not isinstance(day, date):
+        raise TypeError("day must be a datetime.date.")
+
+    # Verification for include_saturday data type
+    if not isinstance(include_saturday, bool):
+        raise TypeError("include_saturday must be a boolean.")
+
+    # Verification for include_sunday data type
+    if not isinstance(include_sunday, bool):
+        raise TypeError("include_sunday must be a boolean.")
+
+    # Verification for exclude_shopping_restricted_days data type
+    if not isinstance(exclude_shopping_restricted_days, bool):
+        raise TypeError("exclude_shopping_restricted_days must be a boolean.")
+
+    calendar = _year_calendar(day.year)
+    mask = calendar.shopping_mask(include_saturday, include_sunday, exclude_shopping_restricted_days)
+    return mask >> (day.toordinal() - calendar.first_ordinal) & 1 == 1
+
+
+def count_workdays(start_date: date,
+                   end_date: date,
+                   include_saturday: bool = False,
+                   include_sunday: bool = False,
+                   include_holidays: bool = False) -> int:
+    """
+    Counts working days between two dates (both included) without generating them. Days of week are counted
+    arithmetically and holidays falling on counted days are subtracted year by year, so the cost depends on
+    the number of years spanned, not on the number of days. Parameters have the same meaning as in get_workdays().
+
+    :param start_date: First day of the range (datetime.date)
+    :param end_date: Last day of the range (datetime.date)
+    :param include_saturday: Counts also Saturdays
+    :param include_sunday: Counts also Sundays
+    :param include_holidays: Counts holidays as working days
+    :return: Number of working days in the range, 0 if end_date is before start_date
+    """
+
+    # Verification for start_date data type
+    if not isinstance(start_date, date):
+        raise TypeError("start_date must be a datetime.date.")
+
+    # Verification for end_date data type
+    if not isinstance(end_date, date):
+        raise TypeError("end_date must be a datetime.date.")
+
+    # Verification for include_saturday data type
+    if not isinstance(include_saturday, bool):
+        raise TypeError("include_saturday must be a boolean.")
+
+    # Verification for include_sunday data type
+    if not isinstance(include_sunday, bool):
+        raise TypeError("include_sunday must be a boolean.")
+
+    # Verification for include_holidays data type
+    if not isinstance(include_holidays, bool):
+        raise TypeError("include_holidays must be a boolean.")
+
+    first = start_date.toordinal()
+    last = end_date.toordinal()
+    if last < first:
+        return 0
+
+    if not include_holidays and start_date.year < 2001:
+        raise UnsupportedYearError("Data are valid since year 2001")
+
+    # Days of week: ordinal 1 (0001-01-01) was Monday, Saturday is 5 and Sunday is 6
+    counted_weekdays = [True] * 5 + [include_saturday, include_sunday]
+    weeks, rest = divmod(last - first + 1, 7)
+    first_weekday = (first + 6) % 7
+    workdays = weeks * sum(counted_weekdays)
+    workdays += sum(counted_weekdays[(first_weekday + day) % 7] for day in range(rest))
+
+    if include_holidays:
+        return workdays
+
+    for year in range(start_date.year, end_date.year + 1):
+        calendar = _year_calendar(year)
+        # Holidays falling on days that were counted above
+        holidays = calendar.holidays & calendar.workday_mask(include_saturday, include_sunday, True)
+        workdays -= bin(holidays & calendar.range_mask(first, last)).count("1")
+
+    return workdays
+
+
+def _shift_workdays(day: date, workdays: int, year_prefix) -> date:
+    """
+    Moves by a number of working days using per-year cumulative indexes. Whole years are skipped by their totals
+    and the target day within a year is found by a binary search, so the cost does not depend on the number of days.
+
+    :param year_prefix: Callable returning a tuple (first ordinal of the year, cumulative index) for a year
+    """
+    year = day.year
+    first_ordinal, prefix = year_prefix(year)
+    offset = day.toordinal() - first_ordinal
+
+    if workdays > 0:
+        # Rank of the target within the year, counted from working days up to and including the day
+        rank = prefix[offset + 1] + workdays
+        while rank > prefix[-1]:
+            rank -= prefix[-1]
+            year += 1
+            first_ordinal, prefix = year_prefix(year)
+    else:
+        # Rank of the target within the year, counted from working days strictly before the day
+        rank = prefix[offset] + workdays + 1
+        while rank <= 0:
+            year -= 1
+            first_ordinal, prefix = year_prefix(year)
+            rank += prefix[-1]
+
+    return date.fromordinal(first_ordinal + bisect_left(prefix, rank) - 1)
+
+
+def add_workdays(day: date,
+                 workdays: int,
+                 include_saturday: bool = False,
+                 include_sunday: bool = False,
+                 include_holidays: bool = False) -> date:
+    """
+    Adds (or subtracts if negative) a number of working days to a date. The day itself is never counted, thus
+    add_workdays(day, 1) is the first working day after the day and add_workdays(day, -1) the last working day
+    before it. If workdays is 0, the day is returned if it is a working day, otherwise the next working day.
+    Parameters have the same meaning as in get_workdays().
+
+    :param day: Starting date (datetime.date)
+    :param workdays: Number of working days to add, may be negative (int)
+    :param include_saturday: Considers Saturdays as working days
+    :param include_sunday: Considers Sundays as working days
+    :param include_holidays: Considers holidays as working days
+    :return: Resulting working day -> datetime.date(2023, 1, 16)
+    """
+
+    # Verification for day data type
+    if not isinstance(day, date):
+        raise TypeError("day must be a datetime.date.")
+
+    # Verification for workdays data type
+    if not isinstance(workdays, int):
+        raise TypeError("workdays must be an integer.")
+
+    # Verification for include_saturday data type
+    if not isinstance(include_saturday, bool):
+        raise TypeError("include_saturday must be a boolean.")
+
+    # Verification for include_sunday data type
+    if not isinstance(include_sunday, bool):
+        raise TypeError("include_sunday must be a boolean.")
+
+    # Verification for include_holidays data type
+    if not isinstance(include_holidays, bool):
+        raise TypeError("include_holidays must be a boolean.")
+
+    def year_prefix(year):
+        calendar = _year_calendar(year)
+        return calendar.first_ordinal, calendar.workday_prefix(include_saturday, include_sunday, include_holidays)
+
+    if workdays == 0:
+        if is_workday(day, include_saturday, include_sunday, include_holidays):
+            return day
+        workdays = 1
+
+    return _shift_workdays(day, workdays, year_prefix)
+
+
+def next_workday(day: date,
+                 include_saturday: bool = False,
+                 include_sunday: bool = False,
+                 include_holidays: bool = False) -> date:
+    """
+    Gets the first working day after a date. Parameters have the same meaning as in get_workdays().
+
+    :param day: Starting date (datetime.date)
+    :return: Next working day -> datetime.date(2023, 12, 27)
+    """
+    return add_workdays(day, 1, include_saturday, include_sunday, include_holidays)
+
+
+def previous_workday(day: date,
+                     include_saturday: bool = False,
+                     include_sunday: bool = False,
+                     include_holidays: bool = False) -> date:
+    """
+    Gets the last working day before a date. Parameters have the same meaning as in get_workdays().
+
+    :param day: Starting date (datetime.date)
+    :return: Previous working day -> datetime.date(2023, 12, 22)
+    """
+    return add_workdays(day, -1, include_saturday, include_sunday, include_holidays)
+
+
+def _check_date_range(start_date: date, end_date: date) -> None:
+    # Verification for start_date data type
+    if not isinstance(start_date, date):
+        raise TypeError("start_date must be a datetime.date.")
+
+    # Verification for end_date data type
+    if not isinstance(end_date, date):
+        raise TypeError("end_date must be a datetime.date.")
+
+
+def _iter_days(start_date: date, end_date: date, year_mask) -> "Iterator[date]":
+    """
+    Yields days of a range (both dates included) selected by a per-year bitmap. A year is classified only when
+    the iteration reaches it.
+
+    :param year_mask: Callable returning the bitmap of selected days for a _YearCalendar
+    """
+    first = start_date.toordinal()
+    last = end_date.toordinal()
+    for year in range(start_date.year, end_date.year + 1):
+        calendar = _year_calendar(year)
+        yield from calendar.select(year_mask(calendar) & calendar.range_mask(first, last))
+
+
+def iter_workdays(start_date: date,
+                  end_date: date,
+                  include_saturday: bool = False,
+                  include_sunday: bool = False,
+                  include_holidays: bool = False) -> "Iterator[date]":
+    """
+    Lazily yields working days between two dates (both included) in date order across years. Parameters have
+    the same meaning as in get_workdays().
+
+    :param start_date: First day of the range (datetime.date)
+    :param end_date: Last day of the range (datetime.date)
+    :param include_saturday: Includes also Saturdays in output
+    :param include_sunday: Includes also Sundays in output
+    :param include_holidays: Counts holidays as working days
+    :return: Iterator of working days -> datetime.date(2023, 1, 2), ...
+    """
+    _check_date_range(start_date, end_date)
+
+    # Verification for include_saturday data type
+    if not isinstance(include_saturday, bool):
+        raise TypeError("include_saturday must be a boolean.")
+
+    # Verification for include_sunday data type
+    if not isinstance(include_sunday, bool):
+        raise TypeError("include_sunday must be a boolean.")
+
+    # Verification for include_holidays data type
+    if not isinstance(include_holidays, bool):
+        raise TypeError("include_holidays must be a boolean.")
+
+    if not include_holidays and start_date.year < 2001 and start_date <= end_date:
+        raise UnsupportedYearError("Data are valid since year 2001")
+
+    return _iter_days(start_date, end_date,
+                      lambda calendar: calendar.workday_mask(include_saturday, include_sunday, include_holidays))
+
+
+def iter_shopping_days(start_date: date,
+                       end_date: date,
+                       include_saturday: bool = True,
+                       include_sunday: bool = True,
+                       exclude_shopping_restricted_days: bool = True) -> "Iterator[date]":
+    """
+    Lazily yields shopping days between two dates (both included) in date order across years. Parameters have
+    the same meaning as in get_shopping_days(). Shopping restriction is applied only to days from
+    01/10/2016 (DD/MM/YY) when it came into effect.
+
+    :param start_date: First day of the range (datetime.date)
+    :param end_date: Last day of the range (datetime.date)
+    :param include_saturday: Includes also Saturdays in output
+    :param include_sunday: Includes also Sundays in output
+    :param exclude_shopping_restricted_days: Excludes shopping restricted days in output
+    :return: Iterator of shopping days -> datetime.date(2023, 1, 2), ...
+    """
+    _check_date_range(start_date, end_date)
+
+    # Verification for include_saturday data type
+    if not isinstance(include_saturday, bool):
+        raise TypeError("include_saturday must be a boolean.")
+
+    # Verification for include_sunday data type
+    if not isinstance(include_sunday, bool):
+        raise TypeError("include_sunday must be a boolean.")
+
+    # Verification for exclude_shopping_restricted_days data type
+    if not isinstance(exclude_shopping_restricted_days, bool):
+        raise TypeError("exclude_shopping_restricted_days must be a boolean.")
+
+    return _iter_days(start_date, end_date,
+                      lambda calendar: calendar.shopping_mask(include_saturday, include_sunday,
+                                                              exclude_shopping_restricted_days))
+
+
+def iter_holidays(start_date: date, end_date: date, shopping_restricted: bool = False) -> "Iterator[dict]":
+    """
+    Lazily yields holidays between two dates (both included) in date order across years, each holiday as
+    a dictionary like in get_holidays(). Shopping restriction is applied only to days from 01/10/2016 (DD/MM/YY)
+    when it came into effect.
+
+    :param start_date: First day of the range (datetime.date)
+    :param end_date: Last day of the range (datetime.date)
+    :param shopping_restricted: If true, yields only holidays when shopping is restricted
+    :return: Iterator of holidays -> {"holiday_name_cz": "Den obnovy samostatného českého státu", ...}, ...
+    """
+    _check_date_range(start_date, end_date)
+
+    # Verification for shopping_restricted data type
+    if not isinstance(shopping_restricted, bool):
+        raise TypeError("shopping_restricted must be a boolean.")
+
+    if start_date.year < 2001 and start_date <= end_date:
+        raise UnsupportedYearError("Data are valid since year 2001")
+
+    return _iter_holidays(start_date, end_date, shopping_restricted)
+
+
+def _iter_holidays(start_date: date, end_date: date, shopping_restricted: bool) -> "Iterator[dict]":
+    for year in range(start_date.year, end_date.year + 1):
+        calendar = _year_calendar(year)
+        for holiday in calendar.holiday_records:
+            if not start_date <= holiday.date <= end_date:
+                continue
+            if shopping_restricted and not calendar.shopping_restricted >> calendar.offset(holiday.date) & 1:
+                continue
+            yield holiday._asdict()
+
+
+# Features in submodules are imported on first use to keep importing of the package fast
+_LAZY_ATTRIBUTES = {
+    "DateRuns": "runs",
+    "get_workday_runs": "runs",
+    "get_shopping_day_runs": "runs",
+    "CompanyCalendar": "company",
+    "is_shop_open": "shopping_hours",
+    "next_shop_opening": "shopping_hours",
+    "get_shop_closures": "shopping_hours",
+    "WorkingHours": "working_hours",
+    "WorkingTimeFund": "fund",
+    "get_working_time_fund": "fund",
+    "annotate_file": "annotator",
+    "LeaveWindow": "leave",
+    "find_leave_windows": "leave",
+    "DateView": "views",
+    "get_holiday_view": "views",
+    "get_workday_view": "views",
+    "get_shopping_day_view": "views",
+    "Instrumentation": "instrumentation",
+    "nth_workday": "monthly",
+    "last_workday_of_month": "monthly",
+    "workday_of_month": "monthly",
+    "get_nth_workdays": "monthly",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(__import__(f"{__name__}.{module}", fromlist=(name,)), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -0,0 +1,160 @@
+"""
+Annotation of large CSV or NDJSON files with workday, holiday and shopping restriction columns.
+
+Rows are read in chunks and annotated by a pool of worker processes, results are written in the input order. At most
+a few chunks per worker are in flight, so memory does not depend on the size of the file.
+"""
+import csv
+import io
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+from itertools import islice
+from typing import Iterator, Optional, TextIO
+
+from . import get_holiday_records, is_holiday, is_shopping_day, is_workday
+
+ANNOTATION_COLUMNS = ("is_workday", "is_holiday", "is_shopping_restricted", "holiday_name")
+
+# Annotations of distinct dates memoized by each worker, dates repeat a lot in transaction data
+_MAX_MEMOIZED_DATES = 100000
+_annotations = {}
+
+
+def _annotation(value: str, language: str) -> Optional[tuple]:
+    """Gets (is_workday, is_holiday, is_shopping_restricted, holiday_name) of a date or datetime in ISO format."""
+    # A date may be followed only by time of a datetime
+    if len(value) > 10 and value[10] not in "T ":
+        return None
+    # Times of datetimes do not change the annotation, memo is per language of holiday names
+    key = (value[:10], language)
+    annotation = _annotations.get(key)
+    if annotation is None:
+        try:
+            day = date.fromisoformat(key[0])
+            holiday = is_holiday(day)
+            names = [getattr(record, f"holiday_name_{language}")
+                     for record in get_holiday_records(day.year) if record.date == day] if holiday else []
+            annotation = (is_workday(day), holiday, not is_shopping_day(day), " / ".join(names))
+        except Exception:
+            # Invalid dates and years before 2001 are left without annotation
+            annotation = ()
+        if len(_annotations) >= _MAX_MEMOIZED_DATES:
+            _annotations.clear()
+        _annotations[key] = annotation
+    return annotation or None
+
+
+def _annotate_csv_chunk(rows: list, column: int, language: str, delimiter: str) -> str:
+    output = io.StringIO()
+    writer = csv.writer(output, delimiter=delimiter)
+    for row in rows:
+        annotation = _annotation(row[column], language) if column < len(row) else None
+        writer.writerow(row + list(annotation) if annotation else row + [""] * len(ANNOTATION_COLUMNS))
+    return output.getvalue()
+
+
+def _annotate_ndjson_chunk(lines: list, column: str, language: str) -> str:
+    output = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        if not isinstance(record, dict):
+            # Lines that are not JSON objects are copied without annotation
+            output.append(line if line.endswith("\n") else line + "\n")
+            continue
+        value = record.get(column)
+        annotation = _annotation(value, language) if isinstance(value, str) else None
+        record.update(zip(ANNOTATION_COLUMNS, annotation or (None,) * len(ANNOTATION_COLUMNS)))
+        output.append(json.dumps(record, ensure_ascii=False) + "\n")
+    return "".join(output)
+
+
+def _chunks(items: Iterator, chunk_size: int) -> Iterator[list]:
+    while True:
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _run(function, chunks: Iterator[list], arguments: tuple, output: TextIO, workers: int) -> None:
+    """Annotates chunks in worker processes and writes results in order, with a bounded number of chunks in flight."""
+    if workers <= 1:
+        for chunk in chunks:
+            output.write(function(chunk, *arguments))
+        return
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(function, chunk, *arguments))
+            if len(pending) >= 2 * workers:
+                output.write(pending.popleft().result())
+        while pending:
+            output.write(pending.popleft().result())
+
+
+def annotate_file(input_file: TextIO,
+                  output_file: TextIO,
+                  date_column: str = "date",
+                  file_format: str = "csv",
+                  language: str = "en",
+                  workers: Optional[int] = None,
+                  chunk_size: int = 10000,
+                  delimiter: str = ",") -> None:
+    """
+    Copies CSV or NDJSON rows from input to output with columns is_workday, is_holiday, is_shopping_restricted
+    and holiday_name (names of more holidays on one day are joined by " / ") added. Dates (or datetimes) are read
+    in ISO format from the date column (a date may be followed only by "T" or a space and time), invalid dates and
+    dates before 2001 get empty annotation. NDJSON lines that are not JSON objects are copied unchanged. Shopping
+    restriction is applied only from 01/10/2016 (DD/MM/YY).
+
+    :param input_file: Text file to read, CSV with header or NDJSON
+    :param output_file: Text file to write, CSV should be opened with newline=""
+    :param date_column: Name of the column (CSV) or key (NDJSON) holding dates
+    :param file_format: "csv" or "ndjson"
+    :param language: Language of holiday names, "cz" or "en"
+    :param workers: Number of worker processes, number of CPUs if None, no pool if 1
+    :param chunk_size: Number of rows sent to a worker at once
+    :param delimiter: Delimiter of CSV columns
+    """
+
+    # Verification for file_format value
+    if file_format not in ("csv", "ndjson"):
+        raise ValueError("file_format must be csv or ndjson.")
+
+    # Verification for language value
+    if language not in ("cz", "en"):
+        raise ValueError("language must be cz or en.")
+
+    # Verification for workers data type
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif not isinstance(workers, int) or workers < 1:
+        raise ValueError("workers must be a positive integer.")
+
+    # Verification for chunk_size data type
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise ValueError("chunk_size must be a positive integer.")
+
+    if file_format == "ndjson":
+        _run(_annotate_ndjson_chunk, _chunks(iter(input_file), chunk_size), (date_column, language), output_file,
+             workers)
+        return
+
+    reader = csv.reader(input_file, delimiter=delimiter)
+    header = next(reader, None)
+    if header is None:
+        return
+    if date_column not in header:
+        raise ValueError(f"Date column {date_column!r} is not in the header.")
+    csv.writer(output_file, delimiter=delimiter).writerow(header + list(ANNOTATION_COLUMNS))
+    _run(_annotate_csv_chunk, _chunks(reader, chunk_size), (header.index(date_column), language, delimiter),
+         output_file, workers)
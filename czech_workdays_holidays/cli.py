@@ -0,0 +1,218 @@
+"""
+Command line interface of czech_workdays_holidays, installed as czech-workdays.
+
+Examples:
+    czech-workdays export workdays --start 2001 --end 2100 --format csv -o workdays.csv
+    czech-workdays export holidays --start 2024-01-01 --end 2024-12-31 --format ics > holidays.ics
+    czech-workdays export shopping-days --start 2024 --end 2025 --no-sunday --format ndjson
+    czech-workdays annotate transactions.csv --date-column created --language cz -o annotated.csv
+    czech-workdays serve --port 8080
+"""
+import argparse
+import json
+import sys
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterator
+from zlib import crc32
+
+from . import iter_holidays, iter_shopping_days, iter_workdays
+
+# Number of lines joined into one write
+_CHUNK_SIZE = 4096
+
+_KINDS = ("holidays", "workdays", "shopping-days", "weekend-holidays")
+
+_HOLIDAY_FIELDS = ("date", "holiday_name_cz", "holiday_name_en", "public_other", "shopping_restricted")
+
+
+def _parse_date(value: str, end: bool) -> date:
+    """Parses ISO date or a year, year means its first day or its last day for the end of a range."""
+    try:
+        if value.isdigit():
+            return date(int(value), 12, 31) if end else date(int(value), 1, 1)
+        return date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date or year: {value!r}")
+
+
+def _records(args: argparse.Namespace) -> Iterator[dict]:
+    """Yields exported days as dictionaries, holidays with their names."""
+    if args.kind == "workdays":
+        for day in iter_workdays(args.start, args.end, args.include_saturday, args.include_sunday,
+                                 args.include_holidays):
+            yield {"date": day}
+    elif args.kind == "shopping-days":
+        for day in iter_shopping_days(args.start, args.end, not args.no_saturday, not args.no_sunday,
+                                      not args.include_restricted):
+            yield {"date": day}
+    else:
+        for holiday in iter_holidays(args.start, args.end, args.shopping_restricted):
+            # Monday is 0, thus Saturday is 5 and Sunday is 6
+            if args.kind == "weekend-holidays" and holiday["date"].weekday() < 5:
+                continue
+            yield holiday
+
+
+def _csv_escape(value) -> str:
+    value = str(value)
+    if any(character in value for character in ',"\r\n'):
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _csv_lines(records: Iterator[dict], fields: tuple) -> Iterator[str]:
+    yield ",".join(fields) + "\r\n"
+    for record in records:
+        yield ",".join(_csv_escape(record[field]) for field in fields) + "\r\n"
+
+
+def _ndjson_lines(records: Iterator[dict], fields: tuple) -> Iterator[str]:
+    for record in records:
+        line = {field: record[field] for field in fields}
+        yield json.dumps(line, ensure_ascii=False, default=date.isoformat) + "\n"
+
+
+def _ics_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _ics_lines(records: Iterator[dict], kind: str, language: str) -> Iterator[str]:
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    default_summary = {"workdays": "Pracovní den" if language == "cz" else "Working day",
+                       "shopping-days": "Nákupní den" if language == "cz" else "Shopping day"}.get(kind)
+    yield "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//czech_workdays_holidays//CZ\r\nCALSCALE:GREGORIAN\r\n"
+    for record in records:
+        day = record["date"]
+        summary = record.get(f"holiday_name_{language}", default_summary)
+        # Each holiday gets its own event even if two holidays share a day, UID is stable between exports
+        uid = f"{day:%Y%m%d}-{kind}-{crc32(record.get('holiday_name_en', kind).encode()):08x}"
+        yield (f"BEGIN:VEVENT\r\n"
+               f"UID:{uid}@czech-workdays-holidays\r\n"
+               f"DTSTAMP:{stamp}\r\n"
+               f"DTSTART;VALUE=DATE:{day:%Y%m%d}\r\n"
+               f"DTEND;VALUE=DATE:{day + timedelta(days=1):%Y%m%d}\r\n"
+               f"SUMMARY:{_ics_escape(summary)}\r\n"
+               f"TRANSP:TRANSPARENT\r\n"
+               f"END:VEVENT\r\n")
+    yield "END:VCALENDAR\r\n"
+
+
+def export(args: argparse.Namespace, output) -> None:
+    """Streams the selected days to a text output in chunks, the whole range is never held in memory."""
+    records = _records(args)
+    fields = _HOLIDAY_FIELDS if args.kind in ("holidays", "weekend-holidays") else ("date",)
+    if args.format == "csv":
+        lines = _csv_lines(records, fields)
+    elif args.format == "ndjson":
+        lines = _ndjson_lines(records, fields)
+    else:
+        lines = _ics_lines(records, args.kind, args.language)
+
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) == _CHUNK_SIZE:
+            output.write("".join(chunk))
+            chunk.clear()
+    output.write("".join(chunk))
+
+
+def _export_command(args: argparse.Namespace) -> int:
+    if args.end < args.start:
+        raise SystemExit("czech-workdays: error: end date is before start date")
+    if args.output == "-":
+        export(args, sys.stdout)
+        sys.stdout.flush()
+    else:
+        # iCalendar lines already end with CRLF, thus newlines are not translated
+        with open(args.output, "w", encoding="utf-8", newline="", buffering=1024 * 1024) as output:
+            export(args, output)
+    return 0
+
+
+def _annotate_command(args: argparse.Namespace) -> int:
+    from .annotator import annotate_file
+
+    file_format = args.format
+    if file_format is None:
+        file_format = "ndjson" if args.input.endswith((".ndjson", ".jsonl")) else "csv"
+    options = dict(date_column=args.date_column, file_format=file_format, language=args.language,
+                   workers=args.workers, chunk_size=args.chunk_size, delimiter=args.delimiter)
+    with open(args.input, encoding="utf-8", newline="") as input_file:
+        if args.output == "-":
+            annotate_file(input_file, sys.stdout, **options)
+            sys.stdout.flush()
+        else:
+            with open(args.output, "w", encoding="utf-8", newline="", buffering=1024 * 1024) as output_file:
+                annotate_file(input_file, output_file, **options)
+    return 0
+
+
+def _serve_command(args: argparse.Namespace) -> int:
+    from . import server
+
+    server_args = ["--host", args.host, "--port", str(args.port)]
+    if args.prewarm:
+        server_args += ["--prewarm", *map(str, args.prewarm)]
+    server.main(server_args)
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="czech-workdays", description="Czech workdays, holidays and shopping days")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    exporter = commands.add_parser("export", help="stream days of a date range as CSV, NDJSON or iCalendar")
+    exporter.add_argument("kind", choices=_KINDS)
+    exporter.add_argument("--start", required=True, type=lambda value: _parse_date(value, end=False),
+                          help="first day of the range (YYYY-MM-DD) or first year")
+    exporter.add_argument("--end", required=True, type=lambda value: _parse_date(value, end=True),
+                          help="last day of the range (YYYY-MM-DD) or last year")
+    exporter.add_argument("--format", choices=("csv", "ndjson", "ics"), default="csv")
+    exporter.add_argument("-o", "--output", default="-", help="output file, standard output by default")
+    exporter.add_argument("--language", choices=("cz", "en"), default="en", help="language of iCalendar summaries")
+    exporter.add_argument("--include-saturday", action="store_true", help="workdays: count Saturdays as workdays")
+    exporter.add_argument("--include-sunday", action="store_true", help="workdays: count Sundays as workdays")
+    exporter.add_argument("--include-holidays", action="store_true", help="workdays: count holidays as workdays")
+    exporter.add_argument("--no-saturday", action="store_true", help="shopping-days: exclude Saturdays")
+    exporter.add_argument("--no-sunday", action="store_true", help="shopping-days: exclude Sundays")
+    exporter.add_argument("--include-restricted", action="store_true",
+                          help="shopping-days: keep shopping restricted days")
+    exporter.add_argument("--shopping-restricted", action="store_true",
+                          help="holidays: only holidays when shopping is restricted")
+    exporter.set_defaults(handler=_export_command)
+
+    annotator = commands.add_parser("annotate", help="add workday, holiday and shopping columns to CSV or NDJSON")
+    annotator.add_argument("input", help="CSV file with header or NDJSON file")
+    annotator.add_argument("-o", "--output", default="-", help="output file, standard output by default")
+    annotator.add_argument("--date-column", default="date", help="column or key holding ISO dates (default date)")
+    annotator.add_argument("--format", choices=("csv", "ndjson"), help="input format, guessed from the extension")
+    annotator.add_argument("--language", choices=("cz", "en"), default="en", help="language of holiday names")
+    annotator.add_argument("--workers", type=int, help="number of worker processes, number of CPUs by default")
+    annotator.add_argument("--chunk-size", type=int, default=10000, help="rows sent to a worker at once")
+    annotator.add_argument("--delimiter", default=",", help="CSV delimiter")
+    annotator.set_defaults(handler=_annotate_command)
+
+    serve = commands.add_parser("serve", help="run the local HTTP/JSON server")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8080)
+    serve.add_argument("--prewarm", type=int, nargs=2, metavar=("START_YEAR", "END_YEAR"))
+    serve.set_defaults(handler=_serve_command)
+
+    return parser
+
+
+def main(argv=None) -> int:
+    args = _parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except BrokenPipeError:
+        # Output closed early, e.g. piped to head
+        sys.stderr.close()
+        return 0
+    except Exception as error:
+        _parser().exit(1, f"czech-workdays: error: {error}\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+"""
+Company calendars: own closures and worked days layered over the national workdays.
+"""
+from array import array
+from datetime import date
+from itertools import accumulate
+from threading import Lock
+from typing import Iterator, Optional
+
+from . import _check_date_range, _shift_workdays, _year_calendar
+
+
+class CompanyCalendar:
+    """
+    Working days of a company: national workdays (see get_workdays()) with extra closures and extra working
+    days on top. A day is either a closure or a working day of the overlay, the last edit wins. Every year keeps
+    its own cached bitmap and cumulative index, editing the overlay invalidates only the years it touches.
+    """
+
+    def __init__(self,
+                 include_saturday: bool = False,
+                 include_sunday: bool = False,
+                 include_holidays: bool = False):
+        """
+        :param include_saturday: Considers Saturdays as working days
+        :param include_sunday: Considers Sundays as working days
+        :param include_holidays: Considers holidays as working days
+        """
+
+        # Verification for include_saturday data type
+        if not isinstance(include_saturday, bool):
+            raise TypeError("include_saturday must be a boolean.")
+
+        # Verification for include_sunday data type
+        if not isinstance(include_sunday, bool):
+            raise TypeError("include_sunday must be a boolean.")
+
+        # Verification for include_holidays data type
+        if not isinstance(include_holidays, bool):
+            raise TypeError("include_holidays must be a boolean.")
+
+        self.include_saturday = include_saturday
+        self.include_sunday = include_sunday
+        self.include_holidays = include_holidays
+
+        # Overlay bitmaps per year, bit i stands for the i-th day of the year
+        self._closures = {}
+        self._working_days = {}
+        # Effective (bitmap, cumulative index) per year
+        self._years = {}
+        self._lock = Lock()
+
+    def _edit(self, start_date: date, end_date: Optional[date], add_to: Optional[dict], remove_from: tuple) -> None:
+        if end_date is None:
+            end_date = start_date
+        _check_date_range(start_date, end_date)
+
+        first = start_date.toordinal()
+        last = end_date.toordinal()
+        with self._lock:
+            for year in range(start_date.year, end_date.year + 1):
+                days = _year_calendar(year).range_mask(first, last)
+                if add_to is not None:
+                    add_to[year] = add_to.get(year, 0) | days
+                for overlay in remove_from:
+                    if year in overlay:
+                        overlay[year] &= ~days
+                # Only the edited years are rebuilt on their next use
+                self._years.pop(year, None)
+
+    def add_closure(self, start_date: date, end_date: Optional[date] = None) -> None:
+        """
+        Marks a day or a range of days (both included) as non-working, e.g. company holiday.
+
+        :param start_date: Closed day or first day of the range (datetime.date)
+        :param end_date: Last day of the range (datetime.date), only start_date is closed if None
+        """
+        self._edit(start_date, end_date, self._closures, (self._working_days,))
+
+    def add_working_day(self, start_date: date, end_date: Optional[date] = None) -> None:
+        """
+        Marks a day or a range of days (both included) as working, e.g. worked Saturday.
+
+        :param start_date: Working day or first day of the range (datetime.date)
+        :param end_date: Last day of the range (datetime.date), only start_date is added if None
+        """
+        self._edit(start_date, end_date, self._working_days, (self._closures,))
+
+    def remove_overlay(self, start_date: date, end_date: Optional[date] = None) -> None:
+        """
+        Removes closures and working days of the overlay from a day or a range of days (both included),
+        the days follow national workdays again.
+
+        :param start_date: Day or first day of the range (datetime.date)
+        :param end_date: Last day of the range (datetime.date), only start_date is reset if None
+        """
+        self._edit(start_date, end_date, None, (self._closures, self._working_days))
+
+    def _year(self, year: int) -> tuple:
+        """Gets effective (bitmap, cumulative index) of a year."""
+        cached = self._years.get(year)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            calendar = _year_calendar(year)
+            mask = calendar.workday_mask(self.include_saturday, self.include_sunday, self.include_holidays)
+            mask = (mask | self._working_days.get(year, 0)) & ~self._closures.get(year, 0)
+            prefix = array("H", accumulate(calendar.bits(mask), initial=0))
+            cached = self._years[year] = (mask, prefix)
+        return cached
+
+    def _year_prefix(self, year: int) -> tuple:
+        return _year_calendar(year).first_ordinal, self._year(year)[1]
+
+    def cached_years(self) -> list:
+        """Gets years whose effective workdays are cached, sorted."""
+        return sorted(self._years)
+
+    def is_workday(self, day: date) -> bool:
+        """
+        Checks whether a single date is a working day of the company.
+
+        :param day: Date to check (datetime.date)
+        :return: True if the day is a working day
+        """
+
+        # Verification for day data type
+        if not isinstance(day, date):
+            raise TypeError("day must be a datetime.date.")
+
+        mask = self._year(day.year)[0]
+        return mask >> (day.toordinal() - _year_calendar(day.year).first_ordinal) & 1 == 1
+
+    def get_workdays(self, year: int) -> list:
+        """
+        Gets all working days of the company in a given year.
+
+        :param year: Desired year (int)
+        :return: List of all working days -> [datetime.date(2023, 1, 2), ...]
+        """
+
+        # Verification for year data type
+        if not isinstance(year, int):
+            raise TypeError("Year must be an integer.")
+
+        return _year_calendar(year).select(self._year(year)[0])
+
+    def iter_workdays(self, start_date: date, end_date: date) -> Iterator[date]:
+        """
+        Lazily yields working days of the company between two dates (both included) in date order.
+
+        :param start_date: First day of the range (datetime.date)
+        :param end_date: Last day of the range (datetime.date)
+        :return: Iterator of working days -> datetime.date(2023, 1, 2), ...
+        """
+        _check_date_range(start_date, end_date)
+        return self._iter_workdays(start_date, end_date)
+
+    def _iter_workdays(self, start_date: date, end_date: date) -> Iterator[date]:
+        first = start_date.toordinal()
+        last = end_date.toordinal()
+        for year in range(start_date.year, end_date.year + 1):
+            calendar = _year_calendar(year)
+            yield from calendar.select(self._year(year)[0] & calendar.range_mask(first, last))
+
+    def count_workdays(self, start_date: date, end_date: date) -> int:
+        """
+        Counts working days of the company between two dates (both included) from the per-year cumulative indexes.
+
+        :param start_date: First day of the range (datetime.date)
+        :param end_date: Last day of the range (datetime.date)
+        :return: Number of working days in the range, 0 if end_date is before start_date
+        """
+        _check_date_range(start_date, end_date)
+
+        workdays = 0
+        for year in range(start_date.year, end_date.year + 1):
+            calendar = _year_calendar(year)
+            prefix = self._year(year)[1]
+            low = max(start_date.toordinal() - calendar.first_ordinal, 0)
+            high = min(end_date.toordinal() - calendar.first_ordinal + 1, calendar.days)
+            if low < high:
+                workdays += prefix[high] - prefix[low]
+        return workdays
+
+    def add_workdays(self, day: date, workdays: int) -> date:
+        """
+        Adds (or subtracts if negative) a number of working days of the company to a date, with the same rules
+        as czech_workdays_holidays.add_workdays().
+
+        :param day: Starting date (datetime.date)
+        :param workdays: Number of working days to add, may be negative (int)
+        :return: Resulting working day -> datetime.date(2023, 1, 16)
+        """
+
+        # Verification for day data type
+        if not isinstance(day, date):
+            raise TypeError("day must be a datetime.date.")
+
+        # Verification for workdays data type
+        if not isinstance(workdays, int):
+            raise TypeError("workdays must be an integer.")
+
+        if workdays == 0:
+            if self.is_workday(day):
+                return day
+            workdays = 1
+
+        return _shift_workdays(day, workdays, self._year_prefix)
+
+    def next_workday(self, day: date) -> date:
+        """Gets the first working day of the company after a date."""
+        return self.add_workdays(day, 1)
+
+    def previous_workday(self, day: date) -> date:
+        """Gets the last working day of the company before a date."""
+        return self.add_workdays(day, -1)
+
+    def closures(self) -> list:
+        """Gets all closures of the overlay, sorted."""
+        return self._overlay_dates(self._closures)
+
+    def working_days(self) -> list:
+        """Gets all extra working days of the overlay, sorted."""
+        return self._overlay_dates(self._working_days)
+
+    @staticmethod
+    def _overlay_dates(overlay: dict) -> list:
+        return [day for year in sorted(overlay) for day in _year_calendar(year).select(overlay[year])]
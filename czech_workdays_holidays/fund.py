@@ -0,0 +1,126 @@
+"""
+Working time fund per month, ISO week or quarter, e.g. for payroll.
+"""
+from array import array
+from datetime import date
+from itertools import accumulate
+from typing import NamedTuple
+
+from . import UnsupportedYearError, _year_calendar
+
+_PERIODS = ("month", "week", "quarter")
+
+
+class WorkingTimeFund(NamedTuple):
+    """Counts of one period, holidays are counted as days (two holidays on one day count once)."""
+    year: int
+    # Month 1-12, ISO week 1-53 (year is ISO year) or quarter 1-4
+    period: int
+    start_date: date
+    end_date: date
+    workdays: int
+    hours: float
+    holidays_on_weekdays: int
+    holidays_on_weekends: int
+
+
+def _periods(start_year: int, end_year: int, period: str) -> list:
+    """Gets (year, period, first ordinal, last ordinal) of all periods of a year range."""
+    periods = []
+    if period == "week":
+        # ISO week 1 contains January 4th, weeks start on Monday
+        first = date(start_year, 1, 4).toordinal() - date(start_year, 1, 4).weekday()
+        last = date(end_year, 12, 28).toordinal() - date(end_year, 12, 28).weekday() + 6
+        for monday in range(first, last, 7):
+            year, week, _ = date.fromordinal(monday).isocalendar()
+            periods.append((year, week, monday, monday + 6))
+        return periods
+
+    months = 1 if period == "month" else 3
+    for year in range(start_year, end_year + 1):
+        for number, month in enumerate(range(1, 13, months), start=1):
+            first = date(year, month, 1).toordinal()
+            last = (date(year + 1, 1, 1) if month + months > 12 else date(year, month + months, 1)).toordinal() - 1
+            periods.append((year, number, first, last))
+    return periods
+
+
+def get_working_time_fund(start_year: int,
+                          end_year: int,
+                          period: str = "month",
+                          hours_per_day: float = 8,
+                          include_saturday: bool = False,
+                          include_sunday: bool = False) -> list:
+    """
+    Gets working time fund of every period of a year range: working days, working hours, holidays falling on
+    weekdays and holidays falling on weekends. Counts are differences of cumulative per-year counts, built once
+    per year, without iterating over days of the periods.
+
+    :param start_year: First year (int)
+    :param end_year: Last year, included (int)
+    :param period: "month", "week" (ISO weeks of ISO years) or "quarter"
+    :param hours_per_day: Working hours of one working day (int or float)
+    :param include_saturday: Counts also Saturdays as working days
+    :param include_sunday: Counts also Sundays as working days
+    :return: List of WorkingTimeFund -> [WorkingTimeFund(year=2023, period=1, start_date=datetime.date(2023, 1, 1),
+            end_date=datetime.date(2023, 1, 31), workdays=22, hours=176, holidays_on_weekdays=0,
+            holidays_on_weekends=1), ...]
+    """
+
+    # Verification for start_year data type
+    if not isinstance(start_year, int):
+        raise TypeError("start_year must be an integer.")
+
+    # Verification for end_year data type
+    if not isinstance(end_year, int):
+        raise TypeError("end_year must be an integer.")
+
+    # Verification for period value
+    if period not in _PERIODS:
+        raise ValueError(f"period must be one of {', '.join(_PERIODS)}.")
+
+    # Verification for hours_per_day data type
+    if isinstance(hours_per_day, bool) or not isinstance(hours_per_day, (int, float)):
+        raise TypeError("hours_per_day must be a number.")
+
+    # Verification for include_saturday data type
+    if not isinstance(include_saturday, bool):
+        raise TypeError("include_saturday must be a boolean.")
+
+    # Verification for include_sunday data type
+    if not isinstance(include_sunday, bool):
+        raise TypeError("include_sunday must be a boolean.")
+
+    if start_year < 2001:
+        raise UnsupportedYearError("Data are valid since year 2001")
+
+    if end_year < start_year:
+        return []
+
+    # Cumulative counts of every needed calendar year, a period is then a difference of two items
+    prefixes = {}
+    periods = _periods(start_year, end_year, period)
+    for year in range(date.fromordinal(periods[0][2]).year, date.fromordinal(periods[-1][3]).year + 1):
+        calendar = _year_calendar(year)
+        weekends = calendar.saturdays | calendar.sundays
+        prefixes[year] = (calendar.first_ordinal, calendar.days,
+                          calendar.workday_prefix(include_saturday, include_sunday, False),
+                          array("H", accumulate(calendar.bits(calendar.holidays & ~weekends), initial=0)),
+                          array("H", accumulate(calendar.bits(calendar.holidays & weekends), initial=0)))
+
+    fund = []
+    for year, number, first, last in periods:
+        start_date = date.fromordinal(first)
+        end_date = date.fromordinal(last)
+        counts = [0, 0, 0]
+        # A period spans at most two calendar years (ISO weeks around New Year)
+        for calendar_year in range(start_date.year, end_date.year + 1):
+            first_ordinal, days, *year_prefixes = prefixes[calendar_year]
+            low = max(first - first_ordinal, 0)
+            high = min(last - first_ordinal + 1, days)
+            for index, prefix in enumerate(year_prefixes):
+                counts[index] += prefix[high] - prefix[low]
+        workdays, holidays_on_weekdays, holidays_on_weekends = counts
+        fund.append(WorkingTimeFund(year, number, start_date, end_date, workdays, workdays * hours_per_day,
+                                    holidays_on_weekdays, holidays_on_weekends))
+    return fund
@@ -0,0 +1,182 @@
+"""
+Opt-in instrumentation of calls: counts, latency histograms and allocated memory blocks of public functions and
+internal stages (year build, holiday generation, Easter, day selection, ...).
+
+Nothing is measured and no wrapper is installed while no Instrumentation is running. Starting the first one replaces
+functions of the package and its loaded modules by measuring wrappers, stopping the last one restores them. Names
+imported by ``from czech_workdays_holidays import ...`` in other modules keep the original functions, call them
+through the package (``czech_workdays_holidays.get_workdays``) to have them measured.
+"""
+import sys
+import threading
+from functools import wraps
+from time import perf_counter
+from types import FunctionType
+from typing import Callable, Optional
+
+from . import _LAZY_ATTRIBUTES, _CalendarTable, _YearCalendar
+
+_PACKAGE = __package__
+
+_PUBLIC_FUNCTIONS = ("get_holidays", "get_holiday_records", "get_workdays", "get_shopping_days",
+                     "get_holidays_during_weekend", "get_workdays_during_weekend", "is_workday", "is_holiday",
+                     "is_shopping_day", "count_workdays", "add_workdays", "next_workday", "previous_workday",
+                     "iter_workdays", "iter_shopping_days", "iter_holidays", "prewarm_cache")
+
+# Internal functions and methods measured as stages
+_STAGE_FUNCTIONS = {
+    "_compile_holidays": "stage.holiday_generation",
+    "_easter": "stage.easter",
+    "_shift_workdays": "stage.workday_shift",
+}
+_STAGE_METHODS = (
+    (_YearCalendar, "__init__", "stage.year_build"),
+    (_YearCalendar, "select", "stage.day_selection"),
+    (_YearCalendar, "workday_prefix", "stage.workday_prefix"),
+    (_CalendarTable, "_load", "stage.table_load"),
+)
+
+_running = []
+_patches = []
+# Wrappers by their id, with the wrapped originals, to find wrappers imported by modules loaded while running
+_wrappers = {}
+_lock = threading.Lock()
+
+
+class Instrumentation:
+    """
+    Recorder of measured calls, used as a context manager or by start() and stop(). Iterators (iter_workdays(), ...)
+    are measured only till they are created, their days are produced later.
+    """
+
+    def __init__(self, callback: Optional[Callable[[str, float, int], None]] = None):
+        """
+        :param callback: Called after every measured call with its name, seconds and number of allocated memory
+                blocks (may be negative if memory was released), e.g. to feed an own metrics system
+        """
+        self.callback = callback
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float, allocated_blocks: int) -> None:
+        # Latency histogram has power of two buckets in microseconds
+        bucket = 1 << int(seconds * 1000000).bit_length()
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = [0, 0.0, 0.0, 0, {}]
+            metric[0] += 1
+            metric[1] += seconds
+            metric[2] = max(metric[2], seconds)
+            metric[3] += allocated_blocks
+            metric[4][bucket] = metric[4].get(bucket, 0) + 1
+        if self.callback is not None:
+            self.callback(name, seconds, allocated_blocks)
+
+    def as_dict(self) -> dict:
+        """
+        Exports recorded metrics, histogram keys are exclusive upper bounds of call latency in microseconds.
+
+        :return: {"get_workdays": {"calls": 2, "total_seconds": 0.0001, "mean_seconds": 0.00005,
+                "max_seconds": 0.00008, "allocated_blocks": 520, "latency_histogram_us": {64: 1, 128: 1}}, ...}
+        """
+        with self._lock:
+            return {name: {"calls": calls,
+                           "total_seconds": total,
+                           "mean_seconds": total / calls,
+                           "max_seconds": maximum,
+                           "allocated_blocks": blocks,
+                           "latency_histogram_us": dict(sorted(histogram.items()))}
+                    for name, (calls, total, maximum, blocks, histogram) in sorted(self._metrics.items())}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._metrics.clear()
+
+    def start(self) -> "Instrumentation":
+        with _lock:
+            if self not in _running:
+                if not _running:
+                    _install()
+                _running.append(self)
+        return self
+
+    def stop(self) -> None:
+        with _lock:
+            if self in _running:
+                _running.remove(self)
+                if not _running:
+                    _uninstall()
+
+    def __enter__(self) -> "Instrumentation":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def _measured(name: str, function):
+    getallocatedblocks = sys.getallocatedblocks
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        blocks = getallocatedblocks()
+        start = perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            seconds = perf_counter() - start
+            allocated_blocks = getallocatedblocks() - blocks
+            for instrumentation in tuple(_running):
+                instrumentation.record(name, seconds, allocated_blocks)
+
+    _wrappers[id(wrapper)] = (wrapper, function)
+    return wrapper
+
+
+def _loaded_modules() -> list:
+    return [module for name, module in list(sys.modules.items())
+            if module is not None and (name == _PACKAGE or name.startswith(_PACKAGE + "."))]
+
+
+def _patch(owner, attribute: str, wrapper) -> None:
+    _patches.append((owner, attribute, getattr(owner, attribute)))
+    setattr(owner, attribute, wrapper)
+
+
+def _install() -> None:
+    package = sys.modules[_PACKAGE]
+    # Loaded modules of the package refer to functions imported from it
+    modules = _loaded_modules()
+
+    functions = {name: name for name in _PUBLIC_FUNCTIONS}
+    functions.update(_STAGE_FUNCTIONS)
+    for name, module_name in _LAZY_ATTRIBUTES.items():
+        module = sys.modules.get(f"{_PACKAGE}.{module_name}")
+        if module is not None and type(getattr(module, name, None)) is FunctionType:
+            functions[name] = name
+            setattr(package, name, getattr(module, name))
+
+    for name, metric in functions.items():
+        original = getattr(package, name)
+        wrapper = _measured(metric, original)
+        for module in modules:
+            if getattr(module, name, None) is original:
+                _patch(module, name, wrapper)
+
+    for owner, attribute, metric in _STAGE_METHODS:
+        _patch(owner, attribute, _measured(metric, getattr(owner, attribute)))
+
+
+def _uninstall() -> None:
+    while _patches:
+        owner, attribute, original = _patches.pop()
+        setattr(owner, attribute, original)
+
+    # Modules imported while running took wrappers by "from . import ..."
+    for module in _loaded_modules():
+        for attribute, value in list(vars(module).items()):
+            wrapped = _wrappers.get(id(value))
+            if wrapped is not None and wrapped[0] is value:
+                setattr(module, attribute, wrapped[1])
+    _wrappers.clear()
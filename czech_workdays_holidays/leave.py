@@ -0,0 +1,125 @@
+"""
+Placement of leave days joining weekends and holidays into the longest breaks.
+"""
+from bisect import bisect_left, bisect_right
+from datetime import date
+from itertools import compress
+from typing import NamedTuple
+
+from . import UnsupportedYearError, _year_calendar
+
+
+class LeaveWindow(NamedTuple):
+    """Consecutive days off (both dates included) reached by taking leave on leave_dates."""
+    start_date: date
+    end_date: date
+    days_off: int
+    leave_dates: tuple
+
+
+def find_leave_windows(start_year: int,
+                       end_year: int,
+                       leave_days: int,
+                       top: int = 5,
+                       overlapping: bool = False,
+                       include_saturday: bool = False,
+                       include_sunday: bool = False) -> list:
+    """
+    Finds the longest breaks reachable by taking a number of leave days on consecutive working days. Every break
+    that cannot be extended is leave on workdays i..i+leave_days-1 joined with the days off around them, so breaks
+    are lengths of a sliding window over positions of workdays, computed without iterating over days. Leave is taken
+    only on workdays of the year range, breaks are reported whole, so a break spanning New Year at either end of the
+    range includes its days off outside the range.
+
+    :param start_year: First year (int)
+    :param end_year: Last year, included (int)
+    :param leave_days: Number of leave days to take, 0 finds the longest breaks without leave (int)
+    :param top: Number of breaks to return (int)
+    :param overlapping: Returns also breaks overlapping a longer break, e.g. the same holidays with leave shifted
+    :param include_saturday: Considers Saturdays as working days
+    :param include_sunday: Considers Sundays as working days
+    :return: List of LeaveWindow sorted from the longest, then by start ->
+            [LeaveWindow(start_date=datetime.date(2023, 12, 23), end_date=datetime.date(2024, 1, 1), days_off=10,
+            leave_dates=(datetime.date(2023, 12, 27), ...)), ...]
+    """
+
+    # Verification for start_year data type
+    if not isinstance(start_year, int):
+        raise TypeError("start_year must be an integer.")
+
+    # Verification for end_year data type
+    if not isinstance(end_year, int):
+        raise TypeError("end_year must be an integer.")
+
+    # Verification for leave_days data type and value
+    if not isinstance(leave_days, int) or isinstance(leave_days, bool):
+        raise TypeError("leave_days must be an integer.")
+    if leave_days < 0:
+        raise ValueError("leave_days must not be negative.")
+
+    # Verification for top data type and value
+    if not isinstance(top, int) or isinstance(top, bool):
+        raise TypeError("top must be an integer.")
+    if top < 1:
+        raise ValueError("top must be positive.")
+
+    # Verification for overlapping data type
+    if not isinstance(overlapping, bool):
+        raise TypeError("overlapping must be a boolean.")
+
+    # Verification for include_saturday data type
+    if not isinstance(include_saturday, bool):
+        raise TypeError("include_saturday must be a boolean.")
+
+    # Verification for include_sunday data type
+    if not isinstance(include_sunday, bool):
+        raise TypeError("include_sunday must be a boolean.")
+
+    if start_year < 2001:
+        raise UnsupportedYearError("Data are valid since year 2001")
+
+    if end_year < start_year:
+        return []
+
+    # Ordinals of workdays of the range and of one year around it, so breaks spanning New Year are not cut at the
+    # range; days just outside the scanned years are treated as workdays
+    first_ordinal = date(start_year, 1, 1).toordinal()
+    last_ordinal = date(end_year, 12, 31).toordinal()
+    scan_start = max(start_year - 1, 2001)
+    scan_end = min(end_year + 1, 9999)
+    workdays = [date(scan_start, 1, 1).toordinal() - 1]
+    for year in range(scan_start, scan_end + 1):
+        calendar = _year_calendar(year)
+        mask = calendar.workday_mask(include_saturday, include_sunday, False)
+        ordinals = range(calendar.first_ordinal, calendar.first_ordinal + calendar.days)
+        workdays.extend(compress(ordinals, calendar.bits(mask)))
+    workdays.append(date(scan_end, 12, 31).toordinal() + 1)
+
+    # Leave is taken only on workdays of the range, workdays[low:high]
+    low = bisect_left(workdays, first_ordinal)
+    high = bisect_right(workdays, last_ordinal)
+
+    # Break with leave on workdays[i:i + leave_days] lasts from workdays[i - 1] + 1 till workdays[i + leave_days] - 1
+    leave_days = min(leave_days, high - low)
+    indexes = range(low, high - leave_days + 1) if leave_days else range(low, high + 1)
+    candidates = sorted(indexes, key=lambda index: (workdays[index - 1] - workdays[index + leave_days], index))
+
+    windows = []
+    for index in candidates:
+        start = workdays[index - 1] + 1
+        end = workdays[index + leave_days] - 1
+        if end < start:
+            # Only neighbouring workdays remain, thus no break at all
+            break
+        if end < first_ordinal or last_ordinal < start:
+            # Break without leave outside the range
+            continue
+        if not overlapping and any(start <= window[1] and window[0] <= end for window in windows):
+            continue
+        windows.append((start, end, index))
+        if len(windows) == top:
+            break
+
+    return [LeaveWindow(date.fromordinal(start), date.fromordinal(end), end - start + 1,
+                        tuple(map(date.fromordinal, workdays[index:index + leave_days])))
+            for start, end, index in windows]
@@ -0,0 +1,141 @@
+"""
+Positions of working days within months, e.g. "the 3rd working day of the month" for payroll and invoicing.
+"""
+from datetime import date
+from typing import Optional
+
+from . import _year_calendar
+
+
+def _check_options(include_saturday: bool, include_sunday: bool, include_holidays: bool) -> None:
+    # Verification for include_saturday data type
+    if not isinstance(include_saturday, bool):
+        raise TypeError("include_saturday must be a boolean.")
+
+    # Verification for include_sunday data type
+    if not isinstance(include_sunday, bool):
+        raise TypeError("include_sunday must be a boolean.")
+
+    # Verification for include_holidays data type
+    if not isinstance(include_holidays, bool):
+        raise TypeError("include_holidays must be a boolean.")
+
+
+def _check_n(n: int) -> None:
+    # Verification for n data type and value
+    if not isinstance(n, int) or isinstance(n, bool):
+        raise TypeError("n must be an integer.")
+    if n == 0:
+        raise ValueError("n must not be zero, working days are counted from 1 (or from -1 at the end).")
+
+
+def _nth(workdays: tuple, n: int) -> Optional[date]:
+    if n > len(workdays) or -n > len(workdays):
+        return None
+    return workdays[n - 1 if n > 0 else n]
+
+
+def nth_workday(year: int,
+                month: int,
+                n: int,
+                include_saturday: bool = False,
+                include_sunday: bool = False,
+                include_holidays: bool = False) -> Optional[date]:
+    """
+    Gets the n-th working day of a month from the per-month index of the cached year. Parameters include_* have
+    the same meaning as in get_workdays().
+
+    :param year: Year (int)
+    :param month: Month 1-12 (int)
+    :param n: Position of the working day, 1 is the first one, -1 the last one (int)
+    :param include_saturday: Considers Saturdays as working days
+    :param include_sunday: Considers Sundays as working days
+    :param include_holidays: Considers holidays as working days
+    :return: datetime.date(2024, 1, 4) or None if the month has fewer working days
+    """
+
+    # Verification for year data type
+    if not isinstance(year, int):
+        raise TypeError("year must be an integer.")
+
+    # Verification for month data type and value
+    if not isinstance(month, int) or isinstance(month, bool):
+        raise TypeError("month must be an integer.")
+    if not 1 <= month <= 12:
+        raise ValueError("month must be in 1..12.")
+
+    _check_n(n)
+    _check_options(include_saturday, include_sunday, include_holidays)
+
+    months = _year_calendar(year).month_workdays(include_saturday, include_sunday, include_holidays)
+    return _nth(months[month - 1], n)
+
+
+def last_workday_of_month(year: int,
+                          month: int,
+                          include_saturday: bool = False,
+                          include_sunday: bool = False,
+                          include_holidays: bool = False) -> Optional[date]:
+    """
+    Gets the last working day of a month. Parameters have the same meaning as in nth_workday().
+
+    :return: datetime.date(2024, 12, 31)
+    """
+    return nth_workday(year, month, -1, include_saturday, include_sunday, include_holidays)
+
+
+def workday_of_month(day: date,
+                     include_saturday: bool = False,
+                     include_sunday: bool = False,
+                     include_holidays: bool = False) -> Optional[int]:
+    """
+    Gets the position of a working day within its month, i.e. inverse of nth_workday(). Parameters include_* have
+    the same meaning as in get_workdays().
+
+    :param day: Date (datetime.date)
+    :return: 3 for the 3rd working day of the month or None if the day is not a working day
+    """
+
+    # Verification for day data type
+    if not isinstance(day, date):
+        raise TypeError("day must be a datetime.date.")
+
+    _check_options(include_saturday, include_sunday, include_holidays)
+
+    calendar = _year_calendar(day.year)
+    offset = calendar.offset(day)
+    if not calendar.workday_mask(include_saturday, include_sunday, include_holidays) >> offset & 1:
+        return None
+    prefix = calendar.workday_prefix(include_saturday, include_sunday, include_holidays)
+    return prefix[offset + 1] - prefix[calendar.month_starts[day.month - 1]]
+
+
+def get_nth_workdays(start_year: int,
+                     end_year: int,
+                     n: int = 1,
+                     include_saturday: bool = False,
+                     include_sunday: bool = False,
+                     include_holidays: bool = False) -> list:
+    """
+    Gets the n-th working day of every month of a year range. Parameters have the same meaning as in nth_workday().
+
+    :param start_year: First year (int)
+    :param end_year: Last year, included (int)
+    :return: List of 12 items per year, item ``(year - start_year) * 12 + month - 1`` is the n-th working day of
+            the month or None if the month has fewer working days -> [datetime.date(2024, 1, 2), ...]
+    """
+
+    # Verification for start_year data type
+    if not isinstance(start_year, int):
+        raise TypeError("start_year must be an integer.")
+
+    # Verification for end_year data type
+    if not isinstance(end_year, int):
+        raise TypeError("end_year must be an integer.")
+
+    _check_n(n)
+    _check_options(include_saturday, include_sunday, include_holidays)
+
+    return [_nth(workdays, n)
+            for year in range(start_year, end_year + 1)
+            for workdays in _year_calendar(year).month_workdays(include_saturday, include_sunday, include_holidays)]
@@ -0,0 +1,236 @@
+"""
+Vectorized NumPy layer over Czech workdays, holidays and shopping days.
+
+Requires NumPy which is an optional dependency: pip install czech-workdays-holidays[numpy]
+"""
+from datetime import date
+from functools import lru_cache
+
+import numpy as np
+
+from . import UnsupportedYearError, _year_calendar
+
+# Ordinal of 1970-01-01, datetime64[D] counts days since this date
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _mask_to_days(mask: int, first_ordinal: int, days: int) -> np.ndarray:
+    """Converts a per-year bitmap into datetime64[D] array of days whose bit is set."""
+    bits = np.frombuffer(bin(mask)[2:].zfill(days)[::-1].encode(), dtype=np.uint8) == ord("1")
+    return (np.flatnonzero(bits) + (first_ordinal - _EPOCH_ORDINAL)).astype("datetime64[D]")
+
+
+def _weekmask(include_saturday: bool, include_sunday: bool) -> str:
+    return "11111" + ("1" if include_saturday else "0") + ("1" if include_sunday else "0")
+
+
+def _year_range(dates: np.ndarray) -> tuple:
+    years = dates[~np.isnat(dates)].astype("datetime64[Y]").astype(np.int64) + 1970
+    if years.size == 0:
+        return 2001, 2001
+    return int(years.min()), int(years.max())
+
+
+def _as_days(dates) -> np.ndarray:
+    return np.asarray(dates, dtype="datetime64[D]")
+
+
+def get_holidays_array(start_year: int, end_year: int, shopping_restricted: bool = False) -> np.ndarray:
+    """
+    Exports holidays of a year range as sorted datetime64[D] array without duplicates.
+
+    :param start_year: First year of the range (int)
+    :param end_year: Last year of the range (int)
+    :param shopping_restricted: If true, returns only days when shopping is restricted
+    :return: Array of holidays -> array(['2023-01-01', '2023-04-07', ...], dtype='datetime64[D]')
+    """
+
+    # Verification for start_year and end_year data type
+    if not isinstance(start_year, int) or not isinstance(end_year, int):
+        raise TypeError("Year must be an integer.")
+
+    # Verification for shopping_restricted data type
+    if not isinstance(shopping_restricted, bool):
+        raise TypeError("shopping_restricted must be a boolean.")
+
+    if start_year < 2001:
+        raise UnsupportedYearError("Data are valid since year 2001")
+
+    return _holidays_array(start_year, end_year, shopping_restricted).copy()
+
+
+@lru_cache(maxsize=64)
+def _holidays_array(start_year: int, end_year: int, shopping_restricted: bool) -> np.ndarray:
+    holidays = []
+    for year in range(start_year, end_year + 1):
+        calendar = _year_calendar(year)
+        mask = calendar.shopping_restricted if shopping_restricted else calendar.holidays
+        holidays.append(_mask_to_days(mask, calendar.first_ordinal, calendar.days))
+    return np.concatenate(holidays) if holidays else np.array([], dtype="datetime64[D]")
+
+
+def get_busdaycalendar(start_year: int,
+                       end_year: int,
+                       include_saturday: bool = False,
+                       include_sunday: bool = False,
+                       include_holidays: bool = False) -> np.busdaycalendar:
+    """
+    Exports Czech workdays of a year range as numpy.busdaycalendar to be used with numpy.is_busday(),
+    numpy.busday_count() and numpy.busday_offset(). Parameters have the same meaning as in get_workdays().
+    Holidays are known only inside the year range, days outside it are treated as if there were no holidays.
+
+    :param start_year: First year of the range (int)
+    :param end_year: Last year of the range (int)
+    :param include_saturday: Considers Saturdays as working days
+    :param include_sunday: Considers Sundays as working days
+    :param include_holidays: Considers holidays as working days
+    :return: numpy.busdaycalendar
+    """
+
+    # Verification for start_year and end_year data type
+    if not isinstance(start_year, int) or not isinstance(end_year, int):
+        raise TypeError("Year must be an integer.")
+
+    # Verification for include_saturday data type
+    if not isinstance(include_saturday, bool):
+        raise TypeError("include_saturday must be a boolean.")
+
+    # Verification for include_sunday data type
+    if not isinstance(include_sunday, bool):
+        raise TypeError("include_sunday must be a boolean.")
+
+    # Verification for include_holidays data type
+    if not isinstance(include_holidays, bool):
+        raise TypeError("include_holidays must be a boolean.")
+
+    if not include_holidays and start_year < 2001:
+        raise UnsupportedYearError("Data are valid since year 2001")
+
+    return _workday_calendar(start_year, end_year, include_saturday, include_sunday, include_holidays)
+
+
+@lru_cache(maxsize=64)
+def _workday_calendar(start_year: int, end_year: int, include_saturday: bool, include_sunday: bool,
+                      include_holidays: bool) -> np.busdaycalendar:
+    holidays = [] if include_holidays else _holidays_array(start_year, end_year, False)
+    return np.busdaycalendar(weekmask=_weekmask(include_saturday, include_sunday), holidays=holidays)
+
+
+@lru_cache(maxsize=64)
+def _shopping_calendar(start_year: int, end_year: int, include_saturday: bool, include_sunday: bool,
+                       exclude_shopping_restricted_days: bool) -> np.busdaycalendar:
+    if exclude_shopping_restricted_days:
+        holidays = _holidays_array(max(start_year, 2001), end_year, True) if end_year >= 2001 else []
+    else:
+        holidays = []
+    return np.busdaycalendar(weekmask=_weekmask(include_saturday, include_sunday), holidays=holidays)
+
+
+def is_workday(dates,
+               include_saturday: bool = False,
+               include_sunday: bool = False,
+               include_holidays: bool = False) -> np.ndarray:
+    """
+    Vectorized version of czech_workdays_holidays.is_workday().
+
+    :param dates: Array-like of dates convertible to datetime64[D]
+    :return: Boolean array, True where the date is a working day, False for NaT
+    """
+    dates = _as_days(dates)
+    start_year, end_year = _year_range(dates)
+    calendar = get_busdaycalendar(start_year, end_year, include_saturday, include_sunday, include_holidays)
+    return np.is_busday(dates, busdaycal=calendar) & ~np.isnat(dates)
+
+
+def is_shopping_day(dates,
+                    include_saturday: bool = True,
+                    include_sunday: bool = True,
+                    exclude_shopping_restricted_days: bool = True) -> np.ndarray:
+    """
+    Vectorized version of czech_workdays_holidays.is_shopping_day().
+
+    :param dates: Array-like of dates convertible to datetime64[D]
+    :return: Boolean array, True where the date is a shopping day, False for NaT
+    """
+
+    # Verification for include_saturday data type
+    if not isinstance(include_saturday, bool):
+        raise TypeError("include_saturday must be a boolean.")
+
+    # Verification for include_sunday data type
+    if not isinstance(include_sunday, bool):
+        raise TypeError("include_sunday must be a boolean.")
+
+    # Verification for exclude_shopping_restricted_days data type
+    if not isinstance(exclude_shopping_restricted_days, bool):
+        raise TypeError("exclude_shopping_restricted_days must be a boolean.")
+
+    dates = _as_days(dates)
+    start_year, end_year = _year_range(dates)
+    calendar = _shopping_calendar(start_year, end_year, include_saturday, include_sunday,
+                                  exclude_shopping_restricted_days)
+    return np.is_busday(dates, busdaycal=calendar) & ~np.isnat(dates)
+
+
+def count_workdays(start_dates,
+                   end_dates,
+                   include_saturday: bool = False,
+                   include_sunday: bool = False,
+                   include_holidays: bool = False) -> np.ndarray:
+    """
+    Vectorized version of czech_workdays_holidays.count_workdays(), both dates of each range are included.
+
+    :param start_dates: Array-like of first days of the ranges, without NaT
+    :param end_dates: Array-like of last days of the ranges, without NaT
+    :return: Integer array of working days in the ranges, 0 where end date is before start date
+    """
+    start_dates = _as_days(start_dates)
+    end_dates = _as_days(end_dates)
+
+    # Verification for NaT, a count of an unknown range cannot be stored in an integer array
+    if np.isnat(start_dates).any() or np.isnat(end_dates).any():
+        raise ValueError("start_dates and end_dates must not contain NaT.")
+
+    start_year = min(_year_range(start_dates)[0], _year_range(end_dates)[0])
+    end_year = max(_year_range(start_dates)[1], _year_range(end_dates)[1])
+    calendar = get_busdaycalendar(start_year, end_year, include_saturday, include_sunday, include_holidays)
+    return np.maximum(np.busday_count(start_dates, end_dates + np.timedelta64(1, "D"), busdaycal=calendar), 0)
+
+
+def offset_workdays(dates,
+                    workdays,
+                    include_saturday: bool = False,
+                    include_sunday: bool = False,
+                    include_holidays: bool = False) -> np.ndarray:
+    """
+    Vectorized version of czech_workdays_holidays.add_workdays(). The day itself is never counted and offset 0
+    returns the day if it is a working day, otherwise the next working day.
+
+    :param dates: Array-like of starting dates
+    :param workdays: Array-like or int of working days to add, may be negative
+    :return: datetime64[D] array of resulting working days, NaT for NaT
+    """
+    dates = _as_days(dates)
+    workdays = np.asarray(workdays, dtype=np.int64)
+    start_year, end_year = _year_range(dates)
+
+    # Every year has more than 240 working days, so the calendar is extended to cover the largest jump
+    padding = int(np.abs(workdays).max(initial=0)) // 240 + 1
+    end_year = min(end_year + padding, 9998)
+    start_year = start_year - padding
+    if not include_holidays:
+        if start_year + padding < 2001:
+            raise UnsupportedYearError("Data are valid since year 2001")
+        start_year = max(start_year, 2001)
+    calendar = get_busdaycalendar(max(start_year, 1), end_year, include_saturday, include_sunday, include_holidays)
+
+    # Rolling backward to the previous working day does not count the starting day for positive offsets
+    forward = np.busday_offset(dates, workdays, roll="forward", busdaycal=calendar)
+    backward = np.busday_offset(dates, workdays, roll="backward", busdaycal=calendar)
+    result = np.where(workdays > 0, backward, forward)
+
+    if not include_holidays:
+        valid = result[~np.isnat(result)]
+        if valid.size and valid.min() < np.datetime64("2001-01-01"):
+            raise UnsupportedYearError("Data are valid since year 2001")
+    return result
@@ -0,0 +1,117 @@
+"""
+pandas holiday calendar and business day offset for Czech workdays.
+
+Requires pandas which is an optional dependency: pip install czech-workdays-holidays[pandas]
+"""
+from functools import lru_cache
+
+import pandas as pd
+from pandas.tseries.holiday import AbstractHolidayCalendar, Holiday
+from pandas.tseries.offsets import CustomBusinessDay, Day, Easter
+
+from . import UnsupportedYearError, _HOLIDAY_RULES
+from .numpy_calendar import _holidays_array, offset_workdays
+
+
+def _pandas_rule(rule) -> Holiday:
+    """Converts a holiday rule of czech_workdays_holidays into pandas holiday rule."""
+    start_date = pd.Timestamp(rule.valid_from, 1, 1)
+    end_date = pd.Timestamp(rule.valid_to, 12, 31) if rule.valid_to is not None else None
+    if rule.easter_offset is None:
+        return Holiday(rule.holiday_name_en, month=rule.month, day=rule.day, start_date=start_date,
+                       end_date=end_date)
+    return Holiday(rule.holiday_name_en, month=1, day=1, offset=[Easter(), Day(rule.easter_offset)],
+                   start_date=start_date, end_date=end_date)
+
+
+class CzechHolidayCalendar(AbstractHolidayCalendar):
+    """
+    Czech holidays (public and other) as pandas holiday rules, see czech_workdays_holidays.get_holidays().
+    Rules are generated from the same rule table, e.g. Good Friday is valid from 2016.
+    """
+
+    rules = [_pandas_rule(rule) for rule in _HOLIDAY_RULES]
+
+
+def get_holiday_index(start_year: int = 2001, end_year: int = 2200) -> pd.DatetimeIndex:
+    """
+    Gets sorted holidays of a year range without duplicates. The index is cached per year range.
+
+    :param start_year: First year of the range (int)
+    :param end_year: Last year of the range (int)
+    :return: pandas.DatetimeIndex of holidays
+    """
+
+    # Verification for start_year and end_year data type
+    if not isinstance(start_year, int) or not isinstance(end_year, int):
+        raise TypeError("Year must be an integer.")
+
+    if start_year < 2001:
+        raise UnsupportedYearError("Data are valid since year 2001")
+
+    return _holiday_index(start_year, end_year)
+
+
+@lru_cache(maxsize=32)
+def _holiday_index(start_year: int, end_year: int) -> pd.DatetimeIndex:
+    return pd.DatetimeIndex(_holidays_array(start_year, end_year, False), name="holidays")
+
+
+@lru_cache(maxsize=32)
+def czech_business_day(start_year: int = 2001,
+                       end_year: int = 2200,
+                       include_saturday: bool = False,
+                       include_sunday: bool = False,
+                       include_holidays: bool = False) -> CustomBusinessDay:
+    """
+    Gets business day offset over Czech workdays, parameters have the same meaning as in get_workdays().
+    Holidays are known only inside the year range. Offsets are cached, so repeated calls return the same object.
+
+    :param start_year: First year with holidays (int)
+    :param end_year: Last year with holidays (int)
+    :param include_saturday: Considers Saturdays as working days
+    :param include_sunday: Considers Sundays as working days
+    :param include_holidays: Considers holidays as working days
+    :return: pandas.tseries.offsets.CustomBusinessDay
+    """
+
+    # Verification for include_saturday data type
+    if not isinstance(include_saturday, bool):
+        raise TypeError("include_saturday must be a boolean.")
+
+    # Verification for include_sunday data type
+    if not isinstance(include_sunday, bool):
+        raise TypeError("include_sunday must be a boolean.")
+
+    # Verification for include_holidays data type
+    if not isinstance(include_holidays, bool):
+        raise TypeError("include_holidays must be a boolean.")
+
+    weekmask = "Mon Tue Wed Thu Fri" + (" Sat" if include_saturday else "") + (" Sun" if include_sunday else "")
+    holidays = [] if include_holidays else get_holiday_index(start_year, end_year)
+    return CustomBusinessDay(weekmask=weekmask, holidays=holidays)
+
+
+def offset_index(index,
+                 workdays,
+                 include_saturday: bool = False,
+                 include_sunday: bool = False,
+                 include_holidays: bool = False) -> pd.DatetimeIndex:
+    """
+    Vectorized equivalent of index + workdays * CzechBDay. pandas applies CustomBusinessDay to an index element
+    by element, this function shifts the whole index at once with numpy.busday_offset(). Time of day is dropped.
+
+    :param index: DatetimeIndex or array-like of dates
+    :param workdays: Number of working days to add, may be negative (int or array-like)
+    :return: pandas.DatetimeIndex of resulting working days
+    """
+    days = pd.DatetimeIndex(index).values.astype("datetime64[D]")
+    result = offset_workdays(days, workdays, include_saturday, include_sunday, include_holidays)
+    return pd.DatetimeIndex(result.astype("datetime64[ns]"), name=getattr(index, "name", None))
+
+
+def __getattr__(name: str):
+    # CzechBDay is created on first access as it needs the holidays of 2001 - 2200
+    if name == "CzechBDay":
+        return czech_business_day()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
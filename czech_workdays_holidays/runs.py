@@ -0,0 +1,231 @@
+"""
+Run-length encoded sets of days, stored as sorted runs of consecutive days.
+"""
+from array import array
+from bisect import bisect_right
+from datetime import date
+from typing import Iterable, Iterator
+
+from . import _check_date_range, _year_calendar
+
+
+class DateRuns:
+    """
+    Immutable set of days stored as sorted runs (first day, last day) of consecutive days, so memory depends on
+    the number of gaps (weekends, holidays) instead of the number of days. Supports len(), membership test
+    by binary search, iteration in date order, intersection (&), union (|) and hashing.
+    """
+
+    __slots__ = ("_starts", "_ends", "_length")
+
+    def __init__(self, runs: Iterable[tuple] = ()):
+        """
+        :param runs: Iterable of (first day, last day) tuples of datetime.date, both days included, sorted
+                and not overlapping
+        """
+        starts = array("l")
+        ends = array("l")
+        for first, last in runs:
+            self._append(starts, ends, first.toordinal(), last.toordinal())
+        self._set(starts, ends)
+
+    @staticmethod
+    def _append(starts: array, ends: array, first: int, last: int) -> None:
+        if last < first:
+            return
+        if ends and first <= ends[-1] + 1:
+            if first < starts[-1]:
+                raise ValueError("Runs must be sorted.")
+            # Adjacent or overlapping runs are merged
+            ends[-1] = max(ends[-1], last)
+        else:
+            starts.append(first)
+            ends.append(last)
+
+    def _set(self, starts: array, ends: array) -> None:
+        self._starts = starts
+        self._ends = ends
+        self._length = sum(ends) - sum(starts) + len(starts)
+
+    @classmethod
+    def _from_ordinals(cls, starts: array, ends: array) -> "DateRuns":
+        runs = cls.__new__(cls)
+        runs._set(starts, ends)
+        return runs
+
+    @classmethod
+    def from_dates(cls, dates: Iterable[date]) -> "DateRuns":
+        """Creates runs from dates in any order, duplicates are ignored."""
+        starts = array("l")
+        ends = array("l")
+        for ordinal in sorted(set(day.toordinal() for day in dates)):
+            cls._append(starts, ends, ordinal, ordinal)
+        return cls._from_ordinals(starts, ends)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __contains__(self, day) -> bool:
+        if not isinstance(day, date):
+            return False
+        ordinal = day.toordinal()
+        index = bisect_right(self._starts, ordinal) - 1
+        return index >= 0 and ordinal <= self._ends[index]
+
+    def __iter__(self) -> Iterator[date]:
+        for first, last in zip(self._starts, self._ends):
+            yield from map(date.fromordinal, range(first, last + 1))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DateRuns):
+            return NotImplemented
+        return self._starts == other._starts and self._ends == other._ends
+
+    def __hash__(self) -> int:
+        return hash((self._starts.tobytes(), self._ends.tobytes()))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.runs()!r})"
+
+    @property
+    def run_count(self) -> int:
+        """Number of runs of consecutive days."""
+        return len(self._starts)
+
+    def runs(self) -> list:
+        """Gets runs as list of (first day, last day) tuples, both days included."""
+        return [(date.fromordinal(first), date.fromordinal(last)) for first, last in zip(self._starts, self._ends)]
+
+    def to_dates(self) -> list:
+        """Expands runs into a sorted list of all days."""
+        return list(self)
+
+    def intersection(self, other: "DateRuns") -> "DateRuns":
+        """Days that are in both run sets."""
+        starts = array("l")
+        ends = array("l")
+        index = other_index = 0
+        while index < len(self._starts) and other_index < len(other._starts):
+            first = max(self._starts[index], other._starts[other_index])
+            last = min(self._ends[index], other._ends[other_index])
+            if first <= last:
+                starts.append(first)
+                ends.append(last)
+            # The run ending first cannot overlap any further run of the other set
+            if self._ends[index] < other._ends[other_index]:
+                index += 1
+            else:
+                other_index += 1
+        return self._from_ordinals(starts, ends)
+
+    def union(self, other: "DateRuns") -> "DateRuns":
+        """Days that are in any of the run sets."""
+        starts = array("l")
+        ends = array("l")
+        index = other_index = 0
+        while index < len(self._starts) or other_index < len(other._starts):
+            if other_index == len(other._starts) or \
+                    index < len(self._starts) and self._starts[index] <= other._starts[other_index]:
+                self._append(starts, ends, self._starts[index], self._ends[index])
+                index += 1
+            else:
+                self._append(starts, ends, other._starts[other_index], other._ends[other_index])
+                other_index += 1
+        return self._from_ordinals(starts, ends)
+
+    __and__ = intersection
+    __or__ = union
+
+
+def _runs_from_masks(start_date: date, end_date: date, year_mask) -> DateRuns:
+    """
+    Builds runs from per-year bitmaps. Starts and ends of runs are found from bit transitions, so the work
+    per year depends on the number of runs, not on the number of days.
+    """
+    starts = array("l")
+    ends = array("l")
+    first = start_date.toordinal()
+    last = end_date.toordinal()
+    for year in range(start_date.year, end_date.year + 1):
+        calendar = _year_calendar(year)
+        mask = year_mask(calendar) & calendar.range_mask(first, last)
+        run_starts = mask & ~(mask << 1)
+        run_ends = mask & ~(mask >> 1)
+        while run_starts:
+            start_bit = run_starts & -run_starts
+            end_bit = run_ends & -run_ends
+            run_starts ^= start_bit
+            run_ends ^= end_bit
+            DateRuns._append(starts, ends, calendar.first_ordinal + start_bit.bit_length() - 1,
+                             calendar.first_ordinal + end_bit.bit_length() - 1)
+    return DateRuns._from_ordinals(starts, ends)
+
+
+def get_workday_runs(start_date: date,
+                     end_date: date,
+                     include_saturday: bool = False,
+                     include_sunday: bool = False,
+                     include_holidays: bool = False) -> DateRuns:
+    """
+    Gets working days between two dates (both included) as runs of consecutive days. Parameters have the same
+    meaning as in get_workdays().
+
+    :param start_date: First day of the range (datetime.date)
+    :param end_date: Last day of the range (datetime.date)
+    :param include_saturday: Includes also Saturdays in output
+    :param include_sunday: Includes also Sundays in output
+    :param include_holidays: Counts holidays as working days
+    :return: DateRuns([(datetime.date(2023, 1, 2), datetime.date(2023, 1, 6)), ...])
+    """
+    _check_date_range(start_date, end_date)
+
+    # Verification for include_saturday data type
+    if not isinstance(include_saturday, bool):
+        raise TypeError("include_saturday must be a boolean.")
+
+    # Verification for include_sunday data type
+    if not isinstance(include_sunday, bool):
+        raise TypeError("include_sunday must be a boolean.")
+
+    # Verification for include_holidays data type
+    if not isinstance(include_holidays, bool):
+        raise TypeError("include_holidays must be a boolean.")
+
+    return _runs_from_masks(start_date, end_date,
+                            lambda calendar: calendar.workday_mask(include_saturday, include_sunday, include_holidays))
+
+
+def get_shopping_day_runs(start_date: date,
+                          end_date: date,
+                          include_saturday: bool = True,
+                          include_sunday: bool = True,
+                          exclude_shopping_restricted_days: bool = True) -> DateRuns:
+    """
+    Gets shopping days between two dates (both included) as runs of consecutive days. Parameters have the same
+    meaning as in get_shopping_days(). Shopping restriction is applied only to days from 01/10/2016 (DD/MM/YY)
+    when it came into effect.
+
+    :param start_date: First day of the range (datetime.date)
+    :param end_date: Last day of the range (datetime.date)
+    :param include_saturday: Includes also Saturdays in output
+    :param include_sunday: Includes also Sundays in output
+    :param exclude_shopping_restricted_days: Excludes shopping restricted days in output
+    :return: DateRuns([(datetime.date(2023, 1, 2), datetime.date(2023, 4, 9)), ...])
+    """
+    _check_date_range(start_date, end_date)
+
+    # Verification for include_saturday data type
+    if not isinstance(include_saturday, bool):
+        raise TypeError("include_saturday must be a boolean.")
+
+    # Verification for include_sunday data type
+    if not isinstance(include_sunday, bool):
+        raise TypeError("include_sunday must be a boolean.")
+
+    # Verification for exclude_shopping_restricted_days data type
+    if not isinstance(exclude_shopping_restricted_days, bool):
+        raise TypeError("exclude_shopping_restricted_days must be a boolean.")
+
+    return _runs_from_masks(start_date, end_date,
+                            lambda calendar: calendar.shopping_mask(include_saturday, include_sunday,
+                                                                    exclude_shopping_restricted_days))
@@ -0,0 +1,362 @@
+"""
+Local HTTP/JSON server answering Czech workday queries, built on asyncio of the standard library only.
+
+Usage:
+    python -m czech_workdays_holidays.server --port 8080 --prewarm 2001 2100
+
+Endpoints (GET, dates in ISO format YYYY-MM-DD, booleans as true/false):
+    /is_workday?date=2023-12-27&include_saturday=false&include_sunday=false&include_holidays=false
+    /is_holiday?date=2023-12-24
+    /is_shopping_day?date=2023-12-25&include_saturday=true&include_sunday=true&exclude_shopping_restricted_days=true
+    /count_workdays?start_date=2023-01-01&end_date=2023-12-31
+    /add_workdays?date=2023-12-22&workdays=10
+    /holidays?year=2023&shopping_restricted=false
+    /workdays?year=2023
+    /shopping_days?year=2023
+
+Batch endpoint (POST, JSON body):
+    /batch {"dates": ["2023-12-24", "2023-12-27", ...], "include_saturday": false, ...}
+        -> {"results": [{"date": "2023-12-24", "is_workday": false, "is_holiday": true,
+                         "is_shopping_day": true}, ...]}
+
+Connections are kept alive for HTTP/1.1 clients unless they send "Connection: close". GET responses are cached.
+Requests with Transfer-Encoding (e.g. chunked) are refused, bodies must have Content-Length.
+"""
+import argparse
+import asyncio
+import json
+import logging
+from collections import OrderedDict
+from datetime import date
+from urllib.parse import parse_qsl, urlsplit
+
+from . import (get_holidays, get_workdays, get_shopping_days, is_workday, is_holiday, is_shopping_day, count_workdays,
+               add_workdays, prewarm_cache, UnsupportedYearError)
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+            500: "Internal Server Error", 501: "Not Implemented"}
+
+# Requests with larger body are refused
+_MAX_BODY_SIZE = 16 * 1024 * 1024
+
+# Limits of work done by one request inside the event loop, about 400 years of days
+_MAX_WORKDAYS = 100000
+_MAX_YEARS = 400
+_MAX_YEAR = 9999
+
+_logger = logging.getLogger(__name__)
+
+
+class _BadRequest(Exception):
+    pass
+
+
+# Exceptions caused by parameters of a request, other exceptions are errors of the server
+_CLIENT_ERRORS = (_BadRequest, UnsupportedYearError, TypeError, ValueError, OverflowError)
+
+
+def _parse_date(value: str) -> date:
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise _BadRequest(f"Invalid date: {value!r}")
+
+
+def _parse_bool(value, default: bool) -> bool:
+    if value is None:
+        return default
+    if isinstance(value, bool):
+        return value
+    if not isinstance(value, str):
+        raise _BadRequest(f"Invalid boolean: {value!r}")
+    if value.lower() in ("true", "1", "yes"):
+        return True
+    if value.lower() in ("false", "0", "no"):
+        return False
+    raise _BadRequest(f"Invalid boolean: {value!r}")
+
+
+def _parse_int(value) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise _BadRequest(f"Invalid integer: {value!r}")
+
+
+def _parse_year(value) -> int:
+    year = _parse_int(value)
+    if not 1 <= year <= _MAX_YEAR:
+        raise _BadRequest(f"Year must be in 1..{_MAX_YEAR}: {year}")
+    return year
+
+
+def _required(params: dict, name: str):
+    if name not in params:
+        raise _BadRequest(f"Missing parameter: {name}")
+    return params[name]
+
+
+def _workday_options(params: dict) -> tuple:
+    return (_parse_bool(params.get("include_saturday"), False),
+            _parse_bool(params.get("include_sunday"), False),
+            _parse_bool(params.get("include_holidays"), False))
+
+
+def _shopping_options(params: dict) -> tuple:
+    return (_parse_bool(params.get("include_saturday"), True),
+            _parse_bool(params.get("include_sunday"), True),
+            _parse_bool(params.get("exclude_shopping_restricted_days"), True))
+
+
+def _holiday_json(holiday: dict) -> dict:
+    return dict(holiday, date=holiday["date"].isoformat())
+
+
+def _is_workday(params: dict) -> dict:
+    day = _parse_date(_required(params, "date"))
+    return {"date": day.isoformat(), "is_workday": is_workday(day, *_workday_options(params))}
+
+
+def _is_holiday(params: dict) -> dict:
+    day = _parse_date(_required(params, "date"))
+    return {"date": day.isoformat(), "is_holiday": is_holiday(day)}
+
+
+def _is_shopping_day(params: dict) -> dict:
+    day = _parse_date(_required(params, "date"))
+    return {"date": day.isoformat(), "is_shopping_day": is_shopping_day(day, *_shopping_options(params))}
+
+
+def _count_workdays(params: dict) -> dict:
+    start_date = _parse_date(_required(params, "start_date"))
+    end_date = _parse_date(_required(params, "end_date"))
+    if abs(end_date.year - start_date.year) > _MAX_YEARS:
+        raise _BadRequest(f"Range must not span more than {_MAX_YEARS} years")
+    return {"start_date": start_date.isoformat(), "end_date": end_date.isoformat(),
+            "workdays": count_workdays(start_date, end_date, *_workday_options(params))}
+
+
+def _add_workdays(params: dict) -> dict:
+    day = _parse_date(_required(params, "date"))
+    workdays = _parse_int(_required(params, "workdays"))
+    if abs(workdays) > _MAX_WORKDAYS:
+        raise _BadRequest(f"workdays must be in -{_MAX_WORKDAYS}..{_MAX_WORKDAYS}")
+    return {"date": day.isoformat(), "workdays": workdays,
+            "result": add_workdays(day, workdays, *_workday_options(params)).isoformat()}
+
+
+def _holidays(params: dict) -> dict:
+    year = _parse_year(_required(params, "year"))
+    shopping_restricted = _parse_bool(params.get("shopping_restricted"), False)
+    return {"year": year, "holidays": [_holiday_json(holiday)
+                                       for holiday in get_holidays(year, shopping_restricted=shopping_restricted)]}
+
+
+def _workdays(params: dict) -> dict:
+    year = _parse_year(_required(params, "year"))
+    return {"year": year, "workdays": [day.isoformat() for day in get_workdays(year, *_workday_options(params))]}
+
+
+def _shopping_days(params: dict) -> dict:
+    year = _parse_year(_required(params, "year"))
+    return {"year": year,
+            "shopping_days": [day.isoformat() for day in get_shopping_days(year, *_shopping_options(params))]}
+
+
+def _batch(params: dict) -> dict:
+    dates = _required(params, "dates")
+    if not isinstance(dates, list):
+        raise _BadRequest("dates must be a list")
+    workday_options = _workday_options(params)
+    shopping_options = _shopping_options(params)
+    results = []
+    for value in dates:
+        # Invalid dates and dates before 2001 are reported by their items, not by the whole batch
+        try:
+            day = _parse_date(value)
+            results.append({"date": value,
+                            "is_workday": is_workday(day, *workday_options),
+                            "is_holiday": is_holiday(day),
+                            "is_shopping_day": is_shopping_day(day, *shopping_options)})
+        except _CLIENT_ERRORS as error:
+            results.append({"date": value, "error": str(error)})
+    return {"results": results}
+
+
+def _encode(payload: dict) -> bytes:
+    return json.dumps(payload, ensure_ascii=False).encode()
+
+
+def _error(status: int, message: str) -> tuple:
+    return status, _encode({"error": message})
+
+
+_GET_ENDPOINTS = {
+    "/is_workday": _is_workday,
+    "/is_holiday": _is_holiday,
+    "/is_shopping_day": _is_shopping_day,
+    "/count_workdays": _count_workdays,
+    "/add_workdays": _add_workdays,
+    "/holidays": _holidays,
+    "/workdays": _workdays,
+    "/shopping_days": _shopping_days,
+}
+
+_POST_ENDPOINTS = {
+    "/batch": _batch,
+}
+
+
+class CalendarServer:
+    """
+    HTTP/JSON server over the functions of czech_workdays_holidays. Encoded responses to GET requests are kept
+    in a least recently used cache of cache_size entries.
+    """
+
+    def __init__(self, cache_size: int = 4096):
+        self.cache_size = cache_size
+        self._responses = OrderedDict()
+
+    def _respond(self, method: str, target: str, body: bytes) -> tuple:
+        url = urlsplit(target)
+        if method == "GET":
+            cached = self._responses.get(target)
+            if cached is not None:
+                self._responses.move_to_end(target)
+                return cached
+
+            endpoint = _GET_ENDPOINTS.get(url.path)
+            if endpoint is None:
+                return _error(404 if url.path not in _POST_ENDPOINTS else 405, f"Unknown endpoint: {url.path}")
+            response = self._call(endpoint, dict(parse_qsl(url.query)))
+            if response[0] == 200:
+                self._responses[target] = response
+                if len(self._responses) > self.cache_size:
+                    self._responses.popitem(last=False)
+            return response
+
+        if method == "POST":
+            endpoint = _POST_ENDPOINTS.get(url.path)
+            if endpoint is None:
+                return _error(404 if url.path not in _GET_ENDPOINTS else 405, f"Unknown endpoint: {url.path}")
+            try:
+                params = json.loads(body or b"{}")
+            except ValueError:
+                return _error(400, "Body must be JSON")
+            if not isinstance(params, dict):
+                return _error(400, "Body must be JSON object")
+            return self._call(endpoint, params)
+
+        return _error(405, f"Unsupported method: {method}")
+
+    @staticmethod
+    def _call(endpoint, params: dict) -> tuple:
+        try:
+            payload = endpoint(params)
+        except _CLIENT_ERRORS as error:
+            # Invalid parameters and exceptions of czech_workdays_holidays, e.g. years before 2001
+            return _error(400, str(error))
+        except Exception:
+            _logger.exception("Request failed")
+            return _error(500, "Internal server error")
+        return 200, _encode(payload)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    await self._write(writer, *_error(400, "Malformed request line"), keep_alive=False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+
+                connection = headers.get("connection", "").lower()
+                if version == "HTTP/1.1":
+                    keep_alive = connection != "close"
+                else:
+                    keep_alive = connection == "keep-alive"
+
+                if "transfer-encoding" in headers:
+                    # Body would be left in the stream and read as the next request
+                    await self._write(writer, *_error(501, "Transfer-Encoding is not supported"), keep_alive=False)
+                    break
+                try:
+                    length = int(headers.get("content-length", "0") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._write(writer, *_error(400, "Invalid Content-Length"), keep_alive=False)
+                    break
+                if length > _MAX_BODY_SIZE:
+                    await self._write(writer, *_error(413, "Request body is too large"), keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, content = self._respond(method, target, body)
+                await self._write(writer, status, content, keep_alive)
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _write(writer: asyncio.StreamWriter, status: int, content: bytes, keep_alive: bool) -> None:
+        head = (f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(content)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + content)
+        await writer.drain()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.AbstractServer:
+        """Starts listening and returns asyncio server, port 0 chooses a free port."""
+        return await asyncio.start_server(self.handle, host, port)
+
+
+async def serve(host: str = "127.0.0.1", port: int = 8080, cache_size: int = 4096) -> None:
+    """
+    Runs the calendar server until cancelled.
+
+    :param host: Interface to listen on, only localhost by default
+    :param port: TCP port to listen on
+    :param cache_size: Number of cached GET responses
+    """
+    server = await CalendarServer(cache_size).start(host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Czech workdays HTTP/JSON server")
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on (default 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="port to listen on (default 8080)")
+    parser.add_argument("--cache-size", type=int, default=4096, help="number of cached GET responses")
+    parser.add_argument("--prewarm", type=int, nargs=2, metavar=("START_YEAR", "END_YEAR"),
+                        help="build a year range into the calendar cache before serving")
+    args = parser.parse_args(argv)
+
+    if args.prewarm:
+        prewarm_cache(*args.prewarm)
+    try:
+        asyncio.run(serve(args.host, args.port, args.cache_size))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
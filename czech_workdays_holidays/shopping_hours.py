@@ -0,0 +1,79 @@
+"""
+Shopping restriction at the level of time of day (Zákon č. 223/2016 Sb.): shops are closed for the whole day on
+shopping restricted holidays and from 12:00 on Christmas Eve. Times are Czech local wall-clock times, time zone
+of aware datetimes is kept but not converted.
+"""
+from datetime import date, datetime, time, timedelta
+
+from . import _MINUTES_PER_DAY, _year_calendar
+
+
+def _closing(day: date) -> int:
+    calendar = _year_calendar(day.year)
+    return calendar.shop_closing()[day.toordinal() - calendar.first_ordinal]
+
+
+def is_shop_open(moment: datetime) -> bool:
+    """
+    Checks whether shops may be open at a given moment. Shopping restriction is applied only from 01/10/2016
+    (DD/MM/YY) when it came into effect, earlier moments are always open.
+
+    :param moment: Moment to check (datetime.datetime)
+    :return: False if shops are closed by the shopping restriction
+    """
+
+    # Verification for moment data type
+    if not isinstance(moment, datetime):
+        raise TypeError("moment must be a datetime.datetime.")
+
+    return moment.hour * 60 + moment.minute < _closing(moment.date())
+
+
+def next_shop_opening(moment: datetime) -> datetime:
+    """
+    Gets the first moment at or after a given moment when shops may be open, the moment itself if shops are open.
+
+    :param moment: Starting moment (datetime.datetime)
+    :return: Opening moment -> datetime.datetime(2023, 12, 27, 0, 0)
+    """
+
+    # Verification for moment data type
+    if not isinstance(moment, datetime):
+        raise TypeError("moment must be a datetime.datetime.")
+
+    if is_shop_open(moment):
+        return moment
+
+    # Restrictions last till the end of a day, at most a few days follow each other
+    day = moment.date() + timedelta(days=1)
+    while _closing(day) == 0:
+        day += timedelta(days=1)
+    return datetime.combine(day, time(), moment.tzinfo)
+
+
+def get_shop_closures(year: int) -> list:
+    """
+    Gets periods of a year when shops are closed by the shopping restriction, following days are merged into one
+    period. Shopping restriction is applied only from 01/10/2016 (DD/MM/YY) when it came into effect.
+
+    :param year: Desired year (int)
+    :return: List of (start, end) tuples of datetime.datetime, end excluded ->
+            [(datetime.datetime(2023, 1, 1, 0, 0), datetime.datetime(2023, 1, 2, 0, 0)), ...]
+    """
+
+    # Verification for year data type
+    if not isinstance(year, int):
+        raise TypeError("Year must be an integer.")
+
+    calendar = _year_calendar(year)
+    closures = []
+    for offset, minute in enumerate(calendar.shop_closing()):
+        if minute == _MINUTES_PER_DAY:
+            continue
+        start = datetime.fromordinal(calendar.first_ordinal + offset) + timedelta(minutes=minute)
+        end = datetime.fromordinal(calendar.first_ordinal + offset + 1)
+        if closures and closures[-1][1] == start:
+            closures[-1] = (closures[-1][0], end)
+        else:
+            closures.append((start, end))
+    return closures
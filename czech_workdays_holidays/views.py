@@ -0,0 +1,259 @@
+"""
+Read-only sorted sequences of holidays, workdays or shopping days backed by the cached per-year bitmaps.
+"""
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from datetime import date
+from typing import Iterator, Optional, Union
+
+from . import UnsupportedYearError, _check_date_range, _year_calendar
+
+
+class DateView(Sequence):
+    """
+    Sorted read-only sequence of distinct dates. A view keeps per-year bitmaps and cumulative indexes shared with
+    the calendar cache, so len(), in, indexing, index() and bisect_left() answer without building a list of dates.
+    Slicing by positions or by dates returns another view, dates are copied only by iteration or to_list(). Position
+    slices with a step other than 1 return a list of dates.
+
+    Date slices include both ends, e.g. ``view[date(2024, 3, 1):date(2024, 6, 30)]`` are days of March to June.
+    """
+
+    __slots__ = ("_segments", "_starts", "_counts")
+
+    def __init__(self, segments: list):
+        # (calendar, bitmap, cumulative index, first offset, end offset) of each year, offsets of days of the year
+        self._segments = segments
+        self._starts = [calendar.first_ordinal + low for calendar, _, _, low, _ in segments]
+        self._counts = [0]
+        for _, _, prefix, low, high in segments:
+            self._counts.append(self._counts[-1] + prefix[high] - prefix[low])
+
+    def __len__(self) -> int:
+        return self._counts[-1]
+
+    def _date(self, index: int) -> date:
+        segment = bisect_right(self._counts, index) - 1
+        calendar, _, prefix, low, _ = self._segments[segment]
+        # The wanted day is the first one with this many days of the view before and including it
+        offset = bisect_left(prefix, index - self._counts[segment] + prefix[low] + 1) - 1
+        return date.fromordinal(calendar.first_ordinal + offset)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            if isinstance(index.start, date) or isinstance(index.stop, date):
+                if index.step is not None:
+                    raise ValueError("Date slices do not support step.")
+                if not all(bound is None or isinstance(bound, date) for bound in (index.start, index.stop)):
+                    raise TypeError("Both bounds of a date slice must be dates or None.")
+                first = index.start.toordinal() if index.start is not None else None
+                last = index.stop.toordinal() if index.stop is not None else None
+                return self._clip(first, last)
+
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self._date(position) for position in range(start, stop, step)]
+            if stop <= start:
+                return DateView([])
+            return self._clip(self._date(start).toordinal(), self._date(stop - 1).toordinal())
+
+        if not isinstance(index, int):
+            raise TypeError("DateView indices must be integers, slices or date slices.")
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("DateView index out of range")
+        return self._date(index)
+
+    def _clip(self, first: Optional[int], last: Optional[int]) -> "DateView":
+        """Gets a view of days between two ordinals (both included, None is unbounded)."""
+        segments = []
+        for calendar, mask, prefix, low, high in self._segments:
+            if first is not None:
+                low = max(low, first - calendar.first_ordinal)
+            if last is not None:
+                high = min(high, last - calendar.first_ordinal + 1)
+            if low < high:
+                segments.append((calendar, mask, prefix, low, high))
+        return DateView(segments)
+
+    def bisect_left(self, day: date) -> int:
+        """Gets number of dates of the view before a day, i.e. position where the day is or would be."""
+
+        # Verification for day data type
+        if not isinstance(day, date):
+            raise TypeError("day must be a datetime.date.")
+
+        ordinal = day.toordinal()
+        segment = bisect_right(self._starts, ordinal) - 1
+        if segment < 0:
+            return 0
+        calendar, _, prefix, low, high = self._segments[segment]
+        offset = min(ordinal - calendar.first_ordinal, high)
+        return self._counts[segment] + prefix[offset] - prefix[low]
+
+    def __contains__(self, day) -> bool:
+        if not isinstance(day, date):
+            return False
+        ordinal = day.toordinal()
+        segment = bisect_right(self._starts, ordinal) - 1
+        if segment < 0:
+            return False
+        calendar, mask, _, _, high = self._segments[segment]
+        offset = ordinal - calendar.first_ordinal
+        return offset < high and mask >> offset & 1 == 1
+
+    def index(self, day: date, start: int = 0, stop: Optional[int] = None) -> int:
+        """Gets position of a day in the view, raises ValueError if it is not in the view."""
+        if day in self:
+            position = self.bisect_left(day)
+            # Negative bounds count from the end as in list.index()
+            start, stop, _ = slice(start, stop).indices(len(self))
+            if start <= position < stop:
+                return position
+        raise ValueError(f"{day!r} is not in the view")
+
+    def count(self, day: date) -> int:
+        return 1 if day in self else 0
+
+    def on_or_after(self, day: date, n: int = 0) -> date:
+        """
+        Gets the n-th date of the view on or after a day, n = 0 is the first one.
+
+        :param day: Day to search from (datetime.date)
+        :param n: Number of dates to skip (int)
+        :return: datetime.date(2024, 1, 2)
+        """
+
+        # Verification for n data type
+        if not isinstance(n, int):
+            raise TypeError("n must be an integer.")
+
+        position = self.bisect_left(day) + n
+        if not 0 <= position < len(self):
+            raise IndexError("No such date in the view")
+        return self._date(position)
+
+    def __iter__(self) -> Iterator[date]:
+        for calendar, mask, _, low, high in self._segments:
+            yield from calendar.select(mask & ((1 << high) - (1 << low)))
+
+    def to_list(self) -> list:
+        """Copies dates of the view into a new list."""
+        return list(self)
+
+    def __repr__(self) -> str:
+        if not self:
+            return "DateView([])"
+        return f"DateView({len(self)} dates from {self[0].isoformat()} to {self[-1].isoformat()})"
+
+
+def _view(start: Union[int, date], end: Union[int, date, None], year_mask) -> DateView:
+    """Builds a view of whole years (integers) or of a date range from a function returning bitmap of a year."""
+    if isinstance(start, int) and not isinstance(start, bool):
+        if end is None:
+            end = start
+        # Verification for end data type
+        if not isinstance(end, int):
+            raise TypeError("end must be an integer if start is a year.")
+        start_date = date(start, 1, 1)
+        end_date = date(end, 12, 31)
+    else:
+        start_date, end_date = start, end
+        _check_date_range(start_date, end_date)
+
+    first = start_date.toordinal()
+    last = end_date.toordinal()
+    segments = []
+    for year in range(start_date.year, end_date.year + 1):
+        calendar = _year_calendar(year)
+        mask = year_mask(calendar)
+        low = max(first - calendar.first_ordinal, 0)
+        high = min(last - calendar.first_ordinal + 1, calendar.days)
+        if low < high:
+            segments.append((calendar, mask, calendar.prefix(mask), low, high))
+    return DateView(segments)
+
+
+def _holiday_mask(calendar) -> int:
+    if not calendar.supported:
+        raise UnsupportedYearError("Data are valid since year 2001")
+    return calendar.holidays
+
+
+def get_holiday_view(start: Union[int, date], end: Union[int, date, None] = None) -> DateView:
+    """
+    Gets holidays of a year, a range of years or a range of dates as a sorted view, each day is included once.
+
+    :param start: First year (int) or first day (datetime.date)
+    :param end: Last year (int, the same as start if None) or last day (datetime.date), included
+    :return: DateView of holidays
+    """
+    return _view(start, end, _holiday_mask)
+
+
+def get_workday_view(start: Union[int, date],
+                     end: Union[int, date, None] = None,
+                     include_saturday: bool = False,
+                     include_sunday: bool = False,
+                     include_holidays: bool = False) -> DateView:
+    """
+    Gets working days of a year, a range of years or a range of dates as a sorted view. Parameters have the same
+    meaning as in get_workdays().
+
+    :param start: First year (int) or first day (datetime.date)
+    :param end: Last year (int, the same as start if None) or last day (datetime.date), included
+    :param include_saturday: Includes also Saturdays in output
+    :param include_sunday: Includes also Sundays in output
+    :param include_holidays: Counts holidays as working days
+    :return: DateView of working days
+    """
+
+    # Verification for include_saturday data type
+    if not isinstance(include_saturday, bool):
+        raise TypeError("include_saturday must be a boolean.")
+
+    # Verification for include_sunday data type
+    if not isinstance(include_sunday, bool):
+        raise TypeError("include_sunday must be a boolean.")
+
+    # Verification for include_holidays data type
+    if not isinstance(include_holidays, bool):
+        raise TypeError("include_holidays must be a boolean.")
+
+    return _view(start, end, lambda calendar: calendar.workday_mask(include_saturday, include_sunday,
+                                                                    include_holidays))
+
+
+def get_shopping_day_view(start: Union[int, date],
+                          end: Union[int, date, None] = None,
+                          include_saturday: bool = True,
+                          include_sunday: bool = True,
+                          exclude_shopping_restricted_days: bool = True) -> DateView:
+    """
+    Gets shopping days of a year, a range of years or a range of dates as a sorted view. Parameters have the same
+    meaning as in get_shopping_days(). Shopping restriction is applied only to days from 01/10/2016 (DD/MM/YY)
+    when it came into effect.
+
+    :param start: First year (int) or first day (datetime.date)
+    :param end: Last year (int, the same as start if None) or last day (datetime.date), included
+    :param include_saturday: Includes also Saturdays in output
+    :param include_sunday: Includes also Sundays in output
+    :param exclude_shopping_restricted_days: Excludes shopping restricted days in output
+    :return: DateView of shopping days
+    """
+
+    # Verification for include_saturday data type
+    if not isinstance(include_saturday, bool):
+        raise TypeError("include_saturday must be a boolean.")
+
+    # Verification for include_sunday data type
+    if not isinstance(include_sunday, bool):
+        raise TypeError("include_sunday must be a boolean.")
+
+    # Verification for exclude_shopping_restricted_days data type
+    if not isinstance(exclude_shopping_restricted_days, bool):
+        raise TypeError("exclude_shopping_restricted_days must be a boolean.")
+
+    return _view(start, end, lambda calendar: calendar.shopping_mask(include_saturday, include_sunday,
+                                                                     exclude_shopping_restricted_days))
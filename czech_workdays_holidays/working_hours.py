@@ -0,0 +1,155 @@
+"""
+Working time between datetimes and deadlines after a working time, for daily working windows on working days.
+"""
+from datetime import date, datetime, time, timedelta
+from typing import Optional, Sequence
+
+from .company import CompanyCalendar
+
+_MICROSECONDS_PER_DAY = 24 * 60 * 60 * 10 ** 6
+
+
+def _microseconds(moment: time) -> int:
+    return ((moment.hour * 60 + moment.minute) * 60 + moment.second) * 10 ** 6 + moment.microsecond
+
+
+class WorkingHours:
+    """
+    Daily working windows, e.g. 09:00-17:00, on working days of a calendar. Whole working days between two
+    moments are counted from cumulative per-year workday counts, so the cost does not depend on the length of
+    the interval. Datetimes are compared as wall-clock times, time zones are kept but not converted.
+    """
+
+    def __init__(self,
+                 windows: Sequence[tuple] = ((time(9), time(17)),),
+                 calendar: Optional[CompanyCalendar] = None):
+        """
+        :param windows: Sorted and not overlapping (start, end) tuples of datetime.time, start included and end
+                excluded, e.g. ((time(8), time(12)), (time(12, 30), time(16, 30)))
+        :param calendar: Calendar of working days, national workdays (CompanyCalendar()) if None
+        """
+
+        # Verification for calendar data type
+        if calendar is None:
+            calendar = CompanyCalendar()
+        elif not isinstance(calendar, CompanyCalendar):
+            raise TypeError("calendar must be a CompanyCalendar.")
+
+        # Verification for windows data type and value
+        bounds = []
+        for window in windows:
+            if not isinstance(window, tuple) or len(window) != 2 or \
+                    not all(isinstance(bound, time) for bound in window):
+                raise TypeError("windows must be (start, end) tuples of datetime.time.")
+            start, end = map(_microseconds, window)
+            if end <= start:
+                raise ValueError("Window must end after it starts.")
+            if bounds and start < bounds[-1][1]:
+                raise ValueError("Windows must be sorted and not overlapping.")
+            bounds.append((start, end))
+        if not bounds:
+            raise ValueError("At least one window is required.")
+
+        self.windows = tuple(windows)
+        self.calendar = calendar
+        # (start, end, working time before the window) of each window in microseconds of the day
+        self._windows = []
+        total = 0
+        for start, end in bounds:
+            self._windows.append((start, end, total))
+            total += end - start
+        self._day_length = total
+
+    @property
+    def day_length(self) -> timedelta:
+        """Working time of one working day."""
+        return timedelta(microseconds=self._day_length)
+
+    def _worked_before(self, moment: datetime) -> int:
+        """Working time of the day of a moment before the moment in microseconds, ignoring the calendar."""
+        offset = _microseconds(moment.time())
+        worked = 0
+        for start, end, _ in self._windows:
+            if offset <= start:
+                break
+            worked += min(offset, end) - start
+        return worked
+
+    def _moment_after(self, day: date, worked: int, tzinfo) -> datetime:
+        """First moment of a day when working time of the day reaches worked, 0 < worked <= day length."""
+        for start, end, before in self._windows:
+            if worked <= before + end - start:
+                offset = start + worked - before
+                break
+        return datetime.combine(day, time(), tzinfo) + timedelta(microseconds=offset)
+
+    def working_time(self, start: datetime, end: datetime) -> timedelta:
+        """
+        Computes working time between two moments.
+
+        :param start: Beginning of the interval (datetime.datetime)
+        :param end: End of the interval (datetime.datetime)
+        :return: Working time as datetime.timedelta, zero if end is before start
+        """
+
+        # Verification for start data type
+        if not isinstance(start, datetime):
+            raise TypeError("start must be a datetime.datetime.")
+
+        # Verification for end data type
+        if not isinstance(end, datetime):
+            raise TypeError("end must be a datetime.datetime.")
+
+        if end.replace(tzinfo=None) <= start.replace(tzinfo=None):
+            return timedelta(0)
+
+        start_day = start.date()
+        end_day = end.date()
+        start_worked = self._worked_before(start) if self.calendar.is_workday(start_day) else 0
+        end_worked = self._worked_before(end) if self.calendar.is_workday(end_day) else 0
+        if start_day == end_day:
+            return timedelta(microseconds=end_worked - start_worked)
+
+        worked = 0
+        if self.calendar.is_workday(start_day):
+            worked += self._day_length - start_worked
+        if end_day - start_day > timedelta(days=1):
+            full_days = self.calendar.count_workdays(start_day + timedelta(days=1), end_day - timedelta(days=1))
+            worked += full_days * self._day_length
+        return timedelta(microseconds=worked + end_worked)
+
+    def deadline(self, start: datetime, duration: timedelta) -> datetime:
+        """
+        Computes the moment when a working time elapses after a start, e.g. deadline of a ticket. The deadline is
+        the end of the last needed working window rather than the start of the following one.
+
+        :param start: Starting moment (datetime.datetime)
+        :param duration: Working time, not negative (datetime.timedelta)
+        :return: Deadline -> datetime.datetime(2023, 12, 27, 11, 0)
+        """
+
+        # Verification for start data type
+        if not isinstance(start, datetime):
+            raise TypeError("start must be a datetime.datetime.")
+
+        # Verification for duration data type and value
+        if not isinstance(duration, timedelta):
+            raise TypeError("duration must be a datetime.timedelta.")
+        if duration < timedelta(0):
+            raise ValueError("duration must not be negative.")
+
+        remaining = duration // timedelta(microseconds=1)
+        if remaining == 0:
+            return start
+
+        day = start.date()
+        if self.calendar.is_workday(day):
+            available = self._day_length - self._worked_before(start)
+            if remaining <= available:
+                return self._moment_after(day, self._worked_before(start) + remaining, start.tzinfo)
+            remaining -= available
+
+        # Whole working days are skipped at once, the last day gets between zero (excluded) and one day length
+        full_days = (remaining - 1) // self._day_length
+        day = self.calendar.add_workdays(day, full_days + 1)
+        return self._moment_after(day, remaining - full_days * self._day_length, start.tzinfo)
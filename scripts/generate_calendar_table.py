@@ -0,0 +1,41 @@
+"""
+Generates the precomputed calendar table shipped with the package, czech_workdays_holidays/calendar_table.bin.
+Run it after holiday rules change:
+
+    python scripts/generate_calendar_table.py
+    python scripts/generate_calendar_table.py --start-year 2001 --end-year 2200 -o calendar_table.bin
+
+The table has a 16 byte header (magic CZWDHT01, first year and number of years as little endian unsigned 16-bit
+integers) followed by one byte of flags per day from January 1st of the first year: 1 holiday, 2 shopping
+restricted day.
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from czech_workdays_holidays import _TABLE_PATH, _build_table  # noqa: E402
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Generate the precomputed calendar table")
+    parser.add_argument("--start-year", type=int, default=2001)
+    parser.add_argument("--end-year", type=int, default=2200)
+    parser.add_argument("-o", "--output", default=_TABLE_PATH, help="output file, the packaged table by default")
+    args = parser.parse_args(argv)
+
+    if args.start_year < 2001:
+        parser.error("data are valid since year 2001")
+    if args.end_year < args.start_year:
+        parser.error("end year is before start year")
+
+    table = _build_table(args.start_year, args.end_year)
+    with open(args.output, "wb") as output:
+        output.write(table)
+    print(f"{args.output}: years {args.start_year}-{args.end_year}, {len(table)} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,44 @@
 import unittest
-from datetime import date, timedelta
+from datetime import date, datetime, time, timedelta, timezone
 from dateutil.easter import easter
-from czech_workdays_holidays import get_holidays, get_workdays, get_shopping_days, get_holidays_during_weekend
+from czech_workdays_holidays import get_holidays, get_workdays, get_shopping_days, get_holidays_during_weekend, \
+    get_workdays_during_weekend, is_workday, is_holiday, is_shopping_day, count_workdays, add_workdays, next_workday, \
+    previous_workday, iter_workdays, iter_shopping_days, iter_holidays, get_holiday_records, Holiday, cache_info, \
+    cache_clear, set_cache_size, prewarm_cache, DateRuns, get_workday_runs, get_shopping_day_runs, CompanyCalendar, \
+    is_shop_open, next_shop_opening, get_shop_closures, WorkingHours, \
+    get_working_time_fund, WorkingTimeFund, annotate_file, find_leave_windows, LeaveWindow, \
+    DateView, get_holiday_view, get_workday_view, get_shopping_day_view, Instrumentation, nth_workday, \
+    last_workday_of_month, workday_of_month, get_nth_workdays
+from bisect import bisect_left
+import czech_workdays_holidays
+from czech_workdays_holidays import _easter, _compute_easter, _EASTER_TABLE, _EASTER_TABLE_START, _TABLE, \
+    _TABLE_PATH, _CalendarTable, _YearCalendar, _build_table, _table_flags
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import json
+from czech_workdays_holidays.server import CalendarServer
+from czech_workdays_holidays.cli import main as cli_main
+import io
+import os
+import tempfile
+from contextlib import redirect_stdout
+from itertools import islice
 from random import randint
 
+try:
+    import numpy
+    from czech_workdays_holidays import numpy_calendar
+except ImportError:
+    numpy = None
+
+try:
+    import pandas
+    from czech_workdays_holidays import pandas_calendar
+except ImportError:
+    pandas = None
+
 
 class TestGetHolidays(unittest.TestCase):
 
@@ -64,6 +99,37 @@ class TestGetHolidays(unittest.TestCase):
         self.assertEqual(holidays, expected_holidays)
 
 
+class TestHolidayRecords(unittest.TestCase):
+    def test_records_match_dictionaries(self):
+        for year in (2001, 2015, 2016, 2023):
+            records = get_holiday_records(year)
+            self.assertEqual([record._asdict() for record in records], get_holidays(year))
+            self.assertTrue(all(isinstance(record, Holiday) for record in records))
+
+    def test_good_friday_valid_from(self):
+        self.assertNotIn("Good Friday", [record.holiday_name_en for record in get_holiday_records(2015)])
+        good_friday = get_holiday_records(2016)[2]
+        self.assertEqual(good_friday.holiday_name_en, "Good Friday")
+        self.assertEqual(good_friday.date, date(2016, 3, 25))
+        self.assertFalse(good_friday.fixed)
+
+    def test_records_are_cached_and_immutable(self):
+        records = get_holiday_records(2023)
+        self.assertIs(records, get_holiday_records(2023))
+        with self.assertRaises(AttributeError):
+            records[0].date = date(2023, 1, 2)
+
+    def test_dictionaries_are_copies(self):
+        get_holidays(2023)[0]["date"] = None
+        self.assertEqual(get_holidays(2023)[0]["date"], date(2023, 1, 1))
+
+    def test_year(self):
+        with self.assertRaises(TypeError):
+            get_holiday_records("2023")
+        with self.assertRaises(Exception):
+            get_holiday_records(2000)
+
+
 class TestGetWorkdays(unittest.TestCase):
     def test_get_workdays_2023(self):
         year = 2023
@@ -114,6 +180,1235 @@ class TestGetHolidaysDuringWeekend(unittest.TestCase):
         holidays = get_holidays_during_weekend(2023)
         self.assertEqual(expected_holidays, holidays)
 
+class TestDayClassification(unittest.TestCase):
+    @staticmethod
+    def days(year):
+        day = date(year, 1, 1)
+        while day.year == year:
+            yield day
+            day += timedelta(days=1)
+
+    def test_get_workdays_all_options(self):
+        for year in (2001, 2012, 2016, 2023, 2024, 2100):
+            holidays = set(get_holidays(year, dates_only=True))
+            for include_saturday in (False, True):
+                for include_sunday in (False, True):
+                    for include_holidays in (False, True):
+                        expected = [day for day in self.days(year)
+                                    if (include_holidays or day not in holidays)
+                                    and (include_saturday or day.weekday() != 5)
+                                    and (include_sunday or day.weekday() != 6)]
+                        self.assertEqual(get_workdays(year, include_saturday, include_sunday, include_holidays),
+                                         expected)
+
+    def test_get_shopping_days_all_options(self):
+        for year in (2017, 2024):
+            restricted = set(get_holidays(year, dates_only=True, shopping_restricted=True))
+            for include_saturday in (False, True):
+                for include_sunday in (False, True):
+                    for exclude in (False, True):
+                        expected = [day for day in self.days(year)
+                                    if (not exclude or day not in restricted)
+                                    and (include_saturday or day.weekday() != 5)
+                                    and (include_sunday or day.weekday() != 6)]
+                        self.assertEqual(get_shopping_days(year, include_saturday, include_sunday, exclude), expected)
+
+    def test_get_shopping_days_before_and_during_2016(self):
+        with self.assertRaises(Exception):
+            get_shopping_days(2015)
+        self.assertEqual(len(get_shopping_days(2015, exclude_shopping_restricted_days=False)), 365)
+        with self.assertWarns(UserWarning):
+            shopping_days = get_shopping_days(2016)
+        self.assertIn(date(2016, 5, 8), shopping_days)
+        self.assertNotIn(date(2016, 10, 28), shopping_days)
+
+    def test_get_workdays_during_weekend(self):
+        for include_holidays in (False, True):
+            expected = [day for day in get_workdays(2023, True, True, include_holidays) if day.weekday() >= 5]
+            self.assertEqual(get_workdays_during_weekend(2023, include_holidays), expected)
+
+    def test_returned_list_is_a_copy(self):
+        get_workdays(2023).clear()
+        self.assertEqual(len(get_workdays(2023)), 250)
+
+
+class TestPointQueries(unittest.TestCase):
+    def test_is_workday_matches_get_workdays(self):
+        for year in (2001, 2015, 2016, 2020, 2023, 2024):
+            for include_saturday, include_sunday, include_holidays in ((False, False, False), (True, False, False),
+                                                                       (False, True, True), (True, True, False)):
+                workdays = set(get_workdays(year, include_saturday, include_sunday, include_holidays))
+                day = date(year, 1, 1)
+                while day.year == year:
+                    self.assertEqual(is_workday(day, include_saturday, include_sunday, include_holidays),
+                                     day in workdays)
+                    day += timedelta(days=1)
+
+    def test_is_holiday(self):
+        holidays = set(get_holidays(2024, dates_only=True))
+        day = date(2024, 1, 1)
+        while day.year == 2024:
+            self.assertEqual(is_holiday(day), day in holidays)
+            day += timedelta(days=1)
+
+    def test_is_shopping_day_matches_get_shopping_days(self):
+        for year in (2017, 2023, 2024):
+            shopping_days = set(get_shopping_days(year, include_sunday=False))
+            day = date(year, 1, 1)
+            while day.year == year:
+                self.assertEqual(is_shopping_day(day, include_sunday=False), day in shopping_days)
+                day += timedelta(days=1)
+
+    def test_is_shopping_day_2016(self):
+        self.assertTrue(is_shopping_day(date(2016, 5, 8)))
+        self.assertFalse(is_shopping_day(date(2016, 12, 25)))
+
+    def test_is_workday_before_2001(self):
+        self.assertTrue(is_workday(date(2000, 1, 1), include_saturday=True, include_holidays=True))
+        with self.assertRaises(Exception):
+            is_workday(date(2000, 1, 3))
+        with self.assertRaises(Exception):
+            is_holiday(date(2000, 1, 1))
+
+    def test_day_type(self):
+        with self.assertRaises(TypeError):
+            is_workday("2023-01-02")
+        with self.assertRaises(TypeError):
+            is_holiday(20230101)
+        with self.assertRaises(TypeError):
+            is_shopping_day(date(2023, 1, 2), include_sunday=1)
+
+
+class TestCountWorkdays(unittest.TestCase):
+    def test_full_year(self):
+        for year in (2001, 2016, 2023, 2024):
+            self.assertEqual(count_workdays(date(year, 1, 1), date(year, 12, 31)), len(get_workdays(year)))
+
+    def test_options(self):
+        for options in ((True, False, False), (False, True, False), (True, True, True), (False, False, True)):
+            expected = len(get_workdays(2023, *options))
+            self.assertEqual(count_workdays(date(2023, 1, 1), date(2023, 12, 31), *options), expected)
+
+    def test_partial_range_across_years(self):
+        start_date, end_date = date(2019, 3, 14), date(2024, 8, 2)
+        workdays = [day for year in range(2019, 2025) for day in get_workdays(year)]
+        expected = len([day for day in workdays if start_date <= day <= end_date])
+        self.assertEqual(count_workdays(start_date, end_date), expected)
+
+    def test_random_ranges(self):
+        workdays = [day for year in range(2020, 2026) for day in get_workdays(year, include_saturday=True)]
+        for _ in range(50):
+            start_date = date(2020, 1, 1) + timedelta(days=randint(0, 2000))
+            end_date = start_date + timedelta(days=randint(0, 190))
+            expected = len([day for day in workdays if start_date <= day <= end_date])
+            self.assertEqual(count_workdays(start_date, end_date, include_saturday=True), expected)
+
+    def test_single_day_and_empty_range(self):
+        self.assertEqual(count_workdays(date(2023, 12, 27), date(2023, 12, 27)), 1)
+        self.assertEqual(count_workdays(date(2023, 12, 24), date(2023, 12, 26)), 0)
+        self.assertEqual(count_workdays(date(2023, 12, 27), date(2023, 12, 1)), 0)
+
+    def test_before_2001(self):
+        self.assertEqual(count_workdays(date(2000, 1, 1), date(2000, 12, 31), include_holidays=True), 260)
+        with self.assertRaises(Exception):
+            count_workdays(date(2000, 1, 1), date(2001, 12, 31))
+
+    def test_types(self):
+        with self.assertRaises(TypeError):
+            count_workdays("2023-01-01", date(2023, 12, 31))
+        with self.assertRaises(TypeError):
+            count_workdays(date(2023, 1, 1), date(2023, 12, 31), include_holidays=1)
+
+
+class TestAddWorkdays(unittest.TestCase):
+    workdays = [day for year in range(2019, 2029) for day in get_workdays(year)]
+
+    def expected(self, day, workdays):
+        if workdays > 0:
+            return [workday for workday in self.workdays if workday > day][workdays - 1]
+        if workdays < 0:
+            return [workday for workday in self.workdays if workday < day][workdays]
+        return next(workday for workday in self.workdays if workday >= day)
+
+    def test_add_workdays(self):
+        self.assertEqual(add_workdays(date(2023, 12, 22), 1), date(2023, 12, 27))
+        self.assertEqual(add_workdays(date(2023, 12, 23), 10), date(2024, 1, 10))
+        self.assertEqual(add_workdays(date(2024, 1, 2), -2), date(2023, 12, 28))
+
+    def test_zero(self):
+        self.assertEqual(add_workdays(date(2023, 12, 27), 0), date(2023, 12, 27))
+        self.assertEqual(add_workdays(date(2023, 12, 24), 0), date(2023, 12, 27))
+
+    def test_random_offsets(self):
+        for _ in range(200):
+            day = date(2021, 1, 1) + timedelta(days=randint(0, 1800))
+            workdays = randint(-500, 500)
+            self.assertEqual(add_workdays(day, workdays), self.expected(day, workdays))
+
+    def test_multi_year_jump(self):
+        day = date(2003, 6, 30)
+        self.assertEqual(count_workdays(next_workday(day), add_workdays(day, 10000)), 10000)
+        self.assertEqual(add_workdays(add_workdays(day, 10000), -10000), day)
+
+    def test_options(self):
+        self.assertEqual(next_workday(date(2023, 12, 22), include_saturday=True), date(2023, 12, 23))
+        self.assertEqual(next_workday(date(2023, 12, 23), include_sunday=True, include_holidays=True),
+                         date(2023, 12, 24))
+        self.assertEqual(previous_workday(date(2023, 12, 27), include_holidays=True), date(2023, 12, 26))
+
+    def test_next_and_previous_workday(self):
+        self.assertEqual(next_workday(date(2023, 12, 31)), date(2024, 1, 2))
+        self.assertEqual(previous_workday(date(2024, 1, 2)), date(2023, 12, 29))
+
+    def test_types(self):
+        with self.assertRaises(TypeError):
+            add_workdays(date(2023, 1, 1), "10")
+        with self.assertRaises(TypeError):
+            next_workday("2023-01-01")
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestNumpyCalendar(unittest.TestCase):
+    def days(self, start_year, end_year):
+        return numpy.arange(f"{start_year}-01-01", f"{end_year + 1}-01-01", dtype="datetime64[D]")
+
+    def test_is_workday_matches_get_workdays(self):
+        days = self.days(2001, 2030)
+        for options in ((False, False, False), (True, False, False), (True, True, False), (False, True, True)):
+            workdays = [day for year in range(2001, 2031) for day in get_workdays(year, *options)]
+            expected = numpy.isin(days, numpy.array(workdays, dtype="datetime64[D]"))
+            numpy.testing.assert_array_equal(numpy_calendar.is_workday(days, *options), expected)
+
+    def test_is_shopping_day_matches_get_shopping_days(self):
+        days = self.days(2017, 2030)
+        shopping_days = [day for year in range(2017, 2031) for day in get_shopping_days(year, include_sunday=False)]
+        expected = numpy.isin(days, numpy.array(shopping_days, dtype="datetime64[D]"))
+        numpy.testing.assert_array_equal(numpy_calendar.is_shopping_day(days, include_sunday=False), expected)
+
+    def test_holidays_array(self):
+        holidays = numpy_calendar.get_holidays_array(2023, 2024)
+        expected = sorted(set(get_holidays(2023, dates_only=True) + get_holidays(2024, dates_only=True)))
+        self.assertEqual(holidays.tolist(), expected)
+        restricted = numpy_calendar.get_holidays_array(2023, 2023, shopping_restricted=True)
+        expected = sorted(set(get_holidays(2023, dates_only=True, shopping_restricted=True)))
+        self.assertEqual(restricted.tolist(), expected)
+
+    def test_busdaycalendar(self):
+        calendar = numpy_calendar.get_busdaycalendar(2023, 2023)
+        self.assertEqual(numpy.busday_count("2023-01-01", "2024-01-01", busdaycal=calendar), 250)
+
+    def test_count_workdays(self):
+        starts = numpy.array(["2023-01-01", "2019-03-14", "2023-12-27", "2023-12-24"], dtype="datetime64[D]")
+        ends = numpy.array(["2023-12-31", "2024-08-02", "2023-12-01", "2023-12-26"], dtype="datetime64[D]")
+        expected = [count_workdays(start, end) for start, end in zip(starts.tolist(), ends.tolist())]
+        self.assertEqual(numpy_calendar.count_workdays(starts, ends).tolist(), expected)
+
+    def test_offset_workdays(self):
+        days = numpy.arange("2022-12-20", "2023-01-10", dtype="datetime64[D]")
+        for workdays in (-300, -1, 0, 1, 10, 1000):
+            expected = [add_workdays(day, workdays) for day in days.tolist()]
+            self.assertEqual(numpy_calendar.offset_workdays(days, workdays).tolist(), expected)
+
+    def test_nat(self):
+        days = numpy.array(["2024-01-02", "NaT", "2024-01-06"], dtype="datetime64[D]")
+        self.assertEqual(numpy_calendar.is_workday(days).tolist(), [True, False, False])
+        self.assertEqual(numpy_calendar.is_shopping_day(days).tolist(), [True, False, True])
+        self.assertEqual(numpy_calendar.is_workday(["NaT"]).tolist(), [False])
+        offsets = numpy_calendar.offset_workdays(days, 1)
+        self.assertEqual(offsets[0], numpy.datetime64("2024-01-03"))
+        self.assertTrue(numpy.isnat(offsets[1]))
+        with self.assertRaises(ValueError):
+            numpy_calendar.count_workdays(days, days)
+
+    def test_before_2001(self):
+        with self.assertRaises(Exception):
+            numpy_calendar.is_workday(["2000-06-01"])
+        with self.assertRaises(Exception):
+            numpy_calendar.offset_workdays(["2001-01-10"], -10)
+
+
+@unittest.skipIf(pandas is None, "pandas is not installed")
+class TestPandasCalendar(unittest.TestCase):
+    def test_calendar_rules(self):
+        for year in (2001, 2015, 2016, 2023):
+            holidays = pandas_calendar.CzechHolidayCalendar().holidays(f"{year}-01-01", f"{year}-12-31")
+            self.assertEqual(sorted(set(holidays.date)), sorted(set(get_holidays(year, dates_only=True))))
+
+    def test_holiday_index(self):
+        index = pandas_calendar.get_holiday_index(2015, 2024)
+        rules = pandas_calendar.CzechHolidayCalendar().holidays("2015-01-01", "2024-12-31").unique()
+        self.assertTrue(index.equals(pandas.DatetimeIndex(rules, name="holidays")))
+        self.assertIs(index, pandas_calendar.get_holiday_index(2015, 2024))
+
+    def test_date_range(self):
+        workdays = pandas.date_range("2023-01-01", "2023-12-31", freq=pandas_calendar.CzechBDay)
+        self.assertEqual(list(workdays.date), get_workdays(2023))
+
+    def test_offset(self):
+        index = pandas.DatetimeIndex(["2023-12-22", "2023-12-23"])
+        expected = [add_workdays(day, 10) for day in index.date]
+        self.assertEqual(list(pandas_calendar.offset_index(index, 10).date), expected)
+
+    def test_business_day_options(self):
+        offset = pandas_calendar.czech_business_day(include_saturday=True)
+        self.assertIs(offset, pandas_calendar.czech_business_day(include_saturday=True))
+        workdays = pandas.date_range("2023-01-01", "2023-12-31", freq=offset)
+        self.assertEqual(list(workdays.date), get_workdays(2023, include_saturday=True))
+
+
+class TestIterators(unittest.TestCase):
+    def test_iter_workdays_across_years(self):
+        start_date, end_date = date(2019, 3, 14), date(2024, 8, 2)
+        expected = [day for year in range(2019, 2025) for day in get_workdays(year, include_saturday=True)
+                    if start_date <= day <= end_date]
+        self.assertEqual(list(iter_workdays(start_date, end_date, include_saturday=True)), expected)
+
+    def test_iter_shopping_days(self):
+        start_date, end_date = date(2022, 12, 20), date(2023, 1, 10)
+        expected = [day for year in (2022, 2023) for day in get_shopping_days(year, include_sunday=False)
+                    if start_date <= day <= end_date]
+        self.assertEqual(list(iter_shopping_days(start_date, end_date, include_sunday=False)), expected)
+
+    def test_iter_shopping_days_2016(self):
+        shopping_days = list(iter_shopping_days(date(2016, 1, 1), date(2016, 12, 31)))
+        self.assertIn(date(2016, 5, 8), shopping_days)
+        self.assertNotIn(date(2016, 10, 28), shopping_days)
+
+    def test_iter_holidays(self):
+        holidays = list(iter_holidays(date(2023, 5, 1), date(2024, 1, 1)))
+        self.assertEqual([holiday["date"] for holiday in holidays],
+                         [holiday["date"] for holiday in get_holidays(2023)][4:] + [date(2024, 1, 1)] * 2)
+        restricted = [holiday["date"] for holiday in iter_holidays(date(2015, 1, 1), date(2017, 1, 1),
+                                                                   shopping_restricted=True)]
+        self.assertEqual(restricted, [date(2016, 10, 28), date(2016, 12, 25), date(2016, 12, 26), date(2017, 1, 1),
+                                      date(2017, 1, 1)])
+
+    def test_lazy(self):
+        days = iter_workdays(date(2001, 1, 1), date(9000, 12, 31))
+        self.assertEqual(list(islice(days, 3)), [date(2001, 1, 2), date(2001, 1, 3), date(2001, 1, 4)])
+
+    def test_empty_range(self):
+        self.assertEqual(list(iter_workdays(date(2023, 12, 24), date(2023, 12, 26))), [])
+        self.assertEqual(list(iter_holidays(date(2023, 12, 27), date(2023, 12, 1))), [])
+
+    def test_types(self):
+        with self.assertRaises(TypeError):
+            iter_workdays("2023-01-01", date(2023, 12, 31))
+        with self.assertRaises(TypeError):
+            iter_holidays(date(2023, 1, 1), date(2023, 12, 31), shopping_restricted=1)
+        with self.assertRaises(Exception):
+            iter_workdays(date(2000, 1, 1), date(2001, 12, 31))
+
+
+class TestCalendarCache(unittest.TestCase):
+    def setUp(self):
+        cache_clear()
+
+    def tearDown(self):
+        set_cache_size(512)
+        cache_clear()
+
+    def test_hits_and_misses(self):
+        is_workday(date(2023, 5, 2))
+        is_workday(date(2023, 5, 3))
+        info = cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+        self.assertIn(2023, info.build_times)
+
+    def test_eviction(self):
+        set_cache_size(2)
+        for year in (2021, 2022, 2021, 2023):
+            get_workdays(year)
+        info = cache_info()
+        self.assertEqual((info.evictions, info.maxsize, info.currsize), (1, 2, 2))
+        get_workdays(2021)
+        self.assertEqual(cache_info().misses, 3)
+        get_workdays(2022)
+        self.assertEqual(cache_info().misses, 4)
+
+    def test_prewarm(self):
+        prewarm_cache(2001, 2100)
+        self.assertEqual(cache_info().currsize, 100)
+        count_workdays(date(2001, 1, 1), date(2100, 12, 31))
+        self.assertEqual(cache_info().misses, 100)
+
+    def test_threads(self):
+        days = [date(2001, 1, 1) + timedelta(days=offset) for offset in range(0, 20000, 7)]
+        expected = [is_workday(day) for day in days]
+        set_cache_size(4)
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(is_workday, days * 4))
+        self.assertEqual(results, expected * 4)
+        self.assertLessEqual(cache_info().currsize, 4)
+
+    def test_set_cache_size(self):
+        with self.assertRaises(TypeError):
+            set_cache_size("10")
+        with self.assertRaises(ValueError):
+            set_cache_size(0)
+        set_cache_size(None)
+        prewarm_cache(2001, 2600)
+        self.assertEqual(cache_info().currsize, 600)
+
+
+class TestServer(unittest.TestCase):
+    @staticmethod
+    async def exchange(requests: list) -> list:
+        server = await CalendarServer().start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        responses = []
+        # All requests are sent over one kept alive connection
+        for method, target, body in requests:
+            content = json.dumps(body).encode() if body is not None else b""
+            writer.write(f"{method} {target} HTTP/1.1\r\nHost: localhost\r\n"
+                         f"Content-Length: {len(content)}\r\n\r\n".encode() + content)
+            await writer.drain()
+            head = (await reader.readuntil(b"\r\n\r\n")).decode()
+            length = int(head.lower().split("content-length: ")[1].split("\r\n")[0])
+            responses.append((int(head.split(" ")[1]), json.loads(await reader.readexactly(length))))
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return responses
+
+    def request(self, *requests) -> list:
+        return asyncio.run(self.exchange(list(requests)))
+
+    @staticmethod
+    async def exchange_raw(data: bytes) -> tuple:
+        server = await CalendarServer().start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(data)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        head, _, body = response.partition(b"\r\n\r\n")
+        return int(head.split(b" ")[1]), json.loads(body), b"Connection: close" in head
+
+    def test_point_queries(self):
+        responses = self.request(("GET", "/is_workday?date=2023-12-27", None),
+                                 ("GET", "/is_workday?date=2023-12-23&include_saturday=true", None),
+                                 ("GET", "/is_holiday?date=2023-12-24", None),
+                                 ("GET", "/is_shopping_day?date=2023-12-25", None))
+        self.assertEqual(responses, [(200, {"date": "2023-12-27", "is_workday": True}),
+                                     (200, {"date": "2023-12-23", "is_workday": True}),
+                                     (200, {"date": "2023-12-24", "is_holiday": True}),
+                                     (200, {"date": "2023-12-25", "is_shopping_day": False})])
+
+    def test_count_and_offset(self):
+        responses = self.request(("GET", "/count_workdays?start_date=2023-01-01&end_date=2023-12-31", None),
+                                 ("GET", "/add_workdays?date=2023-12-23&workdays=10", None))
+        self.assertEqual(responses[0][1]["workdays"], 250)
+        self.assertEqual(responses[1][1]["result"], "2024-01-10")
+
+    def test_lists(self):
+        responses = self.request(("GET", "/holidays?year=2023", None), ("GET", "/workdays?year=2023", None))
+        self.assertEqual([holiday["date"] for holiday in responses[0][1]["holidays"]],
+                         [holiday["date"].isoformat() for holiday in get_holidays(2023)])
+        self.assertEqual(len(responses[1][1]["workdays"]), 250)
+
+    def test_batch(self):
+        dates = [(date(2023, 1, 1) + timedelta(days=offset)).isoformat() for offset in range(365)]
+        status, response = self.request(("POST", "/batch", {"dates": dates}))[0]
+        self.assertEqual(status, 200)
+        workdays = [result["date"] for result in response["results"] if result["is_workday"]]
+        self.assertEqual(workdays, [day.isoformat() for day in get_workdays(2023)])
+
+    def test_batch_item_errors(self):
+        status, response = self.request(("POST", "/batch", {"dates": ["2023-01-02", "1999-01-01", "2023-02-30"]}))[0]
+        self.assertEqual(status, 200)
+        self.assertEqual(response["results"][0], {"date": "2023-01-02", "is_workday": True, "is_holiday": False,
+                                                  "is_shopping_day": True})
+        self.assertEqual(response["results"][1], {"date": "1999-01-01", "error": "Data are valid since year 2001"})
+        self.assertEqual(response["results"][2], {"date": "2023-02-30", "error": "Invalid date: '2023-02-30'"})
+
+    def test_limits(self):
+        responses = self.request(("GET", "/add_workdays?date=2023-01-02&workdays=2000000", None),
+                                 ("GET", "/add_workdays?date=2023-01-02&workdays=-100001", None),
+                                 ("GET", "/count_workdays?start_date=2001-01-01&end_date=9999-12-31", None),
+                                 ("GET", "/workdays?year=100000", None),
+                                 ("GET", "/add_workdays?date=2023-01-02&workdays=100000", None))
+        self.assertEqual([status for status, _ in responses], [400, 400, 400, 400, 200])
+
+    def test_internal_error(self):
+        def failing(params):
+            raise KeyError("secret")
+
+        endpoints = czech_workdays_holidays.server._GET_ENDPOINTS
+        original = endpoints["/workdays"]
+        endpoints["/workdays"] = failing
+        try:
+            with self.assertLogs("czech_workdays_holidays.server", "ERROR"):
+                responses = self.request(("GET", "/workdays?year=2023", None))
+        finally:
+            endpoints["/workdays"] = original
+        self.assertEqual(responses, [(500, {"error": "Internal server error"})])
+
+    def test_errors(self):
+        responses = self.request(("GET", "/is_workday?date=2023-13-01", None),
+                                 ("GET", "/holidays?year=2000", None),
+                                 ("GET", "/unknown", None),
+                                 ("POST", "/batch", {"dates": "2023-01-01"}),
+                                 ("POST", "/batch", {"dates": ["2023-01-01"], "include_saturday": 1}),
+                                 ("POST", "/batch", {"dates": ["2023-01-01"], "include_sunday": [True]}))
+        self.assertEqual([status for status, _ in responses], [400, 400, 404, 400, 400, 400])
+        self.assertEqual(responses[4][1], {"error": "Invalid boolean: 1"})
+        for length in (b"abc", b"-5"):
+            request = b"POST /batch HTTP/1.1\r\nHost: localhost\r\nContent-Length: " + length + b"\r\n\r\n{}"
+            self.assertEqual(asyncio.run(self.exchange_raw(request)), (400, {"error": "Invalid Content-Length"}, True))
+        request = (b"POST /batch HTTP/1.1\r\nHost: localhost\r\nTransfer-Encoding: chunked\r\n\r\n"
+                   b"2\r\n{}\r\n0\r\n\r\n")
+        self.assertEqual(asyncio.run(self.exchange_raw(request)),
+                         (501, {"error": "Transfer-Encoding is not supported"}, True))
+
+
+class TestCommandLine(unittest.TestCase):
+    def export(self, *argv) -> str:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "export")
+            self.assertEqual(cli_main(["export", *argv, "-o", path]), 0)
+            with open(path, encoding="utf-8", newline="") as output:
+                return output.read()
+
+    def test_workdays_csv(self):
+        lines = self.export("workdays", "--start", "2022", "--end", "2023-06-30").splitlines()
+        expected = [day for year in (2022, 2023) for day in get_workdays(year) if day <= date(2023, 6, 30)]
+        self.assertEqual(lines, ["date"] + [day.isoformat() for day in expected])
+
+    def test_shopping_days_ndjson(self):
+        lines = self.export("shopping-days", "--start", "2023", "--end", "2023", "--no-sunday",
+                            "--format", "ndjson").splitlines()
+        self.assertEqual([json.loads(line)["date"] for line in lines],
+                         [day.isoformat() for day in get_shopping_days(2023, include_sunday=False)])
+
+    def test_holidays_csv(self):
+        lines = self.export("holidays", "--start", "2023", "--end", "2023").splitlines()
+        self.assertEqual(lines[0], "date,holiday_name_cz,holiday_name_en,public_other,shopping_restricted")
+        self.assertEqual(lines[2], "2023-01-01,Nový Rok,New Year's Day,Other,True")
+        self.assertEqual(len(lines), 1 + len(get_holidays(2023)))
+
+    def test_weekend_holidays_ics(self):
+        calendar = self.export("weekend-holidays", "--start", "2023", "--end", "2023", "--format", "ics",
+                               "--language", "cz")
+        self.assertTrue(calendar.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertTrue(calendar.endswith("END:VCALENDAR\r\n"))
+        self.assertEqual(calendar.count("BEGIN:VEVENT"), len(get_holidays_during_weekend(2023)))
+        self.assertIn("DTSTART;VALUE=DATE:20231224\r\nDTEND;VALUE=DATE:20231225\r\nSUMMARY:Štědrý den", calendar)
+
+    def test_stdout(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            cli_main(["export", "holidays", "--start", "2023-12-24", "--end", "2023-12-26", "--format", "ndjson"])
+        self.assertEqual(len(output.getvalue().splitlines()), 3)
+
+
+class TestAnnotator(unittest.TestCase):
+    CSV = ("id;created;amount\r\n"
+           "1;2023-12-24T10:15:00;100\r\n"
+           "2;2023-12-27;\"1;5\"\r\n"
+           "3;2024-01-01;7\r\n"
+           "4;1999-05-01;8\r\n"
+           "5;not a date;9\r\n")
+
+    def annotate(self, text, **options):
+        output = io.StringIO(newline="")
+        annotate_file(io.StringIO(text, newline=""), output, **options)
+        return output.getvalue()
+
+    def test_csv(self):
+        lines = self.annotate(self.CSV, date_column="created", delimiter=";", workers=1, chunk_size=2).splitlines()
+        self.assertEqual(lines, ["id;created;amount;is_workday;is_holiday;is_shopping_restricted;holiday_name",
+                                 "1;2023-12-24T10:15:00;100;False;True;False;Christmas Eve",
+                                 '2;2023-12-27;"1;5";True;False;False;',
+                                 "3;2024-01-01;7;False;True;True;Restoration Day of the Independent Czech State / "
+                                 "New Year's Day",
+                                 "4;1999-05-01;8;;;;",
+                                 "5;not a date;9;;;;"])
+
+    def test_ndjson(self):
+        text = "".join(json.dumps({"id": index, "date": (date(2023, 12, 20) + timedelta(days=index)).isoformat()}) +
+                       "\n" for index in range(10))
+        records = [json.loads(line) for line in self.annotate(text, file_format="ndjson", language="cz",
+                                                                workers=1).splitlines()]
+        self.assertEqual([record["id"] for record in records], list(range(10)))
+        self.assertEqual(records[5], {"id": 5, "date": "2023-12-25", "is_workday": False, "is_holiday": True,
+                                      "is_shopping_restricted": True, "holiday_name": "1. svátek vánoční"})
+        self.assertEqual(json.loads(self.annotate('{"id": 1}\n', file_format="ndjson", workers=1)),
+                         {"id": 1, "is_workday": None, "is_holiday": None, "is_shopping_restricted": None,
+                          "holiday_name": None})
+
+    def test_process_pool_keeps_order(self):
+        rows = ["n,date"] + [f"{index},{date(2016, 1, 1) + timedelta(days=index * 7 % 3000)}" for index in range(3000)]
+        text = "\r\n".join(rows) + "\r\n"
+        serial = self.annotate(text, workers=1, chunk_size=100)
+        self.assertEqual(self.annotate(text, workers=2, chunk_size=100), serial)
+        self.assertEqual([line.split(",")[0] for line in serial.splitlines()[1:]], [str(index) for index in range(3000)])
+
+    def test_invalid_rows(self):
+        text = "date\r\n2024-01-01garbage\r\n2024-01-01 08:00\r\n2024-01-01T08:00\r\n"
+        self.assertEqual(self.annotate(text, workers=1).splitlines()[1:],
+                         ["2024-01-01garbage,,,,"] +
+                         [f"2024-01-01{time},False,True,True,Restoration Day of the Independent Czech State / "
+                          "New Year's Day" for time in (" 08:00", "T08:00")])
+        text = '{"date": "2024-01-02"}\nnot json\n[1, 2]\n{"date": "2024-01-01x"}\n'
+        lines = self.annotate(text, file_format="ndjson", workers=1).splitlines()
+        self.assertEqual(json.loads(lines[0])["is_workday"], True)
+        self.assertEqual(lines[1:3], ["not json", "[1, 2]"])
+        self.assertEqual(json.loads(lines[3])["is_workday"], None)
+
+    def test_languages_in_one_process(self):
+        text = "date\r\n2023-12-24T08:00:00\r\n2023-12-24T09:30:00\r\n"
+        english = self.annotate(text, workers=1).splitlines()
+        czech = self.annotate(text, workers=1, language="cz").splitlines()
+        self.assertEqual(english[1:], ["2023-12-24T08:00:00,False,True,False,Christmas Eve",
+                                       "2023-12-24T09:30:00,False,True,False,Christmas Eve"])
+        self.assertEqual(czech[1:], ["2023-12-24T08:00:00,False,True,False,Štědrý den",
+                                     "2023-12-24T09:30:00,False,True,False,Štědrý den"])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.annotate(self.CSV, delimiter=";")
+        with self.assertRaises(ValueError):
+            self.annotate(self.CSV, date_column="created", delimiter=";", file_format="xlsx")
+        with self.assertRaises(ValueError):
+            self.annotate(self.CSV, date_column="created", delimiter=";", workers=0)
+        self.assertEqual(self.annotate(""), "")
+
+    def test_command_line(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "transactions.csv")
+            with open(path, "w", encoding="utf-8", newline="") as file:
+                file.write(self.CSV)
+            output = os.path.join(directory, "annotated.csv")
+            self.assertEqual(cli_main(["annotate", path, "--date-column", "created", "--delimiter", ";",
+                                       "--workers", "1", "-o", output]), 0)
+            with open(output, encoding="utf-8", newline="") as file:
+                self.assertEqual(file.read(), self.annotate(self.CSV, date_column="created", delimiter=";",
+                                                            workers=1))
+
+
+class TestDateRuns(unittest.TestCase):
+    def test_workday_runs(self):
+        runs = get_workday_runs(date(2001, 1, 1), date(2060, 12, 31))
+        expected = list(iter_workdays(date(2001, 1, 1), date(2060, 12, 31)))
+        self.assertEqual(len(runs), len(expected))
+        self.assertEqual(runs.to_dates(), expected)
+        self.assertLess(runs.run_count, len(expected) / 4)
+
+    def test_runs_across_year_boundary(self):
+        runs = get_workday_runs(date(2021, 12, 20), date(2022, 1, 10), include_saturday=True, include_sunday=True)
+        self.assertEqual(runs.runs(), [(date(2021, 12, 20), date(2021, 12, 23)),
+                                       (date(2021, 12, 27), date(2021, 12, 31)),
+                                       (date(2022, 1, 2), date(2022, 1, 10))])
+
+    def test_shopping_day_runs(self):
+        runs = get_shopping_day_runs(date(2023, 1, 1), date(2023, 12, 31), include_sunday=False)
+        self.assertEqual(list(runs), get_shopping_days(2023, include_sunday=False))
+
+    def test_membership(self):
+        runs = get_workday_runs(date(2023, 1, 1), date(2023, 12, 31))
+        workdays = set(get_workdays(2023))
+        day = date(2022, 12, 25)
+        while day < date(2024, 1, 5):
+            self.assertEqual(day in runs, day in workdays)
+            day += timedelta(days=1)
+        self.assertNotIn("2023-01-02", runs)
+
+    def test_hash(self):
+        runs = get_workday_runs(date(2023, 1, 1), date(2023, 12, 31))
+        same = DateRuns.from_dates(get_workdays(2023))
+        self.assertEqual(hash(runs), hash(same))
+        self.assertEqual(len({runs, same, DateRuns()}), 2)
+
+    def test_intersection_and_union(self):
+        workdays = get_workday_runs(date(2023, 1, 1), date(2024, 12, 31))
+        shopping_days = get_shopping_day_runs(date(2023, 6, 1), date(2025, 6, 1), include_sunday=False)
+        self.assertEqual((workdays & shopping_days).to_dates(), sorted(set(workdays) & set(shopping_days)))
+        self.assertEqual((workdays | shopping_days).to_dates(), sorted(set(workdays) | set(shopping_days)))
+        self.assertEqual(workdays & DateRuns(), DateRuns())
+
+    def test_from_dates(self):
+        days = [date(2023, 1, 3), date(2023, 1, 1), date(2023, 1, 2), date(2023, 1, 2), date(2023, 1, 9)]
+        runs = DateRuns.from_dates(days)
+        self.assertEqual(runs.runs(), [(date(2023, 1, 1), date(2023, 1, 3)), (date(2023, 1, 9), date(2023, 1, 9))])
+        self.assertEqual(len(runs), 4)
+        self.assertEqual(runs, DateRuns(runs.runs()))
+
+
+class TestCompanyCalendar(unittest.TestCase):
+    def setUp(self):
+        self.calendar = CompanyCalendar()
+        # Company holiday between Christmas and New Year, worked Saturday before it
+        self.calendar.add_closure(date(2023, 12, 27), date(2024, 1, 2))
+        self.calendar.add_working_day(date(2023, 12, 16))
+
+    def test_without_overlay(self):
+        calendar = CompanyCalendar()
+        self.assertEqual(calendar.get_workdays(2023), get_workdays(2023))
+        self.assertEqual(calendar.count_workdays(date(2020, 1, 1), date(2025, 12, 31)),
+                         count_workdays(date(2020, 1, 1), date(2025, 12, 31)))
+
+    def test_is_workday(self):
+        self.assertTrue(self.calendar.is_workday(date(2023, 12, 16)))
+        self.assertFalse(self.calendar.is_workday(date(2023, 12, 27)))
+        self.assertFalse(self.calendar.is_workday(date(2024, 1, 2)))
+        self.assertTrue(self.calendar.is_workday(date(2024, 1, 3)))
+
+    def test_get_workdays(self):
+        expected = sorted(set(get_workdays(2023)) - {date(2023, 12, 27), date(2023, 12, 28), date(2023, 12, 29)}
+                          | {date(2023, 12, 16)})
+        self.assertEqual(self.calendar.get_workdays(2023), expected)
+        self.assertEqual(list(self.calendar.iter_workdays(date(2023, 12, 1), date(2024, 1, 31))),
+                         [day for day in expected + get_workdays(2024)
+                          if date(2023, 12, 1) <= day <= date(2024, 1, 31) and day != date(2024, 1, 2)])
+
+    def test_count_and_add_workdays(self):
+        self.assertEqual(self.calendar.count_workdays(date(2023, 12, 1), date(2024, 1, 31)),
+                         count_workdays(date(2023, 12, 1), date(2024, 1, 31)) - 4 + 1)
+        self.assertEqual(self.calendar.add_workdays(date(2023, 12, 22), 1), date(2024, 1, 3))
+        self.assertEqual(self.calendar.add_workdays(date(2024, 1, 3), -1), date(2023, 12, 22))
+        self.assertEqual(self.calendar.add_workdays(date(2023, 12, 15), 1), date(2023, 12, 16))
+        self.assertEqual(self.calendar.add_workdays(date(2023, 12, 28), 0), date(2024, 1, 3))
+        self.assertEqual(self.calendar.next_workday(date(2023, 12, 26)), date(2024, 1, 3))
+        self.assertEqual(self.calendar.previous_workday(date(2023, 12, 18)), date(2023, 12, 16))
+
+    def test_last_edit_wins(self):
+        self.calendar.add_working_day(date(2023, 12, 28))
+        self.assertTrue(self.calendar.is_workday(date(2023, 12, 28)))
+        self.calendar.add_closure(date(2023, 12, 16))
+        self.assertFalse(self.calendar.is_workday(date(2023, 12, 16)))
+        self.assertEqual(self.calendar.working_days(), [date(2023, 12, 28)])
+        self.calendar.remove_overlay(date(2023, 12, 1), date(2023, 12, 31))
+        self.assertEqual(self.calendar.closures(), [date(2024, 1, 1), date(2024, 1, 2)])
+        self.assertEqual(self.calendar.get_workdays(2023), get_workdays(2023))
+
+    def test_incremental_invalidation(self):
+        self.calendar.count_workdays(date(2020, 1, 1), date(2025, 12, 31))
+        self.assertEqual(self.calendar.cached_years(), [2020, 2021, 2022, 2023, 2024, 2025])
+        self.calendar.add_closure(date(2022, 5, 2))
+        self.assertEqual(self.calendar.cached_years(), [2020, 2021, 2023, 2024, 2025])
+        self.assertFalse(self.calendar.is_workday(date(2022, 5, 2)))
+
+    def test_options_and_types(self):
+        calendar = CompanyCalendar(include_saturday=True)
+        self.assertTrue(calendar.is_workday(date(2023, 12, 23)))
+        with self.assertRaises(TypeError):
+            CompanyCalendar(include_holidays=1)
+        with self.assertRaises(TypeError):
+            self.calendar.add_closure("2023-12-27")
+        with self.assertRaises(TypeError):
+            self.calendar.add_workdays(date(2023, 12, 27), 1.0)
+
+
+class TestShoppingHours(unittest.TestCase):
+    def test_christmas_eve_afternoon(self):
+        self.assertTrue(is_shop_open(datetime(2023, 12, 24, 11, 59, 59)))
+        self.assertFalse(is_shop_open(datetime(2023, 12, 24, 12, 0)))
+        self.assertFalse(is_shop_open(datetime(2023, 12, 26, 23, 59)))
+        self.assertTrue(is_shop_open(datetime(2023, 12, 27, 0, 0)))
+
+    def test_whole_days_match_shopping_days(self):
+        for year in (2017, 2023, 2024):
+            shopping_days = set(get_shopping_days(year))
+            for day in get_workdays(year, include_saturday=True, include_sunday=True, include_holidays=True):
+                self.assertEqual(is_shop_open(datetime.combine(day, datetime.min.time())), day in shopping_days)
+
+    def test_partial_year_2016(self):
+        self.assertTrue(is_shop_open(datetime(2016, 5, 8, 10, 0)))
+        self.assertTrue(is_shop_open(datetime(2016, 9, 28, 10, 0)))
+        self.assertFalse(is_shop_open(datetime(2016, 10, 28, 10, 0)))
+        self.assertTrue(is_shop_open(datetime(2010, 12, 25, 10, 0)))
+        self.assertTrue(is_shop_open(datetime(1995, 1, 1, 10, 0)))
+
+    def test_next_shop_opening(self):
+        self.assertEqual(next_shop_opening(datetime(2023, 12, 24, 13, 30)), datetime(2023, 12, 27))
+        self.assertEqual(next_shop_opening(datetime(2023, 12, 24, 9, 30)), datetime(2023, 12, 24, 9, 30))
+        self.assertEqual(next_shop_opening(datetime(2024, 1, 1, 8, 0)), datetime(2024, 1, 2))
+        moment = datetime(2023, 5, 8, 8, 0, tzinfo=timezone.utc)
+        self.assertEqual(next_shop_opening(moment), datetime(2023, 5, 9, tzinfo=timezone.utc))
+
+    def test_get_shop_closures(self):
+        closures = get_shop_closures(2023)
+        self.assertEqual(len(closures), 6)
+        self.assertEqual(closures[0], (datetime(2023, 1, 1), datetime(2023, 1, 2)))
+        self.assertEqual(closures[-1], (datetime(2023, 12, 24, 12, 0), datetime(2023, 12, 27)))
+        self.assertEqual(get_shop_closures(2016), [(datetime(2016, 10, 28), datetime(2016, 10, 29)),
+                                                   (datetime(2016, 12, 24, 12, 0), datetime(2016, 12, 27))])
+        self.assertEqual(get_shop_closures(2015), [])
+
+    def test_types(self):
+        with self.assertRaises(TypeError):
+            is_shop_open(date(2023, 12, 24))
+        with self.assertRaises(TypeError):
+            next_shop_opening("2023-12-24T13:00")
+        with self.assertRaises(TypeError):
+            get_shop_closures("2023")
+
+
+class TestWorkingHours(unittest.TestCase):
+    def setUp(self):
+        self.hours = WorkingHours(((time(8), time(12)), (time(12, 30), time(16, 30))))
+
+    def brute_force(self, start, end):
+        minutes = 0
+        moment = start
+        while moment < end:
+            if is_workday(moment.date()) and (time(8) <= moment.time() < time(12) or
+                                              time(12, 30) <= moment.time() < time(16, 30)):
+                minutes += 1
+            moment += timedelta(minutes=1)
+        return timedelta(minutes=minutes)
+
+    def test_working_time(self):
+        self.assertEqual(self.hours.day_length, timedelta(hours=8))
+        self.assertEqual(self.hours.working_time(datetime(2023, 12, 22, 15, 0), datetime(2023, 12, 27, 9, 30)),
+                         timedelta(hours=3))
+        self.assertEqual(self.hours.working_time(datetime(2023, 12, 22, 12, 10), datetime(2023, 12, 22, 12, 20)),
+                         timedelta(0))
+        self.assertEqual(self.hours.working_time(datetime(2023, 1, 1), datetime(2024, 1, 1)),
+                         timedelta(hours=8 * len(get_workdays(2023))))
+        self.assertEqual(self.hours.working_time(datetime(2023, 5, 2), datetime(2023, 5, 1)), timedelta(0))
+
+    def test_working_time_brute_force(self):
+        for _ in range(25):
+            start = datetime(2023, 12, 1) + timedelta(minutes=randint(0, 60 * 24 * 40))
+            end = start + timedelta(minutes=randint(0, 60 * 24 * 12))
+            self.assertEqual(self.hours.working_time(start, end), self.brute_force(start, end))
+
+    def test_deadline(self):
+        self.assertEqual(self.hours.deadline(datetime(2023, 12, 22, 15, 0), timedelta(hours=3)),
+                         datetime(2023, 12, 27, 9, 30))
+        self.assertEqual(self.hours.deadline(datetime(2023, 12, 22, 8, 0), timedelta(hours=4)),
+                         datetime(2023, 12, 22, 12, 0))
+        self.assertEqual(self.hours.deadline(datetime(2023, 12, 23, 10, 0), timedelta(hours=8)),
+                         datetime(2023, 12, 27, 16, 30))
+        self.assertEqual(self.hours.deadline(datetime(2023, 12, 23, 10, 0), timedelta(0)),
+                         datetime(2023, 12, 23, 10, 0))
+        for _ in range(100):
+            start = datetime(2023, 1, 1) + timedelta(minutes=randint(0, 60 * 24 * 365))
+            duration = timedelta(minutes=randint(1, 60 * 8 * 300))
+            deadline = self.hours.deadline(start, duration)
+            self.assertEqual(self.hours.working_time(start, deadline), duration)
+            self.assertLess(self.hours.working_time(start, deadline - timedelta(minutes=1)), duration)
+
+    def test_company_calendar(self):
+        calendar = CompanyCalendar()
+        calendar.add_closure(date(2023, 12, 27), date(2023, 12, 29))
+        hours = WorkingHours(calendar=calendar)
+        self.assertEqual(hours.deadline(datetime(2023, 12, 22, 16, 0), timedelta(hours=2)),
+                         datetime(2024, 1, 2, 10, 0))
+
+    def test_invalid_windows(self):
+        with self.assertRaises(ValueError):
+            WorkingHours(((time(12), time(8)),))
+        with self.assertRaises(ValueError):
+            WorkingHours(((time(8), time(12)), (time(11), time(16))))
+        with self.assertRaises(ValueError):
+            WorkingHours(())
+        with self.assertRaises(TypeError):
+            WorkingHours(((8, 16),))
+        with self.assertRaises(TypeError):
+            WorkingHours(calendar="national")
+        with self.assertRaises(ValueError):
+            self.hours.deadline(datetime(2023, 12, 22), timedelta(hours=-1))
+        with self.assertRaises(TypeError):
+            self.hours.deadline(datetime(2023, 12, 22), 3)
+
+
+class TestWorkingTimeFund(unittest.TestCase):
+    def test_months(self):
+        fund = get_working_time_fund(2023, 2023)
+        self.assertEqual(len(fund), 12)
+        self.assertEqual(fund[0], WorkingTimeFund(2023, 1, date(2023, 1, 1), date(2023, 1, 31), 22, 176, 0, 1))
+        self.assertEqual(fund[11], WorkingTimeFund(2023, 12, date(2023, 12, 1), date(2023, 12, 31), 19, 152, 2, 1))
+
+    def test_matches_lists(self):
+        holidays = {holiday["date"] for year in range(2016, 2031) for holiday in get_holidays(year)}
+        for period in ("month", "week", "quarter"):
+            for row in get_working_time_fund(2017, 2030, period, hours_per_day=7.5, include_saturday=True):
+                days = [row.start_date + timedelta(days=offset)
+                        for offset in range((row.end_date - row.start_date).days + 1)]
+                workdays = count_workdays(row.start_date, row.end_date, include_saturday=True)
+                self.assertEqual(row.workdays, workdays)
+                self.assertEqual(row.hours, workdays * 7.5)
+                self.assertEqual(row.holidays_on_weekdays, sum(day in holidays and day.weekday() < 5 for day in days))
+                self.assertEqual(row.holidays_on_weekends, sum(day in holidays and day.weekday() >= 5 for day in days))
+
+    def test_iso_weeks(self):
+        weeks = get_working_time_fund(2020, 2020, "week")
+        self.assertEqual(len(weeks), 53)
+        self.assertEqual((weeks[0].start_date, weeks[-1].end_date), (date(2019, 12, 30), date(2021, 1, 3)))
+        self.assertEqual([row.period for row in weeks], list(range(1, 54)))
+        self.assertEqual(len(get_working_time_fund(2001, 2100, "week")),
+                         sum(date(year, 12, 28).isocalendar()[1] for year in range(2001, 2101)))
+
+    def test_totals(self):
+        quarters = get_working_time_fund(2001, 2100, "quarter")
+        self.assertEqual(sum(row.workdays for row in quarters),
+                         count_workdays(date(2001, 1, 1), date(2100, 12, 31)))
+        self.assertEqual(get_working_time_fund(2024, 2023), [])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            get_working_time_fund(2023, 2023, "day")
+        with self.assertRaises(TypeError):
+            get_working_time_fund("2023", 2023)
+        with self.assertRaises(TypeError):
+            get_working_time_fund(2023, 2023, hours_per_day="8")
+        with self.assertRaises(Exception):
+            get_working_time_fund(2000, 2023)
+
+
+class TestEaster(unittest.TestCase):
+    def test_computed_easter(self):
+        for year in range(1583, 4100):
+            self.assertEqual(_compute_easter(year), easter(year))
+
+    def test_easter_table(self):
+        self.assertEqual(len(_EASTER_TABLE), 200)
+        for year in range(_EASTER_TABLE_START - 5, _EASTER_TABLE_START + len(_EASTER_TABLE) + 5):
+            self.assertEqual(_easter(year), easter(year))
+
+
+class TestImport(unittest.TestCase):
+    def test_lazy_attributes(self):
+        from czech_workdays_holidays import runs, company
+        self.assertIs(czech_workdays_holidays.DateRuns, runs.DateRuns)
+        self.assertIs(czech_workdays_holidays.CompanyCalendar, company.CompanyCalendar)
+        self.assertIn("get_working_time_fund", dir(czech_workdays_holidays))
+        with self.assertRaises(AttributeError):
+            czech_workdays_holidays.get_nothing
+
+    def test_import_time_budget(self):
+        code = ("import sys, time\n"
+                "start = time.perf_counter()\n"
+                "import czech_workdays_holidays\n"
+                "print(time.perf_counter() - start)\n"
+                "print(' '.join(sorted(sys.modules)))\n")
+        timings = []
+        for _ in range(3):
+            output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                                    cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout
+            seconds, modules = output.splitlines()
+            timings.append(float(seconds))
+        modules = set(modules.split())
+        for module in ("dateutil", "six", "numpy", "pandas", "asyncio", "json",
+                       "czech_workdays_holidays.runs", "czech_workdays_holidays.company"):
+            self.assertNotIn(module, modules)
+        # Generous budget, the import takes a few milliseconds with cached bytecode
+        self.assertLess(min(timings), 0.1)
+
+
+class TestCalendarTable(unittest.TestCase):
+    def test_table_is_up_to_date(self):
+        with open(_TABLE_PATH, "rb") as file:
+            self.assertEqual(file.read(), _build_table(2001, 2200))
+
+    def test_table_flags(self):
+        self.assertEqual((_TABLE.first_year, _TABLE.years), (2001, 200))
+        for year in range(2001, 2201):
+            self.assertEqual(_TABLE.year_flags(year), _table_flags(year))
+        self.assertIsNone(_TABLE.year_flags(2000))
+        self.assertIsNone(_TABLE.year_flags(2201))
+
+    def test_fallback(self):
+        self.assertIsNone(_CalendarTable(os.path.join(tempfile.gettempdir(), "missing.bin")).year_flags(2023))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.bin")
+            with open(path, "wb") as file:
+                file.write(b"NOTATABLE" * 10)
+            self.assertIsNone(_CalendarTable(path).year_flags(2023))
+
+    def test_year_calendar_matches_rules(self):
+        original = czech_workdays_holidays._TABLE
+        for year in (2001, 2016, 2024, 2200, 2201):
+            from_table = _YearCalendar(year)
+            try:
+                czech_workdays_holidays._TABLE = _CalendarTable(None)
+                computed = _YearCalendar(year)
+            finally:
+                czech_workdays_holidays._TABLE = original
+            self.assertEqual((from_table.holidays, from_table.shopping_restricted, from_table.saturdays),
+                             (computed.holidays, computed.shopping_restricted, computed.saturdays))
+            self.assertEqual(from_table.holiday_records, computed.holiday_records)
+
+    def test_generator_script(self):
+        script = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts",
+                              "generate_calendar_table.py")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "table.bin")
+            subprocess.run([sys.executable, script, "--start-year", "2020", "--end-year", "2030", "-o", path],
+                           check=True, capture_output=True)
+            table = _CalendarTable(path)
+            self.assertEqual((table.year_flags(2024), table.year_flags(2031)), (_table_flags(2024), None))
+
+
+class TestLeaveWindows(unittest.TestCase):
+    def brute_force(self, year, leave_days):
+        # Leave is taken only in the year, days off around it extend the break
+        first = date(year - 1, 1, 1)
+        days = [first + timedelta(days=offset) for offset in range((date(year + 2, 1, 1) - first).days)]
+        workdays = set(get_workdays(year))
+        other_workdays = set(get_workdays(year - 1) + get_workdays(year + 1))
+        best = 0
+        for start in range(len(days)):
+            leave = 0
+            for end in range(start, len(days)):
+                if days[end] in other_workdays:
+                    break
+                leave += days[end] in workdays
+                if leave > leave_days:
+                    break
+                best = max(best, end - start + 1)
+        return best
+
+    def test_best_window(self):
+        windows = find_leave_windows(2024, 2024, 3, top=3)
+        self.assertEqual(windows[0], LeaveWindow(date(2024, 12, 20), date(2024, 12, 29), 10,
+                                                 (date(2024, 12, 20), date(2024, 12, 23), date(2024, 12, 27))))
+        self.assertEqual(len(windows), 3)
+        for window in windows:
+            self.assertTrue(all(day in set(get_workdays(2024)) for day in window.leave_dates))
+            self.assertEqual(count_workdays(window.start_date, window.end_date), len(window.leave_dates))
+
+    def test_brute_force(self):
+        for year, leave_days in ((2023, 1), (2024, 4), (2025, 2)):
+            self.assertEqual(find_leave_windows(year, year, leave_days, top=1)[0].days_off,
+                             self.brute_force(year, leave_days))
+
+    def test_without_leave(self):
+        windows = find_leave_windows(2023, 2023, 0, top=2)
+        self.assertEqual([(window.start_date, window.days_off, window.leave_dates) for window in windows],
+                         [(date(2023, 4, 7), 4, ()), (date(2023, 12, 23), 4, ())])
+
+    def test_overlapping(self):
+        distinct = find_leave_windows(2020, 2030, 5, top=10)
+        for index, window in enumerate(distinct):
+            for other in distinct[index + 1:]:
+                self.assertTrue(window.end_date < other.start_date or other.end_date < window.start_date)
+        self.assertEqual([window.days_off for window in distinct],
+                         sorted((window.days_off for window in distinct), reverse=True))
+        overlapping = find_leave_windows(2020, 2030, 5, top=10, overlapping=True)
+        self.assertEqual(overlapping[0], distinct[0])
+        self.assertGreaterEqual(overlapping[1].days_off, distinct[1].days_off)
+
+    def test_across_years_and_whole_range(self):
+        window = find_leave_windows(2023, 2024, 3, top=1)[0]
+        self.assertEqual((window.start_date, window.end_date, window.leave_dates),
+                         (date(2023, 12, 23), date(2024, 1, 1), (date(2023, 12, 27), date(2023, 12, 28),
+                                                                 date(2023, 12, 29))))
+        window = find_leave_windows(2023, 2023, 3, top=1)[0]
+        self.assertEqual((window.start_date, window.end_date, window.days_off),
+                         (date(2023, 12, 23), date(2024, 1, 1), 10))
+        window = find_leave_windows(2024, 2024, 1000)[0]
+        self.assertEqual((window.start_date, window.end_date, len(window.leave_dates)),
+                         (date(2023, 12, 30), date(2025, 1, 1), len(get_workdays(2024))))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            find_leave_windows(2024, 2024, -1)
+        with self.assertRaises(ValueError):
+            find_leave_windows(2024, 2024, 3, top=0)
+        with self.assertRaises(TypeError):
+            find_leave_windows(2024, 2024, 3.0)
+        with self.assertRaises(TypeError):
+            find_leave_windows(2024, 2024, True)
+        with self.assertRaises(TypeError):
+            find_leave_windows(2024, 2024, 3, top=True)
+        with self.assertRaises(Exception):
+            find_leave_windows(2000, 2024, 3)
+        self.assertEqual(find_leave_windows(2024, 2023, 3), [])
+
+
+class TestDateView(unittest.TestCase):
+    def setUp(self):
+        self.view = get_workday_view(2023, 2025)
+        self.workdays = [day for year in (2023, 2024, 2025) for day in get_workdays(year)]
+
+    def test_sequence(self):
+        self.assertIsInstance(self.view, DateView)
+        self.assertEqual(len(self.view), len(self.workdays))
+        self.assertEqual(list(self.view), self.workdays)
+        self.assertEqual(self.view.to_list(), self.workdays)
+        for index in range(-len(self.workdays), len(self.workdays), 17):
+            self.assertEqual(self.view[index], self.workdays[index])
+        self.assertEqual(list(reversed(self.view))[:3], self.workdays[::-1][:3])
+        with self.assertRaises(IndexError):
+            self.view[len(self.workdays)]
+
+    def test_membership_and_bisect(self):
+        day = date(2022, 12, 25)
+        while day < date(2026, 1, 5):
+            self.assertEqual(day in self.view, day in self.workdays)
+            self.assertEqual(self.view.bisect_left(day), bisect_left(self.workdays, day))
+            day += timedelta(days=1)
+        self.assertEqual(self.view.index(date(2024, 1, 2)), self.workdays.index(date(2024, 1, 2)))
+        self.assertEqual(self.view.count(date(2024, 1, 1)), 0)
+        with self.assertRaises(ValueError):
+            self.view.index(date(2024, 1, 1))
+        last = self.workdays[-1]
+        self.assertEqual(self.view.index(last, -5), len(self.workdays) - 1)
+        self.assertEqual(self.view.index(self.workdays[3], 1, -1), 3)
+        for start, stop in ((-5, None), (0, -len(self.workdays)), (4, None)):
+            with self.assertRaises(ValueError):
+                self.view.index(self.view[0], start, stop)
+            with self.assertRaises(ValueError):
+                self.workdays.index(self.workdays[0], start, *([stop] if stop is not None else []))
+
+    def test_slicing(self):
+        months = self.view[date(2024, 3, 1):date(2024, 6, 30)]
+        self.assertIsInstance(months, DateView)
+        self.assertEqual(list(months), [day for day in self.workdays if date(2024, 3, 1) <= day <= date(2024, 6, 30)])
+        self.assertEqual(list(self.view[date(2025, 12, 1):]), [day for day in self.workdays if day >= date(2025, 12, 1)])
+        self.assertEqual(list(self.view[10:500]), self.workdays[10:500])
+        self.assertEqual(list(self.view[-5:]), self.workdays[-5:])
+        self.assertEqual(self.view[10:500:7], self.workdays[10:500:7])
+        self.assertEqual(len(self.view[500:10]), 0)
+        self.assertEqual(months[0], date(2024, 3, 1))
+        with self.assertRaises(TypeError):
+            self.view[date(2023, 3, 1):5]
+        with self.assertRaises(TypeError):
+            self.view[5:date(2023, 3, 1)]
+
+    def test_on_or_after(self):
+        self.assertEqual(self.view.on_or_after(date(2023, 12, 23)), date(2023, 12, 27))
+        self.assertEqual(self.view.on_or_after(date(2023, 12, 23), 3), date(2024, 1, 2))
+        self.assertEqual(self.view.on_or_after(date(2023, 12, 27)), date(2023, 12, 27))
+        with self.assertRaises(IndexError):
+            self.view.on_or_after(date(2025, 12, 31), 1)
+
+    def test_holiday_and_shopping_views(self):
+        holidays = get_holiday_view(date(2023, 12, 1), date(2024, 1, 31))
+        self.assertEqual(list(holidays), [date(2023, 12, 24), date(2023, 12, 25), date(2023, 12, 26), date(2024, 1, 1)])
+        self.assertEqual(list(get_holiday_view(2023)), get_holidays(2023, dates_only=True))
+        self.assertEqual(list(get_shopping_day_view(2023, include_sunday=False)),
+                         get_shopping_days(2023, include_sunday=False))
+        self.assertEqual(len(get_workday_view(date(2024, 1, 5), date(2024, 1, 1))), 0)
+        with self.assertRaises(Exception):
+            get_holiday_view(2000)
+        with self.assertRaises(TypeError):
+            get_workday_view(2023, date(2023, 12, 31))
+
+
+class TestInstrumentation(unittest.TestCase):
+    def test_counts_and_export(self):
+        cache_clear()
+        with Instrumentation() as instrumentation:
+            czech_workdays_holidays.get_workdays(2024)
+            czech_workdays_holidays.is_workday(date(2024, 1, 2))
+            czech_workdays_holidays.is_workday(date(2024, 1, 3))
+            czech_workdays_holidays.add_workdays(date(2024, 1, 2), 5)
+        metrics = instrumentation.as_dict()
+        self.assertEqual(metrics["get_workdays"]["calls"], 1)
+        self.assertEqual(metrics["is_workday"]["calls"], 2)
+        self.assertEqual(metrics["stage.year_build"]["calls"], 1)
+        self.assertEqual(metrics["stage.workday_shift"]["calls"], 1)
+        self.assertEqual(sum(metrics["is_workday"]["latency_histogram_us"].values()), 2)
+        self.assertGreater(metrics["get_workdays"]["total_seconds"], 0)
+        self.assertGreaterEqual(metrics["is_workday"]["max_seconds"], metrics["is_workday"]["mean_seconds"])
+        self.assertEqual(json.loads(json.dumps(metrics))["is_workday"]["calls"], 2)
+        instrumentation.reset()
+        self.assertEqual(instrumentation.as_dict(), {})
+
+    def test_callback_and_nesting(self):
+        calls = []
+        outer = Instrumentation(lambda name, seconds, blocks: calls.append(name)).start()
+        with Instrumentation() as inner:
+            czech_workdays_holidays.is_holiday(date(2024, 12, 24))
+        czech_workdays_holidays.is_holiday(date(2024, 12, 25))
+        outer.stop()
+        czech_workdays_holidays.is_holiday(date(2024, 12, 26))
+        self.assertEqual(calls.count("is_holiday"), 2)
+        self.assertEqual(inner.as_dict()["is_holiday"]["calls"], 1)
+        self.assertEqual(outer.as_dict()["is_holiday"]["calls"], 2)
+
+    def test_originals_restored(self):
+        find_leave_windows(2024, 2024, 1)
+        with Instrumentation() as instrumentation:
+            self.assertIsNot(czech_workdays_holidays.is_workday, is_workday)
+            czech_workdays_holidays.find_leave_windows(2024, 2024, 1)
+        self.assertEqual(instrumentation.as_dict()["find_leave_windows"]["calls"], 1)
+        self.assertIs(czech_workdays_holidays.is_workday, is_workday)
+        self.assertIs(czech_workdays_holidays.find_leave_windows, find_leave_windows)
+        self.assertIs(czech_workdays_holidays.views._year_calendar, czech_workdays_holidays._year_calendar)
+        self.assertEqual(_YearCalendar.__init__.__qualname__, "_YearCalendar.__init__")
+        self.assertNotIn("__wrapped__", vars(_YearCalendar.__init__))
+
+    def test_module_imported_while_running(self):
+        name = "czech_workdays_holidays.company"
+        loaded = sys.modules.pop(name)
+        try:
+            with Instrumentation() as instrumentation:
+                company = __import__(name, fromlist=("CompanyCalendar",))
+                self.assertIn("__wrapped__", vars(company._shift_workdays))
+                company.CompanyCalendar().add_workdays(date(2024, 1, 2), 3)
+            self.assertEqual(instrumentation.as_dict()["stage.workday_shift"]["calls"], 1)
+            self.assertIs(company._shift_workdays, czech_workdays_holidays._shift_workdays)
+            self.assertNotIn("__wrapped__", vars(company._shift_workdays))
+        finally:
+            sys.modules[name] = loaded
+            czech_workdays_holidays.company = loaded
+
+
+class TestMonthlyWorkdays(unittest.TestCase):
+    def test_against_get_workdays(self):
+        for year in (2016, 2024, 2100):
+            for include_saturday, include_holidays in ((False, False), (True, False), (False, True)):
+                workdays = get_workdays(year, include_saturday=include_saturday, include_holidays=include_holidays)
+                for month in range(1, 13):
+                    days = [day for day in workdays if day.month == month]
+                    for n in (1, 3, len(days), -1, -2):
+                        self.assertEqual(nth_workday(year, month, n, include_saturday=include_saturday,
+                                                     include_holidays=include_holidays), days[n - 1 if n > 0 else n])
+                    self.assertEqual(last_workday_of_month(year, month, include_saturday=include_saturday,
+                                                           include_holidays=include_holidays), days[-1])
+                    for position, day in enumerate(days, start=1):
+                        self.assertEqual(workday_of_month(day, include_saturday=include_saturday,
+                                                          include_holidays=include_holidays), position)
+
+    def test_examples(self):
+        self.assertEqual(nth_workday(2024, 1, 3), date(2024, 1, 4))
+        self.assertEqual(last_workday_of_month(2024, 3), date(2024, 3, 28))
+        self.assertEqual(nth_workday(2024, 2, 30), None)
+        self.assertEqual(nth_workday(2024, 2, -30), None)
+        self.assertEqual(workday_of_month(date(2024, 1, 1)), None)
+        self.assertEqual(workday_of_month(date(2024, 1, 6)), None)
+        self.assertEqual(workday_of_month(date(2024, 1, 6), include_saturday=True), 5)
+
+    def test_bulk(self):
+        firsts = get_nth_workdays(2023, 2025)
+        self.assertEqual(len(firsts), 36)
+        self.assertEqual(firsts, [nth_workday(year, month, 1) for year in (2023, 2024, 2025) for month in range(1, 13)])
+        lasts = get_nth_workdays(2024, 2024, -1)
+        self.assertEqual(lasts[2], date(2024, 3, 28))
+        self.assertEqual(get_nth_workdays(2024, 2024, 23)[1], None)
+        self.assertEqual(get_nth_workdays(2025, 2024), [])
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            nth_workday(2024, 13, 1)
+        with self.assertRaises(ValueError):
+            nth_workday(2024, 1, 0)
+        with self.assertRaises(TypeError):
+            nth_workday(2024, 1, "1")
+        with self.assertRaises(TypeError):
+            nth_workday(2024, 1, True)
+        with self.assertRaises(TypeError):
+            nth_workday(2024, True, 1)
+        with self.assertRaises(TypeError):
+            get_nth_workdays(2024, 2024, False)
+        with self.assertRaises(TypeError):
+            workday_of_month("2024-01-02")
+        with self.assertRaises(TypeError):
+            get_nth_workdays(2024, 2024, include_sunday=1)
+        with self.assertRaises(Exception):
+            nth_workday(2000, 1, 1)
+
+
 class TestAssertRaises(unittest.TestCase):
 
     # Get holidays
@@ -145,6 +1440,7 @@ class TestAssertRaises(unittest.TestCase):
         holidays = get_holidays(2023, dates_only=True)
         for holiday in holidays:
             self.assertIsInstance(holiday, date)
+        self.assertEqual(holidays, sorted(set(holidays)))
 
     def test_dates_and_cz_names_output(self):
         holidays = get_holidays(2023, dates_and_cz_names=True)